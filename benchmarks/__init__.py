@@ -0,0 +1 @@
+"""크롤러 성능 벤치마크 모음 (python -m benchmarks.<name>)."""
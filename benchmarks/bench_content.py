@@ -0,0 +1,160 @@
+"""상세 컨텐츠 정리 경로 벤치마크.
+
+저장소의 실제 픽스처(html1.txt, html2.txt, example1/2.txt, debug/product_sample.html,
+debug/content_outputs/*)와 이를 N배로 늘린 합성 입력으로 content_crawl의 soup 파이프라인,
+strip_blob_media, cleanup_dom_structure, build_image_gallery, insert_and_remove_images를 측정한다.
+
+    python -m benchmarks.bench_content
+    python -m benchmarks.bench_content --scales 1,4,16 --json bench/content.json
+    python -m benchmarks.bench_content --compare bench/content.json --max-regression 1.25
+"""
+import argparse
+import fnmatch
+import re
+import sys
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from benchmarks.harness import compare_with_baseline, format_table, measure, write_json
+from crawler.content import (
+    build_image_gallery,
+    clean_content_html,
+    cleanup_dom_structure,
+    insert_and_remove_images,
+    strip_blob_media,
+)
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def _read(path):
+    return Path(path).read_text(encoding="utf-8", errors="replace")
+
+
+def _unquote_csv_cell(text):
+    # example*.txt는 엑셀에서 복사한 셀이라 "..." 로 감싸지고 내부 따옴표가 "" 로 이스케이프됨
+    text = text.strip()
+    if text.startswith('"') and text.endswith('"'):
+        text = text[1:-1]
+    return text.replace('""', '"')
+
+
+def _body_html(text):
+    match = re.search(r"<body[^>]*>(.*)</body>", text, re.S | re.I)
+    return match.group(1) if match else text
+
+
+def load_fixtures():
+    fixtures = {}
+    for name in ("html1.txt", "html2.txt"):
+        path = REPO_DIR / name
+        if path.exists():
+            fixtures[name] = _read(path)
+    for name in ("example1.txt", "example2.txt"):
+        path = REPO_DIR / name
+        if path.exists():
+            fixtures[name] = _unquote_csv_cell(_read(path))
+    sample = REPO_DIR / "debug" / "product_sample.html"
+    if sample.exists():
+        fixtures["product_sample.html"] = _body_html(_read(sample))
+    for path in sorted((REPO_DIR / "debug" / "content_outputs").glob("*.html"))[:2]:
+        fixtures[f"content_outputs/{path.name}"] = _read(path)
+    return fixtures
+
+
+def enlarge(html_text, scale):
+    """Synthetic enlargement: repeat the fragment `scale` times inside one container."""
+    if scale <= 1:
+        return html_text
+    return "<div>" + "".join(html_text for _ in range(scale)) + "</div>"
+
+
+def _parsed(raw):
+    return lambda: BeautifulSoup(raw, "html.parser")
+
+
+def build_cases(fixtures, scales):
+    cases = []
+    for fixture_name, raw in fixtures.items():
+        for scale in scales:
+            html_text = enlarge(raw, scale)
+            label = f"{fixture_name}x{scale}"
+            params = {"fixture": fixture_name, "scale": scale, "bytes": len(html_text)}
+            cases.append((f"parse[{label}]", lambda h=html_text: BeautifulSoup(h, "html.parser"), None, params))
+            cases.append((
+                f"content_pipeline[{label}]",
+                lambda h=html_text: clean_content_html(h, "BENCH"),
+                None,
+                params,
+            ))
+            cases.append((
+                f"strip_blob_media[{label}]",
+                lambda soup: strip_blob_media(soup, "BENCH"),
+                _parsed(html_text),
+                params,
+            ))
+            cases.append((
+                f"cleanup_dom_structure[{label}]",
+                lambda soup: cleanup_dom_structure(soup, "BENCH"),
+                _parsed(html_text),
+                params,
+            ))
+            cases.append((
+                f"insert_and_remove_images[{label}]",
+                insert_and_remove_images,
+                _parsed(html_text),
+                params,
+            ))
+            cases.append((
+                f"build_image_gallery[{label}]",
+                lambda h=html_text: build_image_gallery(h, "BENCH"),
+                None,
+                params,
+            ))
+    return cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Content cleanup benchmarks")
+    parser.add_argument("--scales", default="1,4", help="comma separated enlargement factors")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.0, help="minimum seconds per case")
+    parser.add_argument("--filter", default="*", help="fnmatch pattern on case names")
+    parser.add_argument("--json", dest="json_path", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=1.25,
+                        help="fail when best time grows by more than this factor")
+    args = parser.parse_args(argv)
+
+    scales = [int(value) for value in args.scales.split(",") if value.strip()]
+    fixtures = load_fixtures()
+    if not fixtures:
+        print("벤치마크 픽스처를 찾지 못했습니다.")
+        return 1
+
+    results = []
+    for name, func, setup, params in build_cases(fixtures, scales):
+        if not fnmatch.fnmatch(name, args.filter):
+            continue
+        results.append(measure(name, func, setup=setup, rounds=args.rounds, min_time=args.min_time, params=params))
+        print(f"done: {name}", file=sys.stderr)
+
+    print(format_table(results))
+    if args.json_path:
+        write_json(results, args.json_path)
+        print(f"결과 저장: {args.json_path}")
+    if args.compare:
+        regressions = compare_with_baseline(results, args.compare, max_regression=args.max_regression)
+        if regressions:
+            print("성능 회귀 감지:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
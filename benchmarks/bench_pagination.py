@@ -0,0 +1,237 @@
+"""페이지네이션 이동 전략 벤치마크(클릭/네비게이션/시간/실패율).
+
+ListingPaginator.go_to_page_number를 전략 조합(plan, auto, next_only, PAGE_JUMP_BY_QUERY on/off)별로
+목표 페이지마다 새 탭에서 실행하고, 클릭 수·goto 수·시도 횟수·소요 시간·성공 여부를 기록한다.
+기본 대상은 로컬 MockSmartStore이며 --listing-url/--har로 녹화된 실제 리스트도 재생할 수 있다.
+
+    python -m benchmarks.bench_pagination
+    python -m benchmarks.bench_pagination --targets 1-500:50 --strategies plan,auto
+    python -m benchmarks.bench_pagination --listing-url "https://.../category/ALL?size=20" \\
+        --har replay/listing/joypapa__ALL.har.zip --json bench/pagination.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+from crawler.mock_smartstore import MockConfig, MockSmartStore
+from crawler.pagination import ListingPaginator
+from crawler.timing import percentile
+from crawler.urls import update_query_params
+
+
+DEFAULT_TARGETS = "1,2,5,10,11,20,21,50,100,250,500"
+DEFAULT_STRATEGIES = "plan,auto,next_only,auto+jump,next_only+jump"
+
+
+def parse_targets(raw):
+    """'1,5,10-30:10' -> [1, 5, 10, 20, 30] (range with optional :step)."""
+    targets = []
+    for token in re.split(r"[\s,;]+", raw.strip()):
+        if not token:
+            continue
+        match = re.fullmatch(r"(\d+)-(\d+)(?::(\d+))?", token)
+        if match:
+            start, end, step = int(match.group(1)), int(match.group(2)), int(match.group(3) or 1)
+            targets.extend(range(start, end + 1, max(1, step)))
+        else:
+            targets.append(int(token))
+    return sorted(set(target for target in targets if target > 0))
+
+
+def parse_strategy(name):
+    """'next_only+jump' -> ('next_only', True)."""
+    base, _, flag = name.strip().partition("+")
+    return base, flag == "jump"
+
+
+def detect_page(page):
+    """Independent check of the page actually shown (aria-current / data-shp-filter_con pgn)."""
+    try:
+        return page.evaluate(
+            """() => {
+                const current = document.querySelector("a[role='menuitem'][aria-current='true']");
+                if (current && /^\\d+$/.test(current.innerText.trim())) {
+                    return parseInt(current.innerText.trim(), 10);
+                }
+                const container = document.querySelector("div[role='menubar'][data-shp-filter_con]");
+                if (!container) { return null; }
+                try {
+                    const items = JSON.parse(container.getAttribute('data-shp-filter_con'));
+                    const pgn = items.find((item) => item.key === 'pgn');
+                    return pgn ? parseInt(pgn.value, 10) : null;
+                } catch (e) {
+                    return null;
+                }
+            }"""
+        )
+    except Exception:
+        return None
+
+
+def run_target(context, listing_url, strategy, jump, target, har=None, quiet=True):
+    page = context.new_page()
+    if har:
+        page.route_from_har(str(har), not_found="abort")
+    original_url = update_query_params(listing_url, page=None)
+    page.goto(original_url)
+    page.wait_for_load_state("networkidle")
+
+    paginator = ListingPaginator(page, original_url, strategy=strategy, page_jump_by_query=jump)
+    sink = io.StringIO()
+    redirect = contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()
+    error = None
+    start = time.perf_counter()
+    try:
+        with redirect:
+            reported = paginator.go_to_page_number(target)
+    except Exception as exc:
+        reported = False
+        error = str(exc)
+    elapsed = time.perf_counter() - start
+    landed = detect_page(page)
+    page.close()
+
+    # go_to_page_number는 '리스트 변경'만으로도 성공 처리하므로 실제 도착 페이지로 판정
+    ok = bool(reported) and landed == target
+    row = {
+        "strategy": strategy + ("+jump" if jump else ""),
+        "target": target,
+        "ok": ok,
+        "reported_ok": bool(reported),
+        "landed": landed,
+        "wall_s": elapsed,
+        "error": error,
+    }
+    row.update(paginator.counters())
+    return row
+
+
+def summarize(rows):
+    by_strategy = {}
+    for row in rows:
+        by_strategy.setdefault(row["strategy"], []).append(row)
+    summary = []
+    for strategy, items in by_strategy.items():
+        walls = [item["wall_s"] for item in items]
+        failures = [item for item in items if not item["ok"]]
+        summary.append({
+            "strategy": strategy,
+            "targets": len(items),
+            "failure_rate": len(failures) / len(items),
+            "failed_targets": [item["target"] for item in failures],
+            "clicks_mean": statistics.fmean(item["clicks"] for item in items),
+            "navigations_mean": statistics.fmean(item["navigations"] for item in items),
+            "wall_mean_s": statistics.fmean(walls),
+            "wall_p95_s": percentile(walls, 95),
+        })
+    return summary
+
+
+def format_rows(rows):
+    lines = [
+        f"{'strategy':<18}{'target':>7}{'ok':>5}{'landed':>8}{'clicks':>8}{'navs':>6}{'tries':>7}"
+        f"{'probes':>8}{'wall(s)':>9}"
+    ]
+    for row in rows:
+        landed = row["landed"] if row["landed"] is not None else "-"
+        lines.append(
+            f"{row['strategy']:<18}{row['target']:>7}{'Y' if row['ok'] else 'N':>5}{landed:>8}"
+            f"{row['clicks']:>8}{row['navigations']:>6}{row['attempts']:>7}{row['probes']:>8}"
+            f"{row['wall_s']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def format_summary(summary):
+    lines = [
+        f"{'strategy':<18}{'targets':>8}{'fail%':>7}{'clicks':>8}{'navs':>7}{'mean(s)':>9}{'p95(s)':>8}"
+    ]
+    for item in summary:
+        lines.append(
+            f"{item['strategy']:<18}{item['targets']:>8}{item['failure_rate'] * 100:>7.1f}"
+            f"{item['clicks_mean']:>8.1f}{item['navigations_mean']:>7.2f}"
+            f"{item['wall_mean_s']:>9.2f}{item['wall_p95_s']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pagination strategy benchmark")
+    parser.add_argument("--targets", default=DEFAULT_TARGETS, help="e.g. 1,5,10 or 1-500:25")
+    parser.add_argument("--strategies", default=DEFAULT_STRATEGIES,
+                        help="comma separated; append +jump to enable PAGE_JUMP_BY_QUERY")
+    parser.add_argument("--listing-url", help="listing to paginate instead of the local mock server")
+    parser.add_argument("--har", help="serve --listing-url from this HAR (record with CRAWL_REPLAY_MODE=record)")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="mock server latency")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="mock server 503 rate")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="show go_to_page_number output")
+    parser.add_argument("--json", dest="json_path", help="write rows and summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    targets = parse_targets(args.targets)
+    strategies = [parse_strategy(name) for name in args.strategies.split(",") if name.strip()]
+    if not targets or not strategies:
+        print("대상 페이지 또는 전략이 비어 있습니다.")
+        return 1
+
+    server = None
+    listing_url = args.listing_url
+    if not listing_url:
+        config = MockConfig(latency_ms=args.latency_ms, fail_rate=args.fail_rate)
+        server = MockSmartStore(product_count=max(targets) * args.page_size, config=config).start()
+        listing_url = server.listing_url(size=args.page_size)
+        print(f"Mock SmartStore: {server.origin} (pages={max(targets)})")
+
+    rows = []
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=not args.headed)
+            context = browser.new_context()
+            try:
+                for strategy, jump in strategies:
+                    for target in targets:
+                        row = run_target(context, listing_url, strategy, jump, target,
+                                         har=args.har, quiet=not args.verbose)
+                        rows.append(row)
+                        print(
+                            f"done: {row['strategy']} -> {target} ok={row['ok']} "
+                            f"clicks={row['clicks']} wall={row['wall_s']:.2f}s",
+                            file=sys.stderr,
+                        )
+            finally:
+                context.close()
+                browser.close()
+    finally:
+        if server is not None:
+            server.stop()
+
+    summary = summarize(rows)
+    print(format_rows(rows))
+    print()
+    print(format_summary(summary))
+    if args.json_path:
+        path = Path(args.json_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "listing_url": listing_url if args.listing_url else "mock",
+            "rows": rows,
+            "summary": summary,
+        }
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
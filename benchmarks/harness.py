@@ -0,0 +1,112 @@
+"""벤치마크 공용 측정/리포트 도구 (asv 스타일: 케이스별 ops/sec, 최대 메모리, 기준선 비교)."""
+import contextlib
+import io
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+
+class BenchResult(object):
+    def __init__(self, name, samples, peak_bytes, params=None):
+        self.name = name
+        self.samples = samples
+        self.peak_bytes = peak_bytes
+        self.params = params or {}
+
+    @property
+    def mean(self):
+        return statistics.fmean(self.samples)
+
+    @property
+    def best(self):
+        return min(self.samples)
+
+    @property
+    def ops_per_sec(self):
+        return 1.0 / self.best if self.best > 0 else float("inf")
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "params": self.params,
+            "mean_s": self.mean,
+            "best_s": self.best,
+            "stdev_s": statistics.pstdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "ops_per_sec": self.ops_per_sec,
+            "peak_kb": self.peak_bytes / 1024.0,
+            "rounds": len(self.samples),
+        }
+
+
+def measure(name, func, setup=None, rounds=5, min_time=0.0, quiet=True, params=None):
+    """Time func(setup()) for `rounds` rounds; setup runs outside the timed region.
+
+    Peak memory is measured in one extra tracemalloc-instrumented round so the
+    tracing overhead does not skew the timings.
+    """
+    sink = io.StringIO()
+    redirect = contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()
+    samples = []
+    with redirect:
+        deadline = time.perf_counter() + min_time
+        while len(samples) < rounds or time.perf_counter() < deadline:
+            arg = setup() if setup else None
+            start = time.perf_counter()
+            func(arg) if setup else func()
+            samples.append(time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+
+        arg = setup() if setup else None
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            func(arg) if setup else func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return BenchResult(name, samples, peak, params)
+
+
+def format_table(results):
+    lines = [f"{'case':<58}{'ops/sec':>10}{'best(ms)':>11}{'mean(ms)':>11}{'peak(KB)':>11}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<58}{result.ops_per_sec:>10.2f}{result.best * 1000:>11.2f}"
+            f"{result.mean * 1000:>11.2f}{result.peak_bytes / 1024.0:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def write_json(results, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": [result.as_dict() for result in results],
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def compare_with_baseline(results, baseline_path, max_regression=1.25, memory_regression=1.5):
+    """Return a list of human readable regressions versus a JSON written by write_json()."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    previous = {item["name"]: item for item in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result.name)
+        if not before:
+            continue
+        ratio = result.best / before["best_s"] if before["best_s"] else 1.0
+        if ratio > max_regression:
+            regressions.append(
+                f"{result.name}: {before['best_s'] * 1000:.2f}ms -> {result.best * 1000:.2f}ms (x{ratio:.2f})"
+            )
+        before_peak = before.get("peak_kb") or 0
+        if before_peak and (result.peak_bytes / 1024.0) / before_peak > memory_regression:
+            regressions.append(
+                f"{result.name}: peak {before_peak:.1f}KB -> {result.peak_bytes / 1024.0:.1f}KB"
+            )
+    return regressions
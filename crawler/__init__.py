@@ -0,0 +1 @@
+"""스마트스토어 크롤러 공용 모듈 모음."""
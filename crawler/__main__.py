@@ -0,0 +1,6 @@
+import sys
+
+from crawler.cli import main
+
+
+sys.exit(main())
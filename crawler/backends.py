@@ -0,0 +1,173 @@
+"""브라우저 백엔드: 로컬 실행(LocalBackend) 또는 실행 중인 Chrome에 CDP로 연결(CdpBackend).
+
+엔진은 open(playwright) → (browser, context), close(browser, context), 상세 워커용
+worker(setup) 컨텍스트 매니저만 쓰므로, 어느 백엔드든 같은 크롤링 코드가 그대로 돈다.
+worker()가 내주는 세션은 run(handle, item)으로 handle(context, item)을 실행한다.
+"""
+import contextlib
+import threading
+import time
+
+
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-features=NetworkService",
+    "--disable-web-security",
+    "--disable-dev-shm-usage",
+    "--disable-accelerated-2d-canvas",
+    "--disable-gpu",
+]
+# WSL/컨테이너에서 sandbox_host 오류 없이 뜨게 하는 옵션('--single-process'는 같은 오류를 유발해 제외)
+NO_SANDBOX_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--proxy-bypass-list=<-loopback>",
+    "--no-zygote",
+]
+
+
+class ContextSession(object):
+    """Worker session over a single BrowserContext (same interface as CdpWorkerSession)."""
+
+    def __init__(self, context):
+        self.context = context
+
+    def run(self, handle, item):
+        return handle(self.context, item)
+
+
+class LocalBackend(object):
+    """Launch a browser on this machine; chromium can keep a persistent profile (HTTP cache)."""
+
+    name = "local"
+
+    def __init__(self, browser_name="chromium", headless=False, profile=None, sandbox=True):
+        self.browser_name = browser_name
+        self.headless = headless
+        self.profile = profile
+        self.sandbox = sandbox
+
+    def open(self, playwright, profile=None):
+        """Returns (browser, context). With a persistent profile browser is None (closing the context ends it)."""
+        profile = profile or self.profile
+        if self.browser_name == "chromium":
+            args = CHROMIUM_ARGS + ([] if self.sandbox else NO_SANDBOX_ARGS)
+            options = {} if self.sandbox else {"chromium_sandbox": False}
+            if profile:
+                profile.prepare()
+                context = playwright.chromium.launch_persistent_context(
+                    str(profile.user_data_dir),
+                    headless=self.headless,
+                    args=args + profile.chromium_args(),
+                    **options,
+                )
+                print(f"영구 프로필 사용: {profile.user_data_dir} (캐시 {profile.cache_size() / 1048576:.1f}MB)")
+                return None, context
+            browser = playwright.chromium.launch(headless=self.headless, args=args, **options)
+        elif self.browser_name == "firefox":
+            browser = playwright.firefox.launch(headless=self.headless)
+        else:
+            browser = playwright.webkit.launch(headless=self.headless)
+        return browser, browser.new_context()
+
+    def close(self, browser, context):
+        try:
+            context.close()
+        finally:
+            if browser is not None:
+                browser.close()
+
+    def worker_count(self, requested):
+        return requested
+
+    @contextlib.contextmanager
+    def worker(self, setup=None):
+        """Per-thread playwright + browser (sync API objects are thread-bound)."""
+        from playwright.sync_api import sync_playwright
+
+        # 같은 user-data-dir는 브라우저 프로세스 하나만 쓸 수 있어 워커마다 하위 프로필을 쓴다
+        profile = self.profile.for_worker(threading.current_thread().name) if self.profile else None
+        with sync_playwright() as playwright:
+            browser, context = self.open(playwright, profile)
+            try:
+                if setup is not None:
+                    setup(context)
+                yield ContextSession(context)
+            finally:
+                self.close(browser, context)
+
+    def summary(self):
+        return None
+
+
+class CdpBackend(object):
+    """Attach to running Chrome/Chromium instances over CDP (one or more endpoints, see CdpPool).
+
+    default_context=True reuses the browser's existing context (its cookies/login) for the main
+    crawl; workers always get their own context because several may share one browser.
+    """
+
+    name = "cdp"
+
+    def __init__(self, pool, default_context=False, registry=None):
+        self.pool = pool
+        self.default_context = default_context
+        self.registry = registry
+        self._borrowed = set()
+
+    def open(self, playwright, profile=None):
+        endpoint, browser = self.pool.connect(playwright)
+        print(f"CDP 연결: {endpoint.url} ({browser.version})")
+        if self.registry is not None:
+            self.registry.remember(endpoint.url, browser.version)
+        if self.default_context and browser.contexts:
+            self._borrowed.add(id(browser.contexts[0]))
+            return browser, browser.contexts[0]
+        return browser, browser.new_context()
+
+    def close(self, browser, context):
+        """Close our context and disconnect (the remote browser and its own context keep running)."""
+        try:
+            if id(context) in self._borrowed:
+                self._borrowed.discard(id(context))
+            else:
+                context.close()
+        finally:
+            self.pool.disconnect(browser)
+
+    def worker_count(self, requested):
+        return max(requested, len(self.pool))
+
+    def worker(self, setup=None):
+        return self.pool.worker(setup)
+
+    def summary(self):
+        return self.pool.summary()
+
+
+def find_cdp_endpoint(registry, candidates, launch=None, ws_fallback=None, wait_seconds=10.0):
+    """Pick the CDP URL to attach to, or None.
+
+    1) the first live candidate (probed concurrently), 2) after launch() starts Chrome, poll the
+    candidates for up to wait_seconds, 3) ws_fallback() (e.g. the ws URL read through Windows curl).
+    """
+    live = registry.find_live(candidates)
+    if live:
+        return live["url"]
+    if launch is not None:
+        launch()
+        deadline = time.time() + wait_seconds
+        while True:
+            live = registry.find_live(candidates)
+            if live:
+                return live["url"]
+            if time.time() >= deadline:
+                break
+            time.sleep(1)
+    if ws_fallback is not None:
+        ws_url = ws_fallback()
+        if ws_url:
+            print(f"Windows curl로 조회한 ws 엔드포인트를 사용합니다: {ws_url}")
+            return ws_url
+    return None
+
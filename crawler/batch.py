@@ -0,0 +1,105 @@
+"""여러 스토어/카테고리를 한 번의 실행(같은 브라우저)으로 처리하는 배치 매니페스트와 스케줄러.
+
+매니페스트(JSON):
+    {"shops": [
+        {"url": "https://smartstore.naver.com/joypapa_/category/ALL?st=RECENT&dt=BIG_IMAGE&size=20",
+         "start_page": 1, "last_page": 20},
+        {"url": "https://smartstore.naver.com/other/category/50000001?st=RECENT&size=20", "pages": [1, 5]}
+    ]}
+또는 CSV(헤더: url,start_page,last_page,pages — pages는 "1;5;9" 형식).
+"""
+import csv
+import json
+import re
+from pathlib import Path
+
+from crawler.logs import get_logger
+
+
+log = get_logger("batch")
+
+
+class ShopJob(object):
+    def __init__(self, url, start_page=None, last_page=None, pages=None, name=None):
+        self.url = url
+        self.start_page = start_page
+        self.last_page = last_page
+        self.pages = pages
+        self.name = name or self.default_name(url)
+
+    @staticmethod
+    def default_name(url):
+        parts = url.split('/')
+        try:
+            return f"{parts[3]}_{parts[5].split('?')[0]}"
+        except IndexError:
+            return url
+
+    def __repr__(self):
+        if self.pages:
+            return f"ShopJob({self.name}, pages={self.pages})"
+        return f"ShopJob({self.name}, {self.start_page}-{self.last_page})"
+
+
+def _int_or_none(value):
+    if value in (None, ""):
+        return None
+    return int(value)
+
+
+def _pages(value):
+    if value in (None, ""):
+        return None
+    if isinstance(value, (list, tuple)):
+        return [int(page) for page in value]
+    return [int(page) for page in re.split(r"[\s,;]+", str(value)) if page]
+
+
+def _job_from_dict(entry):
+    url = (entry.get("url") or "").strip()
+    if not url:
+        raise ValueError(f"매니페스트 항목에 url이 없습니다: {entry}")
+    return ShopJob(
+        url,
+        start_page=_int_or_none(entry.get("start_page")),
+        last_page=_int_or_none(entry.get("last_page")),
+        pages=_pages(entry.get("pages")),
+        name=entry.get("name") or None,
+    )
+
+
+def load_manifest(path):
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            entries = list(csv.DictReader(handle))
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries = data.get("shops", []) if isinstance(data, dict) else data
+    jobs = [_job_from_dict(entry) for entry in entries]
+    print(f"배치 매니페스트 {path.name}: 작업 {len(jobs)}개")
+    return jobs
+
+
+def round_robin(named_generators):
+    """Advance each generator one step in turn until all are exhausted.
+
+    Each step of a shop crawl is one listing page including its detail pages, so shops
+    share the browser fairly instead of the first shop monopolising it. A generator that
+    raises is logged and dropped; the others continue.
+    """
+    active = list(named_generators)
+    steps = {name: 0 for name, _ in active}
+    while active:
+        for entry in list(active):
+            name, generator = entry
+            try:
+                next(generator)
+                steps[name] += 1
+            except StopIteration:
+                active.remove(entry)
+                print(f"배치 작업 완료: {name} ({steps[name]} 페이지)")
+            except Exception:
+                log.exception("배치 작업 실패: %s", name)
+                active.remove(entry)
+    return steps
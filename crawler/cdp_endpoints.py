@@ -0,0 +1,113 @@
+"""마지막으로 동작한 CDP 엔드포인트를 기억하고 후보 호스트를 병렬로 빠르게 점검한다.
+
+WSL 실행마다 호스트 탐지 → Chrome 배치 실행(최대 30초) → /json/version 순차 확인(후보당 5초)을
+반복하면 시작에만 수십 초가 걸린다. 캐시된 URL과 후보 URL들을 짧은 타임아웃으로 동시에
+확인해 이미 떠 있는 Chrome이 응답하면 배치 실행 없이 바로 그 엔드포인트에 붙는다.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from crawler.http_client import get_client
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _parse_version(url, response):
+    if isinstance(response, Exception) or response.status_code != 200:
+        return None
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not data.get("webSocketDebuggerUrl"):
+        return None
+    return {"url": url, "browser": data.get("Browser"), "ws_url": data["webSocketDebuggerUrl"]}
+
+
+def probe_endpoints(urls, timeout=1.0, client=None):
+    """GET <origin>/json/version for every url at once; returns [info dict or None] in input order."""
+    client = client or get_client()
+    # 일부 환경에서 Host 헤더가 localhost일 때만 응답하므로 verify_cdp_endpoint와 같게 설정
+    responses = client.gather(
+        [url + "/json/version" for url in urls],
+        timeout=timeout,
+        retries=0,
+        headers={"Host": "localhost"},
+    )
+    return [_parse_version(url, response) for url, response in zip(urls, responses)]
+
+
+class EndpointRegistry(object):
+    """Cached last-good CDP endpoint + parallel /json/version health checks."""
+
+    def __init__(self, path=None, timeout=1.0, max_age_hours=24 * 7, client=None):
+        self.path = Path(path) if path else None
+        self.timeout = timeout
+        self.max_age_hours = max_age_hours
+        self.client = client
+        self._lock = threading.Lock()
+        self.cached = self._load()
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"CDP 엔드포인트 캐시를 읽지 못했습니다: {exc}")
+            return None
+        if not isinstance(data, dict) or not data.get("url"):
+            return None
+        if self.max_age_hours and time.time() - data.get("checked", 0) > self.max_age_hours * 3600:
+            return None
+        return data
+
+    def cached_url(self):
+        return self.cached["url"] if self.cached else None
+
+    def find_live(self, candidates):
+        """Probe every candidate origin concurrently; return the first live one in candidate order (or None)."""
+        urls = []
+        for candidate in candidates:
+            origin = _origin(candidate) if candidate else None
+            if origin and origin not in urls:
+                urls.append(origin)
+        if not urls:
+            return None
+        started = time.perf_counter()
+        results = probe_endpoints(urls, self.timeout, self.client)
+        elapsed = time.perf_counter() - started
+        for url, endpoint in zip(urls, results):
+            if endpoint:
+                print(f"CDP 엔드포인트 점검 {len(urls)}곳 / {elapsed:.2f}s → {url} ({endpoint['browser']})")
+                self.remember(url, endpoint["browser"])
+                return endpoint
+        print(f"CDP 엔드포인트 점검 {len(urls)}곳 / {elapsed:.2f}s → 응답 없음")
+        return None
+
+    def remember(self, url, browser=None):
+        """Record a working endpoint (ws:// fallbacks are not cached; they embed a per-launch id)."""
+        origin = _origin(url)
+        if origin is None:
+            return
+        with self._lock:
+            self.cached = {"url": origin, "browser": browser, "checked": time.time()}
+            payload = json.dumps(self.cached, ensure_ascii=False, indent=2)
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"CDP 엔드포인트 캐시 저장 실패: {exc}")
@@ -0,0 +1,256 @@
+"""여러 CDP 브라우저(원격 디버깅 포트가 다른 Chrome/Chromium 인스턴스)에 상세 워커를 나눠 붙인다.
+
+브라우저 하나에 워커를 몰면 렌더러 프로세스 하나가 처리량 상한이 된다. 엔드포인트 목록을 받아
+워커마다 현재 붙은 워커가 가장 적은 정상 엔드포인트에 연결하고, 연결 실패 또는 연속 실패가
+max_failures번 쌓인 엔드포인트는 cooldown 동안 배정에서 빼며, 그 엔드포인트의 워커는 다음 항목부터
+다른 엔드포인트로 옮겨 붙는다. cooldown이 지나면 다시 배정 후보가 된다.
+
+실패로 세는 것은 연결 실패와 작업 중 연결이 끊긴 경우뿐이다(상품 페이지 오류/타임아웃은
+엔드포인트 상태와 무관). 모든 엔드포인트가 cooldown 중이면 가장 먼저 풀리는 시점까지 기다린다.
+"""
+import contextlib
+import re
+import threading
+import time
+
+from crawler.cdp_endpoints import probe_endpoints
+
+
+class NoHealthyEndpoint(Exception):
+    """Raised when every endpoint in the pool is cooling down (or was excluded)."""
+
+
+# 브라우저/타깃 연결이 끊겼을 때 Playwright 오류 메시지에 들어가는 문구
+CLOSED_MARKERS = ("Target closed", "has been closed", "Connection closed", "disconnected")
+
+
+def parse_endpoints(spec, default_host="127.0.0.1"):
+    """'9222,9223' / 'host:9222 http://host:9223' / 'ws://…' → list of CDP URLs (order kept, no duplicates)."""
+    urls = []
+    for token in re.split(r"[,\s]+", spec or ""):
+        if not token:
+            continue
+        if token.isdigit():
+            token = f"{default_host}:{token}"
+        if "://" not in token:
+            token = f"http://{token}"
+        token = token.rstrip("/")
+        if token not in urls:
+            urls.append(token)
+    return urls
+
+
+class CdpEndpoint(object):
+    def __init__(self, url):
+        self.url = url
+        self.active = 0
+        self.attached = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.last_error = None
+        self.version = None
+
+    def available(self, now=None):
+        return (now or time.time()) >= self.down_until
+
+
+class CdpPool(object):
+    def __init__(self, urls, max_failures=3, cooldown=60.0, connect_timeout=10000, max_wait=300.0):
+        if not urls:
+            raise ValueError("CDP 엔드포인트 목록이 비어 있습니다.")
+        self.endpoints = [CdpEndpoint(url) for url in urls]
+        self.max_failures = max(1, max_failures)
+        self.cooldown = cooldown
+        self.connect_timeout = connect_timeout
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._leases = {}
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def check(self, timeout=1.0):
+        """Probe the http(s) endpoints concurrently; unreachable ones start in cooldown. Returns live count."""
+        probed = [endpoint for endpoint in self.endpoints if endpoint.url.startswith(("http://", "https://"))]
+        results = probe_endpoints([endpoint.url for endpoint in probed], timeout) if probed else []
+        for endpoint, info in zip(probed, results):
+            if info is None:
+                self.record(endpoint, ok=False, error="/json/version 응답 없음", fatal=True)
+            else:
+                endpoint.version = info["browser"]
+        return sum(1 for endpoint in self.endpoints if endpoint.available())
+
+    def acquire(self, exclude=()):
+        """Lease the healthy endpoint with the fewest active workers (ties: fewest attachments so far)."""
+        now = time.time()
+        with self._lock:
+            candidates = [
+                endpoint for endpoint in self.endpoints
+                if endpoint.url not in exclude and endpoint.available(now)
+            ]
+            if not candidates:
+                raise NoHealthyEndpoint(
+                    "사용 가능한 CDP 엔드포인트가 없습니다: "
+                    + ", ".join(f"{endpoint.url}({endpoint.last_error})" for endpoint in self.endpoints)
+                )
+            endpoint = min(candidates, key=lambda item: (item.active, item.attached))
+            endpoint.active += 1
+            endpoint.attached += 1
+            return endpoint
+
+    def next_available_in(self, now=None):
+        """Seconds until the earliest cooling-down endpoint is back in rotation (0 if one is available)."""
+        now = now or time.time()
+        with self._lock:
+            return max(0.0, min(endpoint.down_until for endpoint in self.endpoints) - now)
+
+    def release(self, endpoint):
+        with self._lock:
+            endpoint.active = max(0, endpoint.active - 1)
+
+    def record(self, endpoint, ok, error=None, fatal=False):
+        with self._lock:
+            if ok:
+                endpoint.succeeded += 1
+                endpoint.consecutive_failures = 0
+                return
+            endpoint.failed += 1
+            endpoint.consecutive_failures += 1
+            endpoint.last_error = str(error) if error is not None else None
+            if not fatal and endpoint.consecutive_failures < self.max_failures:
+                return
+            endpoint.consecutive_failures = 0
+            endpoint.down_until = time.time() + self.cooldown
+        print(f"CDP 엔드포인트 {endpoint.url}를 {self.cooldown:.0f}초 동안 배정에서 제외합니다: {error}")
+
+    def connect(self, playwright):
+        """Attach to a leased endpoint; returns (endpoint, browser). Release with disconnect(browser).
+
+        When every endpoint is cooling down, waits for the earliest one (up to max_wait seconds in
+        total) instead of failing the caller's current item.
+        """
+        tried = set()
+        waited = 0.0
+        while True:
+            try:
+                endpoint = self.acquire(exclude=tried)
+            except NoHealthyEndpoint:
+                delay = max(1.0, self.next_available_in())
+                if waited + delay > self.max_wait:
+                    raise
+                print(f"사용 가능한 CDP 엔드포인트가 없어 {delay:.0f}초 기다린 뒤 다시 연결합니다.")
+                time.sleep(delay)
+                waited += delay
+                tried.clear()
+                continue
+            try:
+                browser = playwright.chromium.connect_over_cdp(endpoint.url, timeout=self.connect_timeout)
+            except Exception as exc:
+                self.release(endpoint)
+                self.record(endpoint, ok=False, error=exc, fatal=True)
+                tried.add(endpoint.url)
+                continue
+            endpoint.version = browser.version
+            with self._lock:
+                self._leases[id(browser)] = endpoint
+            return endpoint, browser
+
+    def disconnect(self, browser):
+        """Disconnect from (not shut down) the remote browser and release its lease."""
+        with self._lock:
+            endpoint = self._leases.pop(id(browser), None)
+        try:
+            browser.close()
+        finally:
+            if endpoint is not None:
+                self.release(endpoint)
+
+    @contextlib.contextmanager
+    def worker(self, setup=None):
+        """Per-thread session for run_detail_workers (sync Playwright objects are thread-bound)."""
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            session = CdpWorkerSession(self, playwright, setup)
+            session.attach()
+            try:
+                yield session
+            finally:
+                session.detach()
+
+    def summary(self):
+        lines = ["CDP 풀 (엔드포인트: 성공/실패, 연결 횟수, 상태)"]
+        now = time.time()
+        for endpoint in self.endpoints:
+            state = "정상" if endpoint.available(now) else f"제외 {endpoint.down_until - now:.0f}s 남음"
+            lines.append(
+                f"  {endpoint.url} [{endpoint.version or '-'}]: {endpoint.succeeded}/{endpoint.failed}, "
+                f"연결 {endpoint.attached}회, {state}"
+            )
+        return "\n".join(lines)
+
+
+class CdpWorkerSession(object):
+    """One worker's attachment; moves to another endpoint once its current one is taken out of rotation."""
+
+    def __init__(self, pool, playwright, setup=None):
+        self.pool = pool
+        self.playwright = playwright
+        self.setup = setup
+        self.endpoint = None
+        self.browser = None
+        self.context = None
+
+    def attach(self):
+        self.endpoint, self.browser = self.pool.connect(self.playwright)
+        # 같은 브라우저에 여러 워커가 붙을 수 있으므로 워커마다 별도 컨텍스트를 쓴다
+        self.context = self.browser.new_context()
+        if self.setup is not None:
+            self.setup(self.context)
+
+    def detach(self):
+        if self.browser is None:
+            return
+        try:
+            self.context.close()
+        except Exception:
+            pass
+        try:
+            self.pool.disconnect(self.browser)
+        except Exception:
+            pass
+        self.browser = None
+        self.context = None
+
+    def connection_lost(self, exc):
+        try:
+            if not self.browser.is_connected():
+                return True
+        except Exception:
+            return True
+        return any(marker in str(exc) for marker in CLOSED_MARKERS)
+
+    def run(self, handle, item):
+        """handle(context, item); only lost connections count against the endpoint.
+
+        If the connection drops mid-item, the item is retried once on a fresh attachment
+        (usually another endpoint). Errors raised by handle itself propagate unrecorded.
+        """
+        for attempt in range(2):
+            if self.browser is None or not self.endpoint.available():
+                self.detach()
+                self.attach()
+            try:
+                result = handle(self.context, item)
+            except Exception as exc:
+                if not self.connection_lost(exc):
+                    raise
+                self.pool.record(self.endpoint, ok=False, error=exc, fatal=True)
+                self.detach()
+                if attempt:
+                    raise
+                continue
+            self.pool.record(self.endpoint, ok=True)
+            return result
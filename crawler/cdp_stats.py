@@ -0,0 +1,228 @@
+"""원격 CDP 연결(WSL→Windows Chrome 등)의 왕복 지연 측정과 실행별 왕복/바이트 카운터.
+
+connect_over_cdp로 붙은 브라우저에서는 query_selector, inner_text, get_attribute 같은 호출이
+모두 CDP 왕복 한 번이다. 연결 직후 RTT를 재서 높으면 배치 추출(evaluate 한 번에 여러 필드)과
+탭 선행 로딩으로 바꾸고, CountingProxy로 감싼 컨텍스트에서 나온 객체의 메서드 호출 수와
+대략적인 주고받은 바이트를 세어 실행 끝에 효과를 보여 준다.
+"""
+import json
+import statistics
+import threading
+import time
+from collections import Counter, OrderedDict
+
+
+LATENCY_MODES = ("auto", "batched", "direct")
+
+# 드라이버 안에서만 처리되어 CDP 왕복이 없는 메서드(Locator 생성, 이벤트 등록 등)
+LOCAL_METHODS = frozenset({
+    "locator", "get_by_role", "get_by_text", "get_by_label", "get_by_placeholder", "get_by_test_id",
+    "get_by_alt_text", "get_by_title", "frame_locator", "nth", "filter", "and_", "or_",
+    "on", "once", "remove_listener", "is_closed", "set_default_timeout", "set_default_navigation_timeout",
+})
+
+
+def _payload_size(value):
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=lambda item: "").encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _is_playwright_object(value):
+    return type(value).__module__.startswith("playwright.")
+
+
+def unwrap(value):
+    """Return the real Playwright object behind a CountingProxy (stealth/isinstance checks need it)."""
+    if isinstance(value, CountingProxy):
+        return object.__getattribute__(value, "_target")
+    if isinstance(value, (list, tuple)):
+        return type(value)(unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _wrap(value, counter):
+    if isinstance(value, CountingProxy):
+        return value
+    if _is_playwright_object(value):
+        return CountingProxy(value, counter)
+    if isinstance(value, list) and value and _is_playwright_object(value[0]):
+        return [_wrap(item, counter) for item in value]
+    return value
+
+
+class CdpCounter(object):
+    """Per-run round-trip / byte counters (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.seconds = 0.0
+        self.methods = Counter()
+        self.rtt_ms = None
+        self.mode = None
+
+    def record(self, method, seconds, bytes_out=0, bytes_in=0):
+        with self._lock:
+            self.calls += 1
+            self.bytes_out += bytes_out
+            self.bytes_in += bytes_in
+            self.seconds += seconds
+            self.methods[method] += 1
+
+    def call(self, method, func, args, kwargs):
+        args = unwrap(args)
+        kwargs = unwrap(kwargs)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            sent = _payload_size([arg for arg in args if not _is_playwright_object(arg)])
+            received = 0 if _is_playwright_object(result) else _payload_size(result)
+            self.record(method, elapsed, sent, received)
+
+    def summary(self, top=5):
+        rtt = f"{self.rtt_ms:.1f}ms" if self.rtt_ms is not None else "측정 안 함"
+        busiest = ", ".join(f"{name} {count}" for name, count in self.methods.most_common(top))
+        return (
+            f"CDP 통계(RTT {rtt}, 모드 {self.mode or '-'}): 왕복 {self.calls}회, "
+            f"송신 {self.bytes_out / 1024:.1f}KB, 수신 {self.bytes_in / 1024:.1f}KB, "
+            f"호출 대기 {self.seconds:.1f}s" + (f" | 많이 호출된 메서드: {busiest}" if busiest else "")
+        )
+
+
+class CountingProxy(object):
+    """Wraps a sync Playwright object; every remote method call is counted as one round-trip.
+
+    Playwright 객체를 돌려주는 호출(new_page, query_selector_all 등)의 결과도 감싸므로
+    컨텍스트 하나만 감싸면 그 아래 페이지/핸들 호출이 모두 집계된다.
+    """
+
+    __slots__ = ("_target", "_counter")
+
+    def __init__(self, target, counter):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_counter", counter)
+
+    def __getattr__(self, name):
+        target = object.__getattribute__(self, "_target")
+        counter = object.__getattribute__(self, "_counter")
+        value = getattr(target, name)
+        if name.startswith("_"):
+            return value
+        if not callable(value):
+            # page.mouse, locator.first 같은 속성은 감싸기만 하고 세지 않는다
+            return _wrap(value, counter)
+        if name in LOCAL_METHODS:
+            return lambda *args, **kwargs: _wrap(value(*unwrap(args), **unwrap(kwargs)), counter)
+        method = f"{type(target).__name__}.{name}"
+        return lambda *args, **kwargs: _wrap(counter.call(method, value, args, kwargs), counter)
+
+    def __setattr__(self, name, value):
+        setattr(object.__getattribute__(self, "_target"), name, value)
+
+    def __eq__(self, other):
+        return unwrap(self) == unwrap(other)
+
+    def __hash__(self):
+        return hash(unwrap(self))
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return f"CountingProxy({unwrap(self)!r})"
+
+
+def measure_cdp_rtt(browser, samples=5):
+    """Median round-trip (ms) of a no-op CDP command on the browser session; None if unavailable."""
+    try:
+        session = unwrap(browser).new_browser_cdp_session()
+    except Exception as exc:
+        print(f"CDP RTT 측정용 세션을 열지 못했습니다: {exc}")
+        return None
+    timings = []
+    try:
+        session.send("Browser.getVersion")  # 첫 호출은 세션 준비 비용이 섞이므로 버린다
+        for _ in range(max(1, samples)):
+            start = time.perf_counter()
+            session.send("Browser.getVersion")
+            timings.append((time.perf_counter() - start) * 1000)
+    except Exception as exc:
+        print(f"CDP RTT 측정 실패: {exc}")
+    finally:
+        try:
+            session.detach()
+        except Exception:
+            pass
+    return statistics.median(timings) if timings else None
+
+
+def choose_latency_mode(rtt_ms, setting="auto", threshold_ms=5.0):
+    """'batched' for high-latency links (or when forced), otherwise 'direct'."""
+    setting = (setting or "auto").lower()
+    if setting in ("batched", "direct"):
+        return setting
+    if rtt_ms is not None and rtt_ms >= threshold_ms:
+        return "batched"
+    return "direct"
+
+
+class TabPrefetcher(object):
+    """Keeps up to `depth` product tabs navigating ahead of the one being processed.
+
+    goto(wait_until="commit")는 응답이 시작되면 바로 돌아오므로, 현재 상품을 처리하는 동안
+    다음 상품 탭들이 브라우저 안에서 함께 로딩된다. 호출 측은 take()로 받은 탭에서
+    wait_for_load_state만 기다리면 된다.
+    """
+
+    def __init__(self, context, urls, depth=2, prepare=None):
+        self.context = context
+        self.urls = list(urls)
+        self.depth = max(0, depth)
+        self.prepare = prepare
+        self._open = OrderedDict()
+        self._next = 0
+
+    def _open_tab(self, url):
+        page = self.context.new_page()
+        if self.prepare is not None:
+            self.prepare(page)
+        try:
+            page.goto(url, wait_until="commit")
+        except Exception as exc:
+            print(f"상품 탭 선행 로딩 실패({url}): {exc}")
+        return page
+
+    def take(self, url):
+        if url in self.urls[self._next:]:
+            self._next = self.urls.index(url, self._next) + 1
+        page = self._open.pop(url, None)
+        if page is None:
+            page = self._open_tab(url)
+        for ahead in self.urls[self._next:self._next + self.depth]:
+            if ahead not in self._open:
+                self._open[ahead] = self._open_tab(ahead)
+        return page
+
+    def close(self):
+        for page in self._open.values():
+            try:
+                page.close()
+            except Exception:
+                pass
+        self._open.clear()
@@ -0,0 +1,168 @@
+"""크롤러 명령줄 진입점: python -m crawler <명령>.
+
+엔진(crawler.engine)은 import 시점에 환경변수로 설정 상수를 만들므로(-e/.env 적용 전에 import하면 안 됨),
+여기서는 표준 라이브러리만 import하고 각 하위 명령이 실행될 때 필요한 모듈을 불러온다. --help, crawl --dry-run,
+config는 엔진을 import하지 않는다. --engine은 저장소 루트의 런처 스크립트(기본값 묶음)를 고른다.
+
+    python -m crawler crawl [--engine test5] [--dry-run] [-e KEY=VALUE ...]
+    python -m crawler config
+    python -m crawler reexport debug/shards/shard_0.pkl --output out/dolce_shop_1_61_70
+    python -m crawler daemon --port 8777
+    python -m crawler mock --products 500
+    python -m crawler bench content|pagination [옵션]
+"""
+import argparse
+import importlib
+import os
+import sys
+from pathlib import Path
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# 런처 스크립트(엔진은 하나, 스크립트마다 백엔드/페이지 범위 기본값만 다름)
+ENGINES = {
+    "test5": "standalone_base2_win10_test5",
+    "win10": "standalone_base2_win10",
+    "original": "standalone_base2_win10_original",
+    "wsl": "standalone_basel2_wsl",
+    "test": "test",
+}
+DEFAULT_ENGINE = "test5"
+
+# 자체 argparse를 가진 모듈에 나머지 인자를 그대로 넘기는 명령
+DELEGATES = {
+    "daemon": ("crawler.daemon", "상주 데몬(예열된 브라우저 + 로컬 작업 API)"),
+    "mock": ("crawler.mock_smartstore", "로컬 mock 스마트스토어 서버"),
+}
+BENCHMARKS = {
+    "content": "benchmarks.bench_content",
+    "pagination": "benchmarks.bench_pagination",
+}
+
+
+def _apply_env(args):
+    from crawler.envfile import load_env_file
+
+    # -e 값이 .env보다 우선(이미 설정된 환경변수는 .env가 덮어쓰지 않음)
+    for item in args.env or []:
+        key, sep, value = item.partition("=")
+        if not sep or not key.strip():
+            raise SystemExit(f"-e 인자는 KEY=VALUE 형식이어야 합니다: {item!r}")
+        os.environ[key.strip()] = value
+    load_env_file(Path(args.env_file) if args.env_file else REPO_DIR / ".env")
+
+
+def _print_issues(errors, warnings):
+    for message in errors:
+        print(f"[오류] {message}")
+    for message in warnings:
+        print(f"[경고] {message}")
+
+
+def cmd_config(args):
+    from crawler.config import validate
+
+    _apply_env(args)
+    errors, warnings = validate()
+    _print_issues(errors, warnings)
+    if not errors:
+        print("설정 확인 완료" + (f" (경고 {len(warnings)}건)" if warnings else ""))
+    return 1 if errors else 0
+
+
+def cmd_crawl(args):
+    from crawler.config import validate
+
+    _apply_env(args)
+    errors, warnings = validate()
+    _print_issues(errors, warnings)
+    if errors:
+        return 1
+    script = REPO_DIR / f"{ENGINES[args.engine]}.py"
+    if args.dry_run:
+        print(f"dry run: {script.name} 실행 전 설정 확인까지만 수행했습니다.")
+        return 0
+    import runpy
+
+    if str(REPO_DIR) not in sys.path:
+        sys.path.insert(0, str(REPO_DIR))
+    # 런처를 직접 실행한 것과 같게 __main__으로 실행(런처 기본값 적용 후 엔진 main)
+    sys.argv = [str(script)]
+    runpy.run_path(str(script), run_name="__main__")
+    return 0
+
+
+def cmd_reexport(args):
+    """Rebuild the two Excel outputs from saved record buffers (shard outputs) without crawling."""
+    _apply_env(args)
+    import pandas as pd
+
+    if str(REPO_DIR) not in sys.path:
+        sys.path.insert(0, str(REPO_DIR))
+    engine = importlib.import_module("crawler.engine")
+    frames = [pd.read_pickle(path) for path in args.buffers]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=engine.df_columns)
+    df = df.drop_duplicates(subset="Product_URL", keep="first").reset_index(drop=True)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    engine.export_records(df, engine.read_excel_path, output, set(df["Product_URL"]), args.shop_key or output.name)
+    print(f"재출력 완료: 상품 {len(df)}개 → {output}.xlsx, {output}_second.xlsx")
+    return 0
+
+
+def run_delegate(name, argv):
+    module = importlib.import_module(DELEGATES[name][0])
+    return module.main(argv) or 0
+
+
+def cmd_bench(args):
+    if str(REPO_DIR) not in sys.path:
+        sys.path.insert(0, str(REPO_DIR))
+    module = importlib.import_module(BENCHMARKS[args.name])
+    return module.main(args.args) or 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m crawler", description="SmartStore crawler")
+    commands = parser.add_subparsers(dest="command", metavar="<command>")
+    commands.required = True
+
+    def add_env_options(sub):
+        sub.add_argument("--env-file", help=".env 경로 (기본: 저장소의 .env)")
+        sub.add_argument("-e", "--env", action="append", metavar="KEY=VALUE", help="환경변수 지정(반복 가능)")
+
+    crawl = commands.add_parser("crawl", help="엔진 스크립트로 크롤링 실행")
+    crawl.add_argument("--engine", choices=sorted(ENGINES), default=DEFAULT_ENGINE)
+    crawl.add_argument("--dry-run", action="store_true", help="설정만 확인하고 엔진은 불러오지 않음")
+    add_env_options(crawl)
+    crawl.set_defaults(func=cmd_crawl)
+
+    config = commands.add_parser("config", help="환경변수 설정 점검")
+    add_env_options(config)
+    config.set_defaults(func=cmd_config)
+
+    reexport = commands.add_parser("reexport", help="레코드 버퍼(.pkl)로 엑셀 2종을 다시 기록")
+    reexport.add_argument("buffers", nargs="+", help="샤드 레코드 버퍼 경로")
+    reexport.add_argument("--output", required=True, help="출력 기본 경로(확장자 제외)")
+    reexport.add_argument("--shop-key", help="수집 상태에 기록할 스토어 키 (기본: 출력 파일명)")
+    add_env_options(reexport)
+    reexport.set_defaults(func=cmd_reexport)
+
+    for name, (_, help_text) in DELEGATES.items():
+        # 목록 표시용(인자 해석은 main()에서 해당 모듈로 바로 넘긴다)
+        commands.add_parser(name, help=help_text, add_help=False)
+
+    bench = commands.add_parser("bench", help="벤치마크 실행")
+    bench.add_argument("name", choices=sorted(BENCHMARKS))
+    bench.add_argument("args", nargs=argparse.REMAINDER)
+    bench.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in DELEGATES:
+        return run_delegate(argv[0], argv[1:])
+    args = build_parser().parse_args(argv)
+    return args.func(args)
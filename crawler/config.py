@@ -0,0 +1,98 @@
+"""크롤러 환경변수 설정 점검(엔진 import 없이).
+
+엔진 모듈은 import 시점에 설정 상수를 만들고 실제 값은 실행 도중에야 쓰기 때문에, 잘못된 값
+(숫자 자리에 문자, 없는 입력 파일 등)은 브라우저를 띄운 뒤에야 드러난다. 여기서는 표준
+라이브러리만으로 같은 환경변수를 미리 해석해 오류/경고 목록을 돌려준다.
+"""
+import os
+import re
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+INT_VARS = (
+    "MAX_PRODUCTS_PER_PAGE", "MAX_PRODUCTS_TOTAL", "CRAWL_START_PAGE", "CRAWL_LAST_PAGE", "CRAWL_SHARDS",
+    "DETAIL_WORKERS", "HTTP_RETRIES", "HTTP_PER_HOST_LIMIT", "INCREMENTAL_MAX_PAGES", "CRAWL_REPLAY_SEED",
+    "LOG_MAX_BYTES", "LOG_BACKUP_COUNT", "BROWSER_CACHE_MAX_MB", "BROWSER_CACHE_MAX_AGE_DAYS",
+    "CDP_PIPELINE_DEPTH", "CDP_MAX_FAILURES",
+)
+FLOAT_VARS = (
+    "HTTP_TIMEOUT", "BROWSER_CACHE_CLEANUP_HOURS", "CDP_HIGH_RTT_MS", "CDP_PROBE_TIMEOUT", "CDP_COOLDOWN_SECONDS",
+)
+CHOICE_VARS = {
+    "PLAYWRIGHT_BROWSER": ("chromium", "firefox", "webkit"),
+    "PAGINATION_STRATEGY": ("plan", "auto", "next_only"),
+    "CRAWL_REPLAY_MODE": ("off", "record", "replay"),
+    "CDP_LATENCY_MODE": ("auto", "batched", "direct"),
+    "CRAWLER_BACKEND": ("local", "cdp"),
+    "LOG_LEVEL": ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+}
+FILE_VARS = ("CRAWL_INPUT_FILE", "CRAWL_BATCH_MANIFEST")
+FLAG_VALUES = ("0", "1", "true", "false", "yes", "no", "")
+FLAG_VARS = (
+    "CRAWLER_DRY_RUN", "INCREMENTAL_RUN", "CRAWL_INPUT_RECRAWL", "HTTP_FAST_PATH", "PAGE_JUMP_BY_QUERY",
+    "PAGINATION_DEBUG_SHOTS", "STAGE_TIMING", "SELECTOR_ADAPTIVE", "WRAP_CONTENT_HTML", "DUMP_CONTENT_HTML",
+    "PLAYWRIGHT_HEADLESS", "CDP_STATS", "CDP_ENDPOINT_REUSE", "FORCE_LOCAL_PLAYWRIGHT", "REQUIRE_CDP_CONNECTION",
+    "AUTO_LAUNCH_CHROME_DEVTOOLS",
+)
+
+
+def validate(environ=None):
+    """Return (errors, warnings) for the crawler settings found in environ (default: os.environ)."""
+    environ = os.environ if environ is None else environ
+    errors = []
+    warnings = []
+
+    def value(name):
+        return (environ.get(name) or "").strip()
+
+    for name in INT_VARS:
+        if value(name) and not re.fullmatch(r"-?\d+", value(name)):
+            errors.append(f"{name}={value(name)!r}: 정수가 아닙니다.")
+    for name in FLOAT_VARS:
+        if value(name):
+            try:
+                float(value(name))
+            except ValueError:
+                errors.append(f"{name}={value(name)!r}: 숫자가 아닙니다.")
+    for name, choices in CHOICE_VARS.items():
+        raw = value(name)
+        normalized = raw.upper() if name == "LOG_LEVEL" else raw.lower()
+        if raw and normalized not in choices:
+            errors.append(f"{name}={raw!r}: {', '.join(choices)} 중 하나여야 합니다.")
+    for name in FLAG_VARS:
+        if value(name).lower() not in FLAG_VALUES:
+            warnings.append(f"{name}={value(name)!r}: 1/0(true/false) 이외의 값은 기본값으로 처리됩니다.")
+    for name in FILE_VARS:
+        if value(name) and not Path(value(name)).exists():
+            errors.append(f"{name}={value(name)!r}: 파일이 없습니다.")
+
+    listing_url = value("CRAWL_LISTING_URL")
+    if listing_url:
+        parts = listing_url.split("/")
+        if not urlsplit(listing_url).scheme or len(parts) < 6:
+            errors.append(
+                f"CRAWL_LISTING_URL={listing_url!r}: https://<host>/<스토어>/category/<카테고리> 형식이어야 합니다."
+            )
+    only_pages = value("CRAWL_ONLY_PAGES")
+    if only_pages and not all(token.isdigit() for token in re.split(r"[\s,;]+", only_pages) if token):
+        errors.append(f"CRAWL_ONLY_PAGES={only_pages!r}: 쉼표로 구분한 페이지 번호여야 합니다.")
+    size = value("LISTING_PAGE_SIZE")
+    if size and size.lower() != "auto" and not all(
+        token.isdigit() for token in re.split(r"[\s,;]+", size) if token
+    ):
+        errors.append(f"LISTING_PAGE_SIZE={size!r}: auto 또는 숫자(목록)여야 합니다.")
+    start, last = value("CRAWL_START_PAGE"), value("CRAWL_LAST_PAGE")
+    if start.isdigit() and last.isdigit() and int(last) < int(start):
+        errors.append(f"CRAWL_LAST_PAGE({last})가 CRAWL_START_PAGE({start})보다 작습니다.")
+    if value("CRAWL_SHARDS") not in ("", "0", "1") and (value("INCREMENTAL_RUN") or value("CRAWL_BATCH_MANIFEST")):
+        warnings.append("CRAWL_SHARDS는 INCREMENTAL_RUN/CRAWL_BATCH_MANIFEST와 함께 쓰면 단일 프로세스로 실행됩니다.")
+
+    template = REPO_DIR / "output" / "ExcelSaveTemplate_230109.xlsx"
+    if not template.exists():
+        warnings.append(f"엑셀 템플릿이 없습니다: {template}")
+    if not any(path.exists() for path in (REPO_DIR / "naver_category.xlsx", REPO_DIR.parent / "naver_category.xlsx")):
+        warnings.append("naver_category.xlsx를 찾지 못했습니다(카테고리 번호가 비게 됩니다).")
+    return errors, warnings
@@ -0,0 +1,381 @@
+"""상품 상세(#INTRODUCE) HTML 정리 파이프라인.
+
+브라우저와 무관한 BeautifulSoup 처리만 모아 두어 크롤러와 벤치마크가 같은 코드를 사용한다.
+"""
+from bs4 import BeautifulSoup
+
+
+BRANDING_IMAGE_URLS = {
+    "https://axh2eqadoldy.compat.objectstorage.ap-chuncheon-1.oraclecloud.com/bucket-20230610-0005/upload/top.png",
+    "https://axh2eqadoldy.compat.objectstorage.ap-chuncheon-1.oraclecloud.com/bucket-20230610-0005/upload/bottom.png",
+    "https://coudae.s3.ap-northeast-2.amazonaws.com/A00412936/cloud/7290.png",
+}
+
+_GRAY_LINE_REPLACEMENTS = {
+    "https://rapid-up.s3.ap-northeast-2.amazonaws.com/dev/gray-line.png":
+        "https://axh2eqadoldy.compat.objectstorage.ap-chuncheon-1.oraclecloud.com/bucket-20230610-0005/upload/gray-line.png"
+}
+
+_BLOCKED_IMAGE_PREFIXES = (
+    "https://rapid-up.s3.ap-northeast-2.amazonaws.com",
+    "https://cdn.heyseller.kr",
+    "https://ai.esmplus.com/",
+)
+
+
+def log_content_debug(product_code, message):
+    print(f"[CONTENT][{product_code}] {message}")
+
+
+def wrap_html_document(snippet):
+    if not snippet:
+        return ""
+    return (
+        "<!DOCTYPE html>"
+        "<html lang=\"ko\">"
+        "<head>"
+        "<meta charset=\"utf-8\">"
+        "<style>body{margin:0;padding:0;background:#fff;}</style>"
+        "</head>"
+        "<body>"
+        f"{snippet}"
+        "</body>"
+        "</html>"
+    )
+
+
+def cleanup_dom_structure(soup, product_code):
+    removed = 0
+
+    for tag_name in ("style", "script", "svg", "canvas"):
+        for node in list(soup.find_all(tag_name)):
+            node.decompose()
+            removed += 1
+
+    selectors_to_remove = [
+        ".pzp-ui-dimmed",
+        ".pzp-upnext-endscreen",
+        ".pzp-ui-playlist",
+        ".pzp-double-tap-overlay",
+        ".pzp-ad-break-indicator",
+        ".pzp-pc__poster",
+        ".pzp-ui-circle-process",
+        ".pzp-ui-dimmed",
+    ]
+    for selector in selectors_to_remove:
+        for node in list(soup.select(selector)):
+            node.decompose()
+            removed += 1
+
+    selectors_to_unwrap = [
+        ".se-main-container",
+        ".editor_wrap",
+        ".se-viewer",
+        ".uOXg8u0yzs",
+        ".LXGzUhHJC2",
+        ".EtTm8LLHdw",
+        ".Uea3oKmnaJ",
+        ".se-component",
+        ".se-component-content",
+        ".se-section",
+        ".se-module",
+        ".se-section-video",
+        ".se-module-video",
+        "[aria-label*='비디오']",
+        "[aria-label*='동영상']",
+        "[id^='wpc-']",
+        ".pzp-pc__video",
+    ]
+    for selector in selectors_to_unwrap:
+        for node in list(soup.select(selector)):
+            node.unwrap()
+
+    if removed:
+        log_content_debug(product_code, f"Removed {removed} extra DOM nodes during cleanup.")
+
+
+def strip_blob_media(soup, product_code):
+    removed = 0
+    simplified_videos = 0
+
+    for component in list(soup.select(".se-component.se-video")):
+        playable_src = None
+        video_tags = component.find_all("video")
+        for video_tag in video_tags:
+            src_candidates = [video_tag.get("src"), video_tag.get("data-src")]
+            for candidate in src_candidates:
+                if candidate and not candidate.startswith("blob:"):
+                    playable_src = candidate
+                    break
+            if playable_src:
+                break
+
+        if playable_src:
+            simple_video = soup.new_tag("video")
+            simple_video["src"] = playable_src
+            simple_video["controls"] = "controls"
+            simple_video["autoplay"] = "autoplay"
+            simple_video["muted"] = "muted"
+            simple_video["loop"] = "loop"
+            simple_video["style"] = "display:block;margin:0 auto 20px auto;max-width:100%;"
+            component.replace_with(simple_video)
+            simplified_videos += 1
+        else:
+            component.decompose()
+            removed += 1
+
+    blob_tags = []
+    for tag in soup.find_all(["video", "source", "iframe", "canvas"]):
+        attrs = [
+            tag.get("src", ""),
+            tag.get("data-src", ""),
+            tag.get("poster", ""),
+        ]
+        if any(attr and "blob:" in attr for attr in attrs):
+            blob_tags.append(tag)
+
+    for tag in blob_tags:
+        parent = tag.find_parent(class_="se-component se-video") or tag
+        parent.decompose()
+        removed += 1
+
+    extra_selectors = [
+        ".prismplayer-area",
+        "[class*='pzp-']",
+        "[class*='pzp_']",
+        "[class*='pzp ']",
+        "[class~='pzp']",
+        "[class*='webplayer']",
+        "[class*='player-area']",
+        "[class*='pzp-pc']",
+        "[class*='pzp-ui']",
+        "[class*='pzp-upnext']",
+    ]
+    for selector in extra_selectors:
+        for node in soup.select(selector):
+            node.decompose()
+            removed += 1
+
+    video_text_keywords = (
+        "광고 후 계속됩니다",
+        "다음 동영상",
+        "subject",
+        "author",
+        "재생 속도",
+        "해상도",
+        "자막",
+        "옵션",
+        "도움말",
+        "죄송합니다. 문제가 발생했습니다",
+        "고화질 재생이 가능한 영상입니다",
+        "더 알아보기",
+        "00:00",
+        "0:00",
+    )
+    removed_text = 0
+    for text_node in list(soup.find_all(string=True)):
+        stripped = text_node.strip()
+        if not stripped:
+            continue
+        if any(keyword in stripped for keyword in video_text_keywords):
+            container = getattr(text_node, "parent", None)
+            if container is None:
+                continue
+            if container.name in {"html", "body"}:
+                continue
+            parent_component = container.find_parent(class_="se-component se-video")
+            target = parent_component or container
+            try:
+                target.decompose()
+                removed_text += 1
+            except Exception:
+                continue
+    removed += removed_text
+
+    if removed or simplified_videos:
+        log_content_debug(
+            product_code,
+            f"Removed {removed} blob media blocks, simplified {simplified_videos} playable videos.",
+        )
+
+
+
+def clean_content_html(raw_content, product_code):
+    """Run the #INTRODUCE cleanup pipeline on raw inner HTML.
+
+    Returns (html, label). label is one of "cleaned", "fallback_gallery", "placeholder"
+    or "fallback_failed"; html is None for the last two.
+    """
+    soup = BeautifulSoup(raw_content, 'html.parser')
+
+    text_snapshot = soup.get_text(strip=True)
+    normalized_text = text_snapshot.replace(" ", "").replace("\u00a0", "")
+    if normalized_text in {"계속됩니다", "계속됩니다.", "계속됩니다..", "계속됩니다..."}:
+        log_content_debug(product_code, "'계속됩니다' placeholder detected (no other content), skipping.")
+        return None, "placeholder"
+
+    css_link = soup.new_tag(
+        "link",
+        rel="stylesheet",
+        href="https://static-resource-smartstore.pstatic.net/smartstore/p/static/20230630180923/common.css",
+    )
+    if soup.head:
+        soup.head.append(css_link)
+    else:
+        head_tag = soup.new_tag("head")
+        head_tag.append(css_link)
+        soup.insert(0, head_tag)
+
+    for button in soup.find_all("button"):
+        button.decompose()
+
+    for img in soup.find_all("img", attrs={"data-src": True}):
+        img["src"] = img["data-src"]
+        del img["data-src"]
+
+    for img in soup.find_all("img", src="https://rapid-up.s3.ap-northeast-2.amazonaws.com/dev/gray-line.png"):
+        img["src"] = _GRAY_LINE_REPLACEMENTS["https://rapid-up.s3.ap-northeast-2.amazonaws.com/dev/gray-line.png"]
+
+    text_to_remove = "* {text-align: center;}  #mycontents11 img{max-width: 100%;}"
+    if text_to_remove in soup.get_text():
+        soup = BeautifulSoup(str(soup).replace(text_to_remove, ""), "html.parser")
+        log_content_debug(product_code, "Removed inline text-align styles.")
+
+    disallowed_attrs = ["area-hidden", "data-linkdata", "data-linktype", "onclick", "style", "class"]
+    for attr in disallowed_attrs:
+        for tag in soup.find_all(attrs={attr: True}):
+            del tag[attr]
+
+    for anchor in soup.find_all("a", attrs={"data-linkdata": True}):
+        img = anchor.find("img")
+        if not img:
+            continue
+        src = img.get("src", "")
+        data_src = img.get("data-src", "")
+        if not src:
+            src = data_src
+            img["src"] = src
+        if "data-src" in img.attrs:
+            del img["data-src"]
+
+    for img in soup.find_all("img"):
+        src = img.get("src", "")
+        if any(src.startswith(prefix) for prefix in _BLOCKED_IMAGE_PREFIXES):
+            img.decompose()
+
+    strip_blob_media(soup, product_code)
+    cleanup_dom_structure(soup, product_code)
+
+    remaining_img_count = len(soup.find_all('img'))
+    log_content_debug(product_code, f"Images after cleanup: {remaining_img_count}")
+
+    soup = insert_and_remove_images(soup)
+
+    for img_tag in soup.find_all("img"):
+        img_tag["style"] = "display: block; margin-left: auto; margin-right: auto; margin-bottom: 10px;"
+
+    for h1 in soup.find_all("h1"):
+        h1["style"] = "text-align: center; font-size: 30px; margin-bottom: 20px;"
+
+    text_elements = ["p", "div", "span", "li", "a"]
+    for tag_name in text_elements:
+        for node in soup.find_all(tag_name):
+            existing_style = node.get("style", "")
+            new_style = f"{existing_style}; text-align: center; font-size: 18px; margin-bottom: 30px;"
+            node["style"] = new_style.strip()
+
+    cleaned_html = str(soup).strip()
+
+    meaningful_imgs = [
+        img for img in soup.find_all("img")
+        if (img.get("src") or "").strip() and (img.get("src").strip() not in BRANDING_IMAGE_URLS)
+    ]
+    has_text = bool(soup.get_text(strip=True))
+    final_html = cleaned_html
+    final_label = "cleaned"
+
+    if not has_text and not meaningful_imgs:
+        log_content_debug(product_code, "Content empty after cleanup; applying fallback gallery extraction.")
+        fallback = build_image_gallery(raw_content, product_code)
+        if fallback is None:
+            log_content_debug(product_code, "Fallback gallery extraction failed; returning None.")
+            return None, "fallback_failed"
+        final_html = fallback
+        final_label = "fallback_gallery"
+        log_content_debug(product_code, "Fallback gallery extraction succeeded.")
+
+    return final_html, final_label
+
+
+def insert_and_remove_images(soup):
+    img_srcs_to_insert = [
+        "https://axh2eqadoldy.compat.objectstorage.ap-chuncheon-1.oraclecloud.com/bucket-20230610-0005/upload/top.png",
+        "https://axh2eqadoldy.compat.objectstorage.ap-chuncheon-1.oraclecloud.com/bucket-20230610-0005/upload/bottom.png",
+        "https://coudae.s3.ap-northeast-2.amazonaws.com/A00412936/cloud/7290.png",
+    ]
+
+    img_tag_top = soup.new_tag(
+        "img", src=img_srcs_to_insert[0], style="display: block; margin-left: auto; margin-right: auto;"
+    )
+    img_tag_middle = soup.new_tag(
+        "img", src=img_srcs_to_insert[2], style="display: block; margin-left: auto; margin-right: auto;"
+    )
+    img_tag_bottom = soup.new_tag(
+        "img", src=img_srcs_to_insert[1], style="display: block; margin-left: auto; margin-right: auto;"
+    )
+
+    try:
+        first_tag = next(soup.children)
+        last_tag = next(reversed(soup.contents))
+    except StopIteration:
+        return soup
+
+    first_tag.insert_before(img_tag_top)
+    last_tag.insert_after(img_tag_bottom)
+
+    img_srcs_to_remove = ["", ""]
+    for img_src in img_srcs_to_remove:
+        for img in soup.find_all("img", attrs={"src": img_src}):
+            img.decompose()
+
+    return soup
+
+
+def build_image_gallery(raw_html, product_code="UNKNOWN"):
+    if not raw_html:
+        log_content_debug(product_code, "build_image_gallery received empty raw_html.")
+        return None
+
+    soup = BeautifulSoup(raw_html, 'html.parser')
+
+    for img in soup.find_all('img', attrs={'data-src': True}):
+        img['src'] = img['data-src']
+        del img['data-src']
+
+    filtered = BeautifulSoup('', 'html.parser')
+    container = filtered.new_tag('div')
+    filtered.append(container)
+
+    seen = set()
+    for img in soup.find_all('img'):
+        src = (img.get('src') or '').strip()
+        if not src:
+            continue
+        src = _GRAY_LINE_REPLACEMENTS.get(src, src)
+        if any(src.startswith(prefix) for prefix in _BLOCKED_IMAGE_PREFIXES):
+            continue
+        if src in BRANDING_IMAGE_URLS:
+            continue
+        if src in seen:
+            continue
+        seen.add(src)
+        clean_img = filtered.new_tag('img', src=src)
+        clean_img['style'] = 'display:block;margin:0 auto 10px auto;'
+        container.append(clean_img)
+
+    if not container.find_all('img'):
+        log_content_debug(product_code, "Fallback gallery extraction produced no images.")
+        return None
+
+    log_content_debug(product_code, "Fallback gallery extraction produced image-only content.")
+    return str(filtered)
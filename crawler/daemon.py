@@ -0,0 +1,289 @@
+"""상주 크롤러 데몬: 예열된 브라우저 + SQLite 작업 테이블 + 로컬 HTTP API.
+
+매 실행마다 드는 import(pandas/openpyxl/bs4/playwright), 브라우저 기동, stealth 적용,
+카테고리 엑셀 로드를 한 번만 하고, 이후 작업은 큐에서 바로 꺼내 처리한다.
+
+실행:
+    python -m crawler.daemon --port 8777
+작업 등록/조회:
+    curl -X POST localhost:8777/jobs -d '{"url": "https://smartstore.naver.com/joypapa_/category/ALL?st=RECENT&size=20",
+                                          "start_page": 1, "last_page": 3, "max_products": 50}'
+    curl localhost:8777/jobs/1
+    curl -N localhost:8777/jobs/1/events      # 진행 상황 스트리밍(text/event-stream)
+다른 프로세스가 jobs 테이블에 status='queued' 행을 직접 넣어도 같은 방식으로 처리된다.
+"""
+import argparse
+import importlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from crawler.envfile import load_env_file
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_ENGINE = "crawler.engine"
+DEFAULT_DB_PATH = REPO_DIR / "state" / "jobs.sqlite3"
+FINISHED_STATUSES = ("done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL DEFAULT 'queued',
+    params TEXT NOT NULL,
+    progress TEXT NOT NULL DEFAULT '[]',
+    outputs TEXT NOT NULL DEFAULT '[]',
+    error TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL
+)
+"""
+
+
+class JobStore(object):
+    """SQLite job table shared by the HTTP API thread(s) and the browser worker."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        # 이전 데몬이 처리 중 종료된 작업은 다시 대기열로
+        self._conn.execute("UPDATE jobs SET status='queued', started=NULL WHERE status='running'")
+
+    def _execute(self, sql, args=()):
+        with self._lock:
+            return self._conn.execute(sql, args)
+
+    def create(self, params):
+        cursor = self._execute(
+            "INSERT INTO jobs (params, created) VALUES (?, ?)", (json.dumps(params, ensure_ascii=False), time.time())
+        )
+        return cursor.lastrowid
+
+    def claim_next(self):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE status='queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status='running', started=? WHERE id=? AND status='queued'", (time.time(), row["id"])
+            )
+        return self.get(row["id"])
+
+    def append_progress(self, job_id, event):
+        with self._lock:
+            row = self._conn.execute("SELECT progress, outputs FROM jobs WHERE id=?", (job_id,)).fetchone()
+            progress = json.loads(row["progress"])
+            outputs = json.loads(row["outputs"])
+            progress.append(event)
+            outputs.extend(path for path in event.get("paths", []) if path not in outputs)
+            self._conn.execute(
+                "UPDATE jobs SET progress=?, outputs=? WHERE id=?",
+                (json.dumps(progress, ensure_ascii=False), json.dumps(outputs, ensure_ascii=False), job_id),
+            )
+
+    def finish(self, job_id, status, error=None):
+        self._execute("UPDATE jobs SET status=?, error=?, finished=? WHERE id=?", (status, error, time.time(), job_id))
+
+    def get(self, job_id):
+        row = self._execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        return _row_to_dict(row) if row else None
+
+    def list(self, limit=50):
+        rows = self._execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+
+def _row_to_dict(row):
+    job = dict(row)
+    for key in ("params", "progress", "outputs"):
+        job[key] = json.loads(job[key])
+    return job
+
+
+class BrowserWorker(threading.Thread):
+    """Owns the warm browser (sync Playwright objects stay on this thread) and runs queued jobs."""
+
+    def __init__(self, engine, store, poll_interval=0.5):
+        super().__init__(name="crawler-daemon-browser", daemon=True)
+        self.engine = engine
+        self.store = store
+        self.poll_interval = poll_interval
+        self.ready = threading.Event()
+        self.stopping = threading.Event()
+        self.current_job = None
+
+    def run(self):
+        # 카테고리 인덱스는 첫 작업 전에 미리 로드
+        self.engine.load_category_index()
+        with self.engine.open_worker_context() as browser_context:
+            self.ready.set()
+            print("데몬 브라우저 준비 완료")
+            while not self.stopping.is_set():
+                job = self.store.claim_next()
+                if job is None:
+                    self.stopping.wait(self.poll_interval)
+                    continue
+                self.run_job(browser_context, job)
+
+    def run_job(self, browser_context, job):
+        job_id = job["id"]
+        self.current_job = job_id
+        started = time.perf_counter()
+        print(f"작업 {job_id} 시작: {job['params']}")
+
+        def report(event, **fields):
+            fields.update({"event": event, "t": round(time.perf_counter() - started, 3)})
+            self.store.append_progress(job_id, fields)
+
+        try:
+            self.engine.run_daemon_job(browser_context, job["params"], report)
+        except Exception as exc:
+            self.store.finish(job_id, "failed", error=f"{type(exc).__name__}: {exc}")
+            print(f"작업 {job_id} 실패: {exc}")
+        else:
+            self.store.finish(job_id, "done")
+            print(f"작업 {job_id} 완료: {time.perf_counter() - started:.1f}s")
+        finally:
+            self.current_job = None
+
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    server_version = "CrawlerDaemon/1.0"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _job_id(self, segments):
+        try:
+            return int(segments[1])
+        except (IndexError, ValueError):
+            return None
+
+    def do_GET(self):
+        segments = [segment for segment in self.path.split("?")[0].split("/") if segment]
+        store = self.server.store
+        if segments == ["health"]:
+            worker = self.server.worker
+            self._json(200, {"ready": worker.ready.is_set(), "current_job": worker.current_job})
+            return
+        if segments == ["jobs"]:
+            self._json(200, {"jobs": store.list()})
+            return
+        if segments[:1] == ["jobs"]:
+            job_id = self._job_id(segments)
+            job = store.get(job_id) if job_id else None
+            if job is None:
+                self._json(404, {"error": "job not found"})
+                return
+            if segments[2:] == ["events"]:
+                self._stream(job_id)
+                return
+            self._json(200, job)
+            return
+        self._json(404, {"error": "not found"})
+
+    def do_POST(self):
+        segments = [segment for segment in self.path.split("?")[0].split("/") if segment]
+        if segments != ["jobs"]:
+            self._json(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._json(400, {"error": "invalid JSON"})
+            return
+        if not isinstance(params, dict):
+            self._json(400, {"error": "job params must be an object"})
+            return
+        job_id = self.server.store.create(params)
+        self._json(201, {"id": job_id, "status": "queued"})
+
+    def _stream(self, job_id):
+        """text/event-stream of progress events until the job finishes (polls the job table)."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        sent = 0
+        status = None
+        try:
+            while True:
+                job = self.server.store.get(job_id)
+                for event in job["progress"][sent:]:
+                    self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+                sent = len(job["progress"])
+                if job["status"] != status:
+                    status = job["status"]
+                    payload = {"event": "status", "status": status, "outputs": job["outputs"], "error": job["error"]}
+                    self.wfile.write(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                if status in FINISHED_STATUSES:
+                    return
+                time.sleep(0.3)
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+def serve(engine_name=DEFAULT_ENGINE, host="127.0.0.1", port=8777, db_path=DEFAULT_DB_PATH):
+    if str(REPO_DIR) not in sys.path:
+        sys.path.insert(0, str(REPO_DIR))
+    # 설정 상수는 엔진 import 시점에 읽히므로 .env를 먼저 읽는다
+    load_env_file(REPO_DIR / ".env")
+    engine = importlib.import_module(engine_name)
+    if hasattr(engine, "start_logging"):
+        engine.start_logging()
+    store = JobStore(db_path)
+    worker = BrowserWorker(engine, store)
+    worker.start()
+
+    httpd = ThreadingHTTPServer((host, port), DaemonHandler)
+    httpd.daemon_threads = True
+    httpd.store = store
+    httpd.worker = worker
+    print(f"크롤러 데몬 대기 중: http://{host}:{httpd.server_address[1]} (jobs db: {store.path})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stopping.set()
+        httpd.server_close()
+        worker.join(timeout=30)
+        if getattr(engine, "LOGGING", None) is not None:
+            engine.LOGGING.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Long-running crawler daemon with a local job API")
+    parser.add_argument("--engine", default=DEFAULT_ENGINE, help="crawler module providing run_daemon_job")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8777)
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite job table path")
+    args = parser.parse_args(argv)
+    serve(args.engine, args.host, args.port, args.db)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2004 @@
+"""크롤링 엔진: 리스트/상세 수집, 엑셀 출력, 샤딩/배치/입력 모드.
+
+브라우저는 crawler.backends의 백엔드로 연다(로컬 실행 또는 CDP 연결). 저장소 루트의 스크립트들은
+기본값만 정해 이 모듈의 main()을 실행하는 런처이고, 데몬/CLI는 이 모듈을 직접 import한다.
+
+import 시점에는 환경변수로 설정 상수만 만든다. playwright/pandas/openpyxl은 쓰는 함수 안에서 불러오고,
+상태 파일(수집 상태/셀렉터 통계/CDP 엔드포인트 캐시)과 공용 HTTP 클라이언트는 처음 쓸 때 만든다.
+"""
+from pathlib import Path
+from collections import Counter
+import atexit
+import contextlib
+import functools
+import random
+import threading
+import time
+import shutil
+import re
+import os
+import sys
+from urllib.parse import urlsplit, urlunsplit
+
+from crawler.backends import CdpBackend, ContextSession, LocalBackend, find_cdp_endpoint
+from crawler.batch import load_manifest, round_robin
+from crawler.cdp_endpoints import EndpointRegistry
+from crawler.cdp_pool import CdpPool, parse_endpoints
+from crawler.cdp_stats import (
+    LATENCY_MODES,
+    CdpCounter,
+    CountingProxy,
+    TabPrefetcher,
+    choose_latency_mode,
+    measure_cdp_rtt,
+    unwrap,
+)
+from crawler.content import clean_content_html, log_content_debug, wrap_html_document
+from crawler.envfile import load_env_file
+from crawler.http_client import get_client
+from crawler.http_extract import HttpProductFetcher, missing_fields, parse_product_html
+from crawler.inputs import load_product_inputs
+from crawler.listing import choose_page_size, map_legacy_pages, parse_size_setting, url_page_size
+from crawler.logs import get_logger, log_context, setup_logging
+from crawler.page_state import ProductPageState
+from crawler.profile import BrowserProfile
+from crawler.replay import ReplayStore
+from crawler.selector_stats import SelectorStats
+from crawler.sharding import build_shards, merge_shard_records, run_shards, split_contiguous, write_shard_records
+from crawler.specs import (
+    CARD_SPEC,
+    CATCH_ALL_SELECTORS,
+    CONTENT_SELECTORS,
+    DETAIL_SPEC,
+    IMAGE_MAIN_SELECTORS,
+    IMAGE_THUMBNAIL_SELECTORS,
+    LISTING_CARD_SELECTORS,
+    SHIPPING_SELECTORS,
+)
+from crawler.state import CrawlState, product_code_from_url
+from crawler.timing import StageTimer
+from crawler.urls import update_query_params
+from crawler.workers import run_detail_workers
+from crawler.wsl import (
+    DEFAULT_CDP_PORT,
+    detect_windows_host,
+    launch_chrome_devtools,
+    normalize_cdp_url,
+    running_on_wsl,
+    windows_ws_endpoint,
+)
+
+
+# 저장소 루트(설정/출력 경로 기준). 이 파일은 crawler/ 아래에 있다.
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+
+# python -m crawler.engine(샤드 워커 포함)으로 실행할 때만 설정 상수보다 먼저 .env를 읽는다.
+# import(런처/데몬/CLI/벤치마크)할 때는 호출 측이 필요하면 먼저 읽는다(import 시 부수효과 없음).
+if __name__ == "__main__":
+    load_env_file(SCRIPT_DIR / ".env")
+
+# 페이지당 최대 크롤링 상품 수 (테스트 기본값 5개)
+DEFAULT_MAX_PRODUCTS_PER_PAGE = 5
+MAX_PRODUCTS_PER_PAGE = int(
+    os.getenv("MAX_PRODUCTS_PER_PAGE", str(DEFAULT_MAX_PRODUCTS_PER_PAGE)) or DEFAULT_MAX_PRODUCTS_PER_PAGE
+)
+
+# 전체 실행에서 최대 수집 상품 수 (테스트 기본값 5개)
+DEFAULT_MAX_PRODUCTS_TOTAL = DEFAULT_MAX_PRODUCTS_PER_PAGE
+MAX_PRODUCTS_TOTAL = int(
+    os.getenv("MAX_PRODUCTS_TOTAL", str(DEFAULT_MAX_PRODUCTS_TOTAL)) or DEFAULT_MAX_PRODUCTS_TOTAL
+)
+
+
+LOG_FILE = Path(os.getenv("LOG_FILE") or (SCRIPT_DIR / "log.txt"))
+
+# 로그 레벨(DEBUG이면 옵션 dict, 이미지 URL 목록, Content 미리보기 등 상세 출력 포함)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper().strip() or "INFO"
+# 구조화 JSONL 로그 경로(미지정 시 비활성화)
+LOG_JSONL_PATH = (os.getenv("LOG_JSONL_PATH") or "").strip() or None
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)) or 0)
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5") or 0)
+log = get_logger()
+
+
+def resolve_category_path() -> Path:
+    # 우선 로컬 경로, 없으면 상위 디렉터리(AGENTS.md 가이드에 맞춤)
+    local = SCRIPT_DIR / "naver_category.xlsx"
+    parent = SCRIPT_DIR.parent / "naver_category.xlsx"
+    if local.exists():
+        return local
+    if parent.exists():
+        return parent
+    # 마지막으로 로컬 경로를 반환(실패 시 런타임에서 에러 메시지 제공)
+    return local
+
+
+NAVER_CATEGORY_PATH = resolve_category_path()
+CRAWLER_DRY_RUN = os.getenv("CRAWLER_DRY_RUN", "0").lower() in {"1", "true", "yes"}
+WRAP_CONTENT_HTML = os.getenv("WRAP_CONTENT_HTML", "0").lower() in {"1", "true", "yes"}
+DUMP_CONTENT_HTML = os.getenv("DUMP_CONTENT_HTML", "0").lower() in {"1", "true", "yes"}
+DUMP_CONTENT_DIR = SCRIPT_DIR / "debug" / "content_outputs"
+
+# 선택 페이지만 크롤링하는 디버그용 옵션(예: CRAWL_ONLY_PAGES="51,59").
+# 지정되지 않으면 기존 범위(global_start_page~global_last_page) 전체를 처리합니다.
+_only_pages_raw = os.getenv("CRAWL_ONLY_PAGES", "").strip()
+CRAWL_ONLY_PAGES = None
+if _only_pages_raw:
+    try:
+        parts = re.split(r"[\s,;]+", _only_pages_raw)
+        CRAWL_ONLY_PAGES = [int(p) for p in parts if p]
+    except Exception as exc:
+        print(f"CRAWL_ONLY_PAGES 파싱 실패({_only_pages_raw}): {exc}")
+        CRAWL_ONLY_PAGES = None
+
+# 증분 실행: 1페이지부터 훑다가 이전 실행에서 엑셀로 기록한 상품(워터마크)을 만나면 즉시 종료
+# (st=RECENT 정렬 전제). 상태 파일에는 스토어별 최신 기록 상품 코드/기록 코드 목록을 저장
+INCREMENTAL_RUN = os.getenv("INCREMENTAL_RUN", "0").lower() in {"1", "true", "yes"}
+INCREMENTAL_MAX_PAGES = int(os.getenv("INCREMENTAL_MAX_PAGES", "50") or 50)
+CRAWL_STATE_PATH = Path(os.getenv("CRAWL_STATE_PATH") or (SCRIPT_DIR / "state" / "crawl_state.json"))
+CRAWL_STATE = None
+
+# 리스트 페이지 범위(기존 size=20 기준 번호)
+CRAWL_START_PAGE = int(os.getenv("CRAWL_START_PAGE", "61") or 61)
+CRAWL_LAST_PAGE = int(os.getenv("CRAWL_LAST_PAGE", str(CRAWL_START_PAGE)) or CRAWL_START_PAGE)
+
+# 멀티 프로세스 샤딩: 2 이상이면 페이지 범위(또는 입력 목록)를 나눠 워커 프로세스 N개로 실행 후 병합
+CRAWL_SHARDS = max(1, int(os.getenv("CRAWL_SHARDS", "1") or 1))
+CRAWL_SHARD_DIR = Path(os.getenv("CRAWL_SHARD_DIR") or (SCRIPT_DIR / "debug" / "shards"))
+# 코디네이터가 워커에 지정하는 레코드 버퍼 경로(설정되면 엑셀/상태 대신 버퍼만 기록)
+CRAWL_SHARD_OUTPUT = (os.getenv("CRAWL_SHARD_OUTPUT") or "").strip() or None
+
+# 상품 URL/코드 목록 입력 모드: 리스트 크롤링 없이 해당 상품만 상세 수집(.txt/.csv/.xlsx, 예: *_second.xlsx)
+CRAWL_INPUT_FILE = (os.getenv("CRAWL_INPUT_FILE") or "").strip() or None
+# 입력 모드에서 이미 엑셀로 기록한 상품(수집 상태)도 다시 수집할지 여부
+CRAWL_INPUT_RECRAWL = os.getenv("CRAWL_INPUT_RECRAWL", "0").lower() in {"1", "true", "yes"}
+# 여러 스토어 배치 실행 매니페스트(JSON/CSV). 한 브라우저에서 스토어별 리스트 페이지를 번갈아 처리
+CRAWL_BATCH_MANIFEST = (os.getenv("CRAWL_BATCH_MANIFEST") or "").strip() or None
+# 상세 수집 병렬 워커 수(2 이상이면 워커마다 별도 브라우저를 띄움)
+DETAIL_WORKERS = max(1, int(os.getenv("DETAIL_WORKERS", "1") or 1))
+# 여러 CDP 브라우저에 나눠 붙기(쉼표/공백 구분, 포트만 쓰면 127.0.0.1). 설정하면 로컬 실행 대신 연결하고
+# 상세 워커는 엔드포인트 수(DETAIL_WORKERS가 더 크면 그 수)만큼 띄워 엔드포인트에 고르게 배정
+CDP_ENDPOINTS = parse_endpoints(os.getenv("CDP_ENDPOINTS"))
+
+# 브라우저 백엔드: local(기본, 이 PC에서 실행) | cdp(실행 중인 Chrome에 연결, WSL→Windows 포함)
+CRAWLER_BACKEND = os.getenv("CRAWLER_BACKEND", "local").lower().strip()
+# cdp 백엔드: 연결 주소(미지정 시 캐시된 엔드포인트 → 기본값(WSL이면 Windows 호스트) → 127.0.0.1 순으로 점검)
+PLAYWRIGHT_CONNECT_URL = (os.getenv("PLAYWRIGHT_CONNECT_URL") or "").strip() or None
+WSL_CDP_HOST = (os.getenv("WSL_CDP_HOST") or os.getenv("PLAYWRIGHT_CDP_HOST") or "").strip() or None
+# 응답하는 Chrome이 없으면 start_chrome_dev.bat을 실행(Windows/WSL)
+AUTO_LAUNCH_CHROME_DEVTOOLS = os.getenv("AUTO_LAUNCH_CHROME_DEVTOOLS", "1").lower() not in {"0", "false", "no"}
+# 연결 실패 시 로컬 실행으로 대체하지 않고 종료
+REQUIRE_CDP_CONNECTION = os.getenv("REQUIRE_CDP_CONNECTION", "0").lower() in {"1", "true", "yes"}
+FORCE_LOCAL_PLAYWRIGHT = os.getenv("FORCE_LOCAL_PLAYWRIGHT", "0").lower() in {"1", "true", "yes"}
+# 마지막으로 연결에 성공한 엔드포인트를 기억해 다음 실행에서 먼저 점검
+CDP_ENDPOINT_REUSE = os.getenv("CDP_ENDPOINT_REUSE", "1").lower() in {"1", "true", "yes"}
+CDP_PROBE_TIMEOUT = float(os.getenv("CDP_PROBE_TIMEOUT", "1.0") or 1.0)
+CDP_ENDPOINT_CACHE = Path(os.getenv("CDP_ENDPOINT_CACHE") or (SCRIPT_DIR / "state" / "cdp_endpoint.json"))
+CDP_ENDPOINT_REGISTRY = None
+# CDP 왕복 지연이 높으면(WSL→Windows 등) 리스트 카드를 evaluate 한 번으로 읽고 다음 상품 탭을 미리 로딩
+CDP_LATENCY_MODE = os.getenv("CDP_LATENCY_MODE", "auto").lower()
+if CDP_LATENCY_MODE not in LATENCY_MODES:
+    CDP_LATENCY_MODE = "auto"
+CDP_HIGH_RTT_MS = float(os.getenv("CDP_HIGH_RTT_MS", "5") or 5)
+CDP_PIPELINE_DEPTH = int(os.getenv("CDP_PIPELINE_DEPTH", "2") or 0)
+# CDP 연결일 때 메서드 호출 수/주고받은 바이트를 세어 실행 끝에 출력
+CDP_STATS = os.getenv("CDP_STATS", "1").lower() in {"1", "true", "yes"}
+CDP_COUNTER = CdpCounter()
+LATENCY_MODE = "direct"
+
+# 상세 페이지를 먼저 HTTP(서버 렌더링 HTML의 PRELOADED_STATE/JSON-LD)로 읽고, 필수 필드가 없을 때만 브라우저 사용
+HTTP_FAST_PATH = os.getenv("HTTP_FAST_PATH", "0").lower() in {"1", "true", "yes"}
+# 브라우저 밖 HTTP 요청 공용 클라이언트(keep-alive 풀, 호스트별 동시 요청 상한, 타임아웃/재시도)
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10") or 10)
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2") or 0)
+HTTP_PER_HOST_LIMIT = int(os.getenv("HTTP_PER_HOST_LIMIT", str(max(4, DETAIL_WORKERS))) or 4)
+HTTP_FETCHER = None
+
+# 페이지 번호 이동 시 URL 쿼리 파라미터로 강제 점프 시도 여부
+# 기본값은 비활성화(네이버는 URL 파라미터만으로 DOM이 바뀌지 않는 경우가 많음)
+PAGE_JUMP_BY_QUERY = os.getenv("PAGE_JUMP_BY_QUERY", "0").lower() in {"1", "true", "yes"}
+
+# 페이지 이동 과정 스크린샷 저장(디버깅 용도)
+# 기본값 비활성화: 요청에 따라 캡처 중단
+PAGINATION_DEBUG_SHOTS = os.getenv("PAGINATION_DEBUG_SHOTS", "0").lower() in {"1", "true", "yes"}
+
+# 리스트 page size: auto(기본, 80/60/40 중 스토어가 허용하는 최대값) | 고정값(예: 60) | 20(기존 동작)
+# 페이지 범위/그룹/파일명은 기존 size=20 기준 번호를 그대로 사용
+LISTING_PAGE_SIZE = os.getenv("LISTING_PAGE_SIZE", "auto")
+
+# 페이지네이션 전략: plan(기본, data-shp-filter_con 기반 최소 경로) | auto(기존 재시도 루프) | next_only('다음'만 반복)
+PAGINATION_STRATEGY = os.getenv("PAGINATION_STRATEGY", "plan").lower().strip()
+
+# 단계별 소요 시간 계측(기본 활성화). 상품별 기록은 JSONL로, 실행 종료 시 요약표 출력
+# 기본 경로는 git에서 제외된 state/ 아래(debug/는 저장소에 포함된 샘플 디렉터리)
+STAGE_TIMING = os.getenv("STAGE_TIMING", "1").lower() not in {"0", "false", "no"}
+TIMING_JSONL_PATH = Path(
+    os.getenv("TIMING_JSONL_PATH")
+    or (SCRIPT_DIR / "state" / "timings" / f"timings_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+)
+TIMER = StageTimer(TIMING_JSONL_PATH, enabled=STAGE_TIMING)
+
+# 오프라인 녹화/재생: off(기본) | record(HAR 저장) | replay(HAR로만 응답, 네트워크 차단)
+CRAWL_REPLAY_MODE = os.getenv("CRAWL_REPLAY_MODE", "off").lower().strip()
+CRAWL_REPLAY_DIR = Path(os.getenv("CRAWL_REPLAY_DIR") or (SCRIPT_DIR / "replay"))
+REPLAY = ReplayStore(CRAWL_REPLAY_DIR, CRAWL_REPLAY_MODE, seed=int(os.getenv("CRAWL_REPLAY_SEED", "0") or 0))
+
+# 폴백 셀렉터 체인: 최근 적중한 셀렉터부터 시도하고 학습한 순서를 실행 간 유지(포괄 셀렉터는 제외)
+SELECTOR_ADAPTIVE = os.getenv("SELECTOR_ADAPTIVE", "1").lower() not in {"0", "false", "no"}
+SELECTOR_STATS_PATH = Path(os.getenv("SELECTOR_STATS_PATH") or (SCRIPT_DIR / "state" / "selector_stats.json"))
+SELECTOR_STATS = None
+
+def debug_shot(page, label):
+    if not PAGINATION_DEBUG_SHOTS:
+        return
+    try:
+        ts = time.strftime("%Y%m%d_%H%M%S")
+        dbg = (SCRIPT_DIR / "debug")
+        dbg.mkdir(exist_ok=True)
+        path = dbg / f"pagination_{ts}_{label}.png"
+        page.screenshot(path=str(path), full_page=True)
+        print(f"Saved screenshot: {path}")
+    except Exception as exc:
+        print(f"Failed to take screenshot({label}): {exc}")
+
+# 파일을 읽거나 스레드를 띄우는 객체는 import가 아니라 처음 쓸 때 만든다(상세 워커 스레드에서도 한 번만)
+_RUNTIME_LOCK = threading.Lock()
+STEALTH_HELPER = None
+STEALTH_CHECKED = False
+
+
+def stealth_helper():
+    """Stealth instance created on first use (None when playwright_stealth is unavailable)."""
+    global STEALTH_HELPER, STEALTH_CHECKED
+    if not STEALTH_CHECKED:
+        with _RUNTIME_LOCK:
+            if not STEALTH_CHECKED:
+                try:
+                    from playwright_stealth import Stealth
+                except ImportError:
+                    print(
+                        "playwright_stealth 모듈에서 Stealth 클래스를 불러오지 못했습니다. "
+                        "탐지 회피 스크립트가 적용되지 않으니 chromium 환경에서는 추가 점검이 필요합니다."
+                    )
+                else:
+                    STEALTH_HELPER = Stealth()
+                STEALTH_CHECKED = True
+    return STEALTH_HELPER
+
+
+def crawl_state():
+    global CRAWL_STATE
+    if CRAWL_STATE is None:
+        with _RUNTIME_LOCK:
+            if CRAWL_STATE is None:
+                CRAWL_STATE = CrawlState(CRAWL_STATE_PATH)
+    return CRAWL_STATE
+
+
+def selector_stats():
+    global SELECTOR_STATS
+    if SELECTOR_STATS is None:
+        with _RUNTIME_LOCK:
+            if SELECTOR_STATS is None:
+                SELECTOR_STATS = SelectorStats(
+                    SELECTOR_STATS_PATH, timer=TIMER, enabled=SELECTOR_ADAPTIVE, catch_all=CATCH_ALL_SELECTORS
+                )
+    return SELECTOR_STATS
+
+
+def cdp_endpoint_registry():
+    global CDP_ENDPOINT_REGISTRY
+    if CDP_ENDPOINT_REGISTRY is None:
+        with _RUNTIME_LOCK:
+            if CDP_ENDPOINT_REGISTRY is None:
+                CDP_ENDPOINT_REGISTRY = EndpointRegistry(CDP_ENDPOINT_CACHE, timeout=CDP_PROBE_TIMEOUT)
+    return CDP_ENDPOINT_REGISTRY
+
+
+def http_fetcher():
+    """HTTP_FAST_PATH fetcher over the shared HTTP client (None when the fast path is off)."""
+    global HTTP_FETCHER
+    if HTTP_FAST_PATH and HTTP_FETCHER is None:
+        with _RUNTIME_LOCK:
+            if HTTP_FETCHER is None:
+                client = get_client(timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES, per_host=HTTP_PER_HOST_LIMIT)
+                HTTP_FETCHER = HttpProductFetcher(client)
+    return HTTP_FETCHER
+
+
+def _query_one(node, selector):
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    try:
+        return node.query_selector(selector)
+    except PlaywrightTimeoutError:
+        return None
+
+
+def _query_all(node, selector):
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    try:
+        return node.query_selector_all(selector)
+    except PlaywrightTimeoutError:
+        return []
+
+
+def first_available(node, selectors, chain=None):
+    element, _ = selector_stats().resolve(chain, selectors, functools.partial(_query_one, node))
+    return element
+
+
+def find_elements(page, selectors, chain=None):
+    elements, selector = selector_stats().resolve(chain, selectors, functools.partial(_query_all, page))
+    if elements:
+        log.debug("Selector '%s' matched %d elements.", selector, len(elements))
+        return elements
+    return []
+
+
+def save_debug_snapshot(page, prefix):
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    path = (SCRIPT_DIR / "debug")
+    path.mkdir(exist_ok=True)
+    out = path / f"{prefix}_{timestamp}.html"
+    try:
+        out.write_text(page.content(), encoding="utf-8")
+        print(f"Saved debug snapshot: {out}")
+    except Exception as exc:
+        print(f"Failed to save debug snapshot: {exc}")
+
+
+def save_debug_html(product_code, html_text, suffix):
+    path = (SCRIPT_DIR / "debug")
+    path.mkdir(exist_ok=True)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filename = path / f"{product_code}_{suffix}_{timestamp}.html"
+    try:
+        filename.write_text(html_text, encoding="utf-8")
+        print(f"[CONTENT][{product_code}] Saved debug HTML: {filename}")
+    except Exception as exc:
+        print(f"[CONTENT][{product_code}] Failed to save debug HTML: {exc}")
+
+
+def extract_price_from_text(raw_text):
+    match = re.search(r"([\d,]+)\s*원", raw_text)
+    if match:
+        return match.group(1).replace("\u200b", "").strip()
+    digits = re.sub(r"[^\d]", "", raw_text)
+    if not digits:
+        return "N/A"
+    try:
+        return "{:,}".format(int(digits))
+    except ValueError:
+        return "N/A"
+
+
+def has_numeric_chars(value):
+    if value is None:
+        return False
+    return bool(re.search(r"\d", str(value)))
+
+
+def normalize_price_value(value):
+    if value in (None, "", "N/A"):
+        return None
+    if isinstance(value, (int, float)):
+        if value <= 0:
+            return None
+        return int(value)
+    digits = re.sub(r"[^\d]", "", str(value))
+    if not digits:
+        return None
+    try:
+        numeric = int(digits)
+    except ValueError:
+        return None
+    return numeric if numeric > 0 else None
+
+
+def price_from_option_data(option_data):
+    if not option_data:
+        return None
+    candidates = []
+    for data in option_data.values():
+        prices = data.get('하위옵션가격') if isinstance(data, dict) else None
+        if not prices:
+            continue
+        for raw in prices:
+            normalized = normalize_price_value(raw)
+            if normalized:
+                candidates.append(normalized)
+    if not candidates:
+        return None
+    return min(candidates)
+
+
+# print 출력은 로거로 전달되어 백그라운드 스레드가 콘솔/log.txt(+JSONL)에 일괄 기록.
+# stdout 교체는 실행 진입(main/데몬)에서만 한다.
+LOGGING = None
+
+
+def start_logging():
+    global LOGGING
+    if LOGGING is None:
+        LOGGING = setup_logging(
+            LOG_FILE,
+            level=LOG_LEVEL,
+            jsonl_path=LOG_JSONL_PATH,
+            max_bytes=LOG_MAX_BYTES,
+            backup_count=LOG_BACKUP_COUNT,
+        )
+        atexit.register(LOGGING.stop)
+    return LOGGING
+
+
+# 리스트 시작 URL(로컬 mock 서버 등으로 교체 가능: CRAWL_LISTING_URL)
+DEFAULT_LISTING_URL = 'https://smartstore.naver.com/joypapa_/category/ALL?st=RECENT&dt=BIG_IMAGE&size=20'
+CRAWL_LISTING_URL = (os.getenv("CRAWL_LISTING_URL") or "").strip() or DEFAULT_LISTING_URL
+_listing_parts = urlsplit(CRAWL_LISTING_URL)
+base_url = urlunsplit((_listing_parts.scheme, _listing_parts.netloc, "", "", ""))
+
+
+def product_list_crawl(context, df, read_excel_path, seen_urls, **job):
+    for _ in iter_product_list_crawl(context, df, read_excel_path, seen_urls, **job):
+        pass
+
+
+def iter_product_list_crawl(context, df, read_excel_path, seen_urls, listing_url=None, start_page=None,
+                            last_page=None, only_pages=None, max_products=None):
+    """리스트 크롤링 본체. 리스트 페이지 하나(상세 수집 포함)를 끝낼 때마다 페이지 번호를 yield."""
+    from crawler.pagination import ListingPaginator
+
+    page = context.new_page()
+    apply_page_stealth(page)
+
+    raw_url = listing_url or CRAWL_LISTING_URL
+    max_products = MAX_PRODUCTS_TOTAL if max_products is None else max_products
+    shopname = raw_url.split('/')[3]
+    shopnumber = raw_url.split('/')[5].split('?')[0]
+    if not REPLAY.attach(page, "listing", f"{shopname}_{shopnumber}"):
+        page.close()
+        return
+    original_url = update_query_params(raw_url, page=None)
+    with TIMER.span("listing.goto"):
+        page.goto(original_url)
+        page.wait_for_load_state("load")
+    with TIMER.span("listing.networkidle"):
+        page.wait_for_load_state("networkidle")
+
+    global_start_page = CRAWL_START_PAGE
+    global_last_page = CRAWL_LAST_PAGE
+    # 디버그: 특정 페이지만 요청된 경우 범위를 해당 값으로 축소. 전역 CRAWL_ONLY_PAGES는 호출 측
+    # (배치/데몬 작업)이 범위를 전혀 지정하지 않았을 때만 적용
+    if start_page is None and last_page is None and only_pages is None:
+        only_pages = CRAWL_ONLY_PAGES
+    if start_page or last_page:
+        global_start_page = start_page or 1
+        global_last_page = last_page or global_start_page
+    if only_pages:
+        try:
+            global_start_page = min(only_pages)
+            global_last_page = max(only_pages)
+        except Exception:
+            pass
+
+    shop_key = f"{shopname}_{shopnumber}"
+    stop_codes = None
+    if INCREMENTAL_RUN:
+        # 증분 실행은 항상 최신(1페이지)부터 워터마크까지만 진행
+        global_start_page = 1
+        global_last_page = INCREMENTAL_MAX_PAGES
+        stop_codes = crawl_state().known_codes(shop_key)
+        print(f"증분 실행: {crawl_state().describe(shop_key)}")
+    run_newest_code = None
+    reached_watermark = False
+
+    home_dir = Path.home()
+    output_folder = home_dir / 'Desktop' / 'excel_output'
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    reached_total_limit = False
+
+    # 검증 모드: 특정 페이지의 첫 상품을 열어 기대 URL/이름 확인
+    verify_target_page = None
+    verify_expected_url = (os.getenv("VERIFY_FIRST_PRODUCT_URL") or "").strip() or None
+    verify_expected_name = (os.getenv("VERIFY_FIRST_PRODUCT_NAME") or "").strip() or None
+    try:
+        verify_target_page = int(os.getenv("VERIFY_TARGET_PAGE", "") or 0) or None
+    except Exception:
+        verify_target_page = None
+
+    # 더 큰 page size로 리스트 이동 횟수를 줄임(검증 모드는 기존 번호 그대로 확인해야 하므로 제외)
+    legacy_page_size = url_page_size(original_url)
+    page_size = legacy_page_size
+    if LISTING_PAGE_SIZE.strip() != str(legacy_page_size) and not verify_target_page:
+        with TIMER.span("listing.page_size"):
+            page_size, original_url = choose_page_size(
+                page, original_url, parse_size_setting(LISTING_PAGE_SIZE), legacy_size=legacy_page_size
+            )
+        print(f"리스트 page size: {page_size} (기존 {legacy_page_size} 기준 페이지 번호를 환산)")
+
+    paginator = ListingPaginator(
+        page,
+        original_url,
+        strategy=PAGINATION_STRATEGY,
+        page_jump_by_query=PAGE_JUMP_BY_QUERY,
+        timer=TIMER,
+        debug_shot=debug_shot,
+    )
+
+    def verify_first_product_on_page():
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        try:
+            # 첫 상품 링크 탐색
+            page.wait_for_selector("a[href*='/products/']", timeout=10000)
+            first_link = page.query_selector("a[href*='/products/']")
+            if not first_link:
+                print("검증 실패: 첫 상품 링크를 찾지 못했습니다.")
+                return False
+            href = first_link.get_attribute("href") or ""
+            first_link.click()
+            page.wait_for_load_state("load")
+            try:
+                page.wait_for_load_state("networkidle", timeout=10000)
+            except PlaywrightTimeoutError:
+                pass
+            final_url = page.url
+            print(f"검증용 이동 URL: {final_url}")
+            ok_url = True
+            if verify_expected_url:
+                ok_url = (verify_expected_url in final_url)
+            ok_name = True
+            if verify_expected_name:
+                try:
+                    content_text = page.inner_text("body")
+                except Exception:
+                    content_text = ""
+                ok_name = (verify_expected_name in content_text)
+            if ok_url and ok_name:
+                print("검증 성공: 기대 URL/이름과 일치합니다.")
+                return True
+            else:
+                print(f"검증 결과: URL일치={ok_url}, 이름일치={ok_name}")
+                return False
+        except Exception as exc:
+            print(f"검증 중 예외: {exc}")
+            return False
+
+    # 지정된 페이지만 크롤링하도록 제한(있을 경우)
+    only_pages_set = set(only_pages) if only_pages and not INCREMENTAL_RUN else None
+
+    for start_page in range(global_start_page, global_last_page + 1, 10):
+        last_page = min(start_page + 9, global_last_page)
+
+        # 이 그룹(10페이지 묶음)에 처리할 페이지가 없으면 건너뜀
+        if only_pages_set is not None:
+            group_pages = set(range(start_page, last_page + 1))
+            group_target_pages = sorted(group_pages & only_pages_set)
+            if not group_target_pages:
+                print(f"Skip page group {start_page}-{last_page} (no target pages in CRAWL_ONLY_PAGES)")
+                continue
+        else:
+            group_target_pages = list(range(start_page, last_page + 1))
+
+        # 기존 번호 → 실제 page size의 (페이지, 상품 구간); 같은 실제 페이지는 한 번만 이동
+        page_entries = map_legacy_pages(group_target_pages, page_size, legacy_size=legacy_page_size)
+
+        # 그룹 내 최초 타겟 페이지로 이동
+        first_target = page_entries[0][0]
+        if not paginator.go_to_page_number(first_target):
+            print(f"페이지 {start_page} 이동에 실패했습니다. 다음 그룹으로 넘어갑니다.")
+            continue
+
+        current_actual_page = None
+        failed_actual_page = None
+        for actual_page, slice_start, slice_end, page_number in page_entries:
+            if actual_page == failed_actual_page:
+                continue
+            if actual_page != current_actual_page:
+                if not paginator.go_to_page_number(actual_page):
+                    print(f"페이지 {page_number} 이동에 실패하여 건너뜁니다.")
+                    failed_actual_page = actual_page
+                    continue
+                current_actual_page = actual_page
+            # 검증 모드: 대상 페이지에서 첫 상품 열어 확인 후 종료
+            if verify_target_page and page_number == verify_target_page:
+                ok = verify_first_product_on_page()
+                print(f"VERIFY_RESULT: page={page_number}, ok={ok}")
+                return
+            rows_before = len(df)
+            with log_context(shop=shopname, page=page_number):
+                df, _, watermark_hit = crawl_page(
+                    page, df, seen_urls, product_slice=(slice_start, slice_end), stop_codes=stop_codes
+                )
+            print(f"Completed page {page_number}")
+            yield page_number
+            # 1페이지 맨 앞 상품부터 수집했을 때만 새 워터마크 후보로 사용
+            if run_newest_code is None and page_number == 1 and len(df) > rows_before:
+                run_newest_code = product_code_from_url(df['Product_URL'].iloc[rows_before])
+            # 리스트가 밀려 이미 본 URL이 다시 나온 것(중복)은 워터마크가 아니므로 계속 진행
+            if INCREMENTAL_RUN and watermark_hit:
+                reached_watermark = True
+                print(f"워터마크 도달: 페이지 {page_number}에서 증분 수집을 종료합니다.")
+                break
+            if max_products and len(df) >= max_products:
+                df = df.iloc[:max_products]
+                reached_total_limit = True
+                print(f"Reached MAX_PRODUCTS_TOTAL={max_products}, stopping after page {page_number}.")
+                break
+
+        if INCREMENTAL_RUN and len(df) == 0:
+            # 새 상품이 없으면 빈 엑셀을 만들지 않는다(실행 기록은 아래 finish_run에서 남김)
+            print("증분 실행: 새 상품이 없어 엑셀을 기록하지 않습니다.")
+        else:
+            export_records(
+                df,
+                read_excel_path,
+                output_folder / f'dolce_{shopname}_{shopnumber}_{start_page}_{last_page}',
+                seen_urls,
+                shop_key,
+                newest_code=run_newest_code,
+            )
+        print(f"Processed pages {start_page} to {last_page}")
+        if reached_total_limit:
+            print("MAX_PRODUCTS_TOTAL reached; ending crawl.")
+            break
+        if reached_watermark:
+            break
+
+    if not CRAWL_SHARD_OUTPUT:
+        crawl_state().finish_run(shop_key)
+    page.close()
+
+
+# export_records가 엑셀을 기록할 때마다 호출되는 콜백(데몬 모드에서 작업별 출력 경로 수집)
+EXPORT_HOOKS = []
+
+
+def export_records(df, read_excel_path, base_path, seen_urls, shop_key, newest_code=None):
+    """Write {base}.xlsx (template) + {base}_second.xlsx and update crawl state.
+
+    Shard workers (CRAWL_SHARD_OUTPUT) only persist the record buffer; the coordinator
+    merges the shards and does the Excel/state writes once.
+    """
+    if CRAWL_SHARD_OUTPUT:
+        write_shard_records(df, CRAWL_SHARD_OUTPUT)
+        return
+    base_path = Path(base_path)
+    write_excel_path = base_path.with_name(base_path.name + '.xlsx')
+    shutil.copy(read_excel_path, write_excel_path)
+    second_excel_path = base_path.with_name(base_path.name + '_second.xlsx')
+    write_to_excel(df, write_excel_path, seen_urls)
+    write_to_excel2(df, second_excel_path)
+    for hook in EXPORT_HOOKS:
+        hook([write_excel_path, second_excel_path], len(df))
+    crawl_state().record_export(
+        shop_key,
+        [product_code_from_url(url) for url in df['Product_URL']],
+        newest_code=newest_code,
+    )
+    crawl_state().save()
+
+
+def run_sharded(df_columns, read_excel_path):
+    """CRAWL_SHARDS 코디네이터: 페이지(또는 입력 상품)를 연속 구간으로 나눠 워커 프로세스를 실행하고 병합."""
+    shopname = CRAWL_LISTING_URL.split('/')[3]
+    shopnumber = CRAWL_LISTING_URL.split('/')[5].split('?')[0]
+    if CRAWL_INPUT_FILE:
+        items = load_product_inputs(CRAWL_INPUT_FILE, f"{base_url}/{shopname}/products")
+        chunks = split_contiguous([url for url, _ in items], CRAWL_SHARDS)
+        shard_envs = []
+        for index, chunk in enumerate(chunks):
+            input_path = CRAWL_SHARD_DIR / f"shard_{index}_input.txt"
+            input_path.parent.mkdir(parents=True, exist_ok=True)
+            input_path.write_text("\n".join(chunk) + "\n", encoding="utf-8")
+            shard_envs.append({"CRAWL_INPUT_FILE": input_path})
+        base_name = f'dolce_{shopname}_{shopnumber}_input_{Path(CRAWL_INPUT_FILE).stem}'
+    else:
+        pages = CRAWL_ONLY_PAGES or list(range(CRAWL_START_PAGE, CRAWL_LAST_PAGE + 1))
+        chunks = split_contiguous(sorted(set(pages)), CRAWL_SHARDS)
+        shard_envs = [{"CRAWL_ONLY_PAGES": ",".join(str(number) for number in chunk)} for chunk in chunks]
+        base_name = f'dolce_{shopname}_{shopnumber}_{min(pages)}_{max(pages)}'
+    if BROWSER_PROFILE:
+        # 샤드 프로세스마다 자기 프로필(캐시)을 이어서 쓴다
+        for index, overrides in enumerate(shard_envs):
+            overrides["PLAYWRIGHT_USER_DATA_DIR"] = BROWSER_PROFILE.for_worker(f"shard-{index}").user_data_dir
+    print(f"샤딩 실행: 워커 {len(shard_envs)}개, 구간 {[len(chunk) for chunk in chunks]}")
+
+    # 워커는 런처 기본값까지 담긴 현재 환경변수를 물려받아 엔진 모듈을 바로 실행
+    shards = run_shards(
+        [sys.executable, "-m", "crawler.engine"], build_shards(CRAWL_SHARD_DIR, shard_envs), cwd=SCRIPT_DIR
+    )
+    df = merge_shard_records(shards, df_columns)
+    if MAX_PRODUCTS_TOTAL and len(df) > MAX_PRODUCTS_TOTAL:
+        df = df.iloc[:MAX_PRODUCTS_TOTAL]
+    output_folder = Path.home() / 'Desktop' / 'excel_output'
+    output_folder.mkdir(parents=True, exist_ok=True)
+    seen_urls = set(df['Product_URL'])
+    export_records(df, read_excel_path, output_folder / base_name, seen_urls, f"{shopname}_{shopnumber}")
+    failed = [shard for shard in shards if shard.returncode != 0]
+    if failed:
+        # 일부 구간이 빠진 결과이므로 실행 완료로 기록하지 않는다(기록된 상품 코드는 유지)
+        print("=" * 60)
+        print(f"[경고] 샤드 {len(failed)}개 실패 — 결과 엑셀에 해당 구간 상품이 빠져 있습니다.")
+        for shard in failed:
+            print(f"  샤드 {shard.index} (exit={shard.returncode}): {shard.console_path}")
+        print("=" * 60)
+    else:
+        crawl_state().finish_run(f"{shopname}_{shopnumber}")
+    print(f"샤딩 완료: 상품 {len(df)}개 기록, 실패 샤드 {[shard.index for shard in failed] or '없음'}")
+
+
+def run_batch(context, df, read_excel_path):
+    """CRAWL_BATCH_MANIFEST 모드: 작업별 리스트 크롤링을 한 브라우저 컨텍스트에서 라운드로빈으로 진행."""
+    jobs = load_manifest(CRAWL_BATCH_MANIFEST)
+    generators = []
+    for job in jobs:
+        generators.append((
+            job.name,
+            iter_product_list_crawl(
+                context,
+                df.copy(),
+                read_excel_path,
+                set(),
+                listing_url=job.url,
+                start_page=job.start_page,
+                last_page=job.last_page,
+                only_pages=job.pages,
+            ),
+        ))
+    steps = round_robin(generators)
+    print("배치 결과: " + ", ".join(f"{name}={count}페이지" for name, count in steps.items()))
+
+
+def crawl_product_inputs(df, read_excel_path, seen_urls):
+    """CRAWL_INPUT_FILE 모드: 목록의 상품만 상세 수집해 리스트 모드와 같은 엑셀 2종을 기록."""
+    import pandas as pd
+    shopname = CRAWL_LISTING_URL.split('/')[3]
+    shopnumber = CRAWL_LISTING_URL.split('/')[5].split('?')[0]
+    shop_key = f"{shopname}_{shopnumber}"
+    items = load_product_inputs(CRAWL_INPUT_FILE, f"{base_url}/{shopname}/products")
+
+    known_codes = frozenset() if CRAWL_INPUT_RECRAWL else crawl_state().known_codes(shop_key)
+    pending = []
+    for product_url, product_code in items:
+        if product_url in seen_urls or product_code in known_codes:
+            print(f"이미 수집한 상품이라 건너뜁니다: {product_code}")
+            continue
+        pending.append((product_url, product_code, None, ""))
+    if MAX_PRODUCTS_TOTAL:
+        pending = pending[:MAX_PRODUCTS_TOTAL]
+    print(f"입력 모드: 상세 수집 {len(pending)}개 (워커 {DETAIL_WORKERS}개)")
+
+    # 워커마다 백엔드의 브라우저를 연다(CDP 풀이면 엔드포인트에 고르게 붙고, 배정에서 빠진
+    # 엔드포인트의 워커는 다른 곳으로 옮겨 붙는다). 워커 1개면 현재 컨텍스트에서 바로 처리
+    results = run_detail_workers(
+        pending,
+        lambda session, item: session.run(crawl_detail_item, item),
+        lambda: BACKEND.worker(setup=prepare_context),
+        worker_count=BACKEND.worker_count(DETAIL_WORKERS),
+        current=ContextSession(context),
+    )
+    for (product_url, *_), product_df in zip(pending, results):
+        if product_df is None:
+            continue
+        seen_urls.add(product_url)
+        df = pd.concat([df, product_df], ignore_index=True)
+
+    output_folder = Path.home() / 'Desktop' / 'excel_output'
+    output_folder.mkdir(parents=True, exist_ok=True)
+    input_stem = Path(CRAWL_INPUT_FILE).stem
+    export_records(
+        df, read_excel_path, output_folder / f'dolce_{shopname}_{shopnumber}_input_{input_stem}', seen_urls, shop_key
+    )
+    if not CRAWL_SHARD_OUTPUT:
+        crawl_state().finish_run(shop_key)
+    print(f"입력 모드 완료: {len(df)}/{len(pending)}개 기록")
+    return df
+
+
+def crawl_detail_item(browser_context, item):
+    """run_detail_workers handle: item = (product_url, product_code, title, price); title None = read from detail."""
+    product_url, product_code, title, price = item
+    with log_context(product_code=product_code):
+        TIMER.begin_product(product_code, url=product_url)
+        try:
+            product_df = crawl_product_detail(
+                None, title, price, product_url, product_code, browser_context=browser_context
+            )
+        except Exception:
+            TIMER.end_product(status="error")
+            raise
+        TIMER.end_product(status="ok" if product_df is not None else "skipped")
+    return product_df
+
+
+def ensure_product_detail_visible(page):
+    """Ensure the SmartStore 상세정보 영역 is expanded so selectors become available."""
+    toggle_selectors = [
+        "button[data-resize-on-click='true']",
+        "button:has-text('상세정보 펼치기')",
+        "button:has-text('상세정보 더보기')",
+    ]
+    for selector in toggle_selectors:
+        try:
+            toggle = page.query_selector(selector)
+        except Exception:
+            toggle = None
+        if not toggle:
+            continue
+        try:
+            aria_expanded = (toggle.get_attribute("aria-expanded") or "").lower()
+        except Exception:
+            aria_expanded = ""
+        try:
+            label = (toggle.inner_text() or "").strip()
+        except Exception:
+            label = ""
+        need_expand = (
+            aria_expanded == "false"
+            or ("펼치기" in label and "접기" not in label)
+            or ("더보기" in label and "접기" not in label)
+        )
+        if need_expand:
+            try:
+                toggle.scroll_into_view_if_needed()
+            except Exception:
+                pass
+            toggle.click()
+            page.wait_for_load_state("networkidle")
+            page.wait_for_timeout(500)
+        break
+    for _ in range(4):
+        try:
+            section = page.query_selector("#INTRODUCE")
+        except Exception:
+            section = None
+        if section:
+            try:
+                section.scroll_into_view_if_needed()
+            except Exception:
+                try:
+                    page.evaluate("document.getElementById('INTRODUCE')?.scrollIntoView({behavior: 'instant', block: 'start'})")
+                except Exception:
+                    pass
+            try:
+                section.wait_for_element_state("visible", timeout=2000)
+            except Exception:
+                pass
+            break
+        try:
+            page.mouse.wheel(0, 1200)
+        except Exception:
+            try:
+                page.evaluate("window.scrollBy(0, document.body.scrollHeight / 3)")
+            except Exception:
+                pass
+        page.wait_for_timeout(500)
+    try:
+        page.wait_for_selector("#INTRODUCE", timeout=5000)
+    except Exception:
+        pass
+
+
+def find_content_element(page, product_code, extracted=None):
+    if extracted is not None and extracted.selector("content"):
+        selector = extracted.selector("content")
+        print(f"Using content selector '{selector}' for {product_code}")
+        return selector
+
+    time.sleep(1)
+    ensure_product_detail_visible(page)
+
+    def probe(selector):
+        log.debug("[CONTENT][%s] Trying selector: %s", product_code, selector)
+        return page.query_selector(selector) is not None
+
+    _, selector = selector_stats().resolve("detail.content", CONTENT_SELECTORS, probe)
+    if selector:
+        print(f"Using content selector '{selector}' for {product_code}")
+        return selector
+
+    print(f"[CONTENT][{product_code}] 상품 상세 컨텐츠 영역을 찾지 못했습니다. 스냅샷 저장 후 None 반환")
+    save_debug_snapshot(page, f"content_{product_code}")
+    return None
+
+
+def crawl_page(page, df, seen_urls, product_slice=None, stop_codes=None):
+    """Collect one listing page. Returns (df, duplicate_detected, watermark_hit); watermark_hit means a
+    stop_codes product (incremental run) was reached, duplicate_detected only a repeated URL."""
+    import pandas as pd
+    with TIMER.span("listing.wait_products"):
+        time.sleep(1)
+        page.wait_for_load_state("networkidle")
+        # 상품 링크 등장 대기 (동적 로딩 대비)
+        try:
+            page.wait_for_selector("a[href*='/products/']", timeout=10000)
+        except Exception:
+            pass
+    with TIMER.span("listing.find_products"):
+        if LATENCY_MODE == "batched":
+            products = listing_cards(page)
+        else:
+            products = find_elements(page, LISTING_CARD_SELECTORS, chain="listing.product_cards")
+        # 일반 폴백 셀렉터(div:has(a[href*='/products/']))는 중첩된 조상 요소까지 잡으므로
+        # 상품 URL 기준으로 중복을 빼야 아래 기존(size=20) 페이지 구간이 실제 상품 순서와 맞는다
+        products = unique_cards(extract_product_details(product) for product in products)
+    if not products:
+        print("상품 리스트 셀렉터가 모두 실패했습니다. HTML 스냅샷을 저장합니다.")
+        save_debug_snapshot(page, "product_list")
+    elif product_slice:
+        # 큰 page size에서 기존(size=20) 페이지 하나에 해당하는 구간만 처리
+        products = products[product_slice[0]:product_slice[1]]
+    duplicate_detected = False
+    watermark_hit = False
+
+    worker_count = BACKEND.worker_count(DETAIL_WORKERS) if BACKEND is not None else 1
+    if worker_count > 1 and products:
+        return crawl_page_with_workers(products, df, seen_urls, stop_codes, worker_count)
+
+    prefetcher = None
+    # 탭 선행 로딩은 batched 모드에서만(HTTP 경로/녹화·재생은 탭을 직접 열어야 하므로 제외)
+    if LATENCY_MODE == "batched" and CDP_PIPELINE_DEPTH and not HTTP_FAST_PATH and not REPLAY.enabled:
+        product_urls = [details[2] for details in products if details[2] != "N/A"]
+        if MAX_PRODUCTS_PER_PAGE:
+            product_urls = product_urls[:MAX_PRODUCTS_PER_PAGE]
+        prefetcher = TabPrefetcher(context, product_urls, CDP_PIPELINE_DEPTH, prepare=apply_page_stealth)
+
+    try:
+        for i, details in enumerate(products):
+            if stop_codes and details[3] in stop_codes:
+                # 증분 실행: 이미 기록한 상품에 도달하면 상세 페이지를 열지 않고 종료
+                print(f"이전 실행에서 기록한 상품 도달: {details[3]}")
+                watermark_hit = True
+                break
+            product_data = get_product_data(page, None, i, len(products), details=details, prefetcher=prefetcher)
+            if product_data is None:
+                print(f"Skipping product at index {i} as get_product_data returned None.")
+                continue
+
+            product_url = product_data['Product_URL'][0]
+
+            if product_url == "N/A" or not product_url:
+                print("상품 URL 추출 실패로 항목을 건너뜁니다.")
+                continue
+
+            if product_url in seen_urls:
+                print('Duplicate product detected: ', product_url)
+                duplicate_detected = True
+                break
+            else:
+                seen_urls.add(product_url)
+
+            df = pd.concat([df, product_data], ignore_index=True)
+
+            if MAX_PRODUCTS_PER_PAGE and (i + 1) >= MAX_PRODUCTS_PER_PAGE:
+                print(f"Reached MAX_PRODUCTS_PER_PAGE={MAX_PRODUCTS_PER_PAGE}, stop crawling this page.")
+                break
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+    return df, duplicate_detected, watermark_hit
+
+
+def crawl_page_with_workers(products, df, seen_urls, stop_codes, worker_count):
+    """Detail pages of one listing page spread over the backend's workers (every CDP pool endpoint,
+    or DETAIL_WORKERS local browsers). Results are appended in listing order."""
+    import pandas as pd
+    duplicate_detected = False
+    watermark_hit = False
+    items = []
+    for i, (title, price, product_url, product_code) in enumerate(products):
+        if stop_codes and product_code in stop_codes:
+            # 증분 실행: 이미 기록한 상품에 도달하면 그 앞 상품까지만 수집
+            print(f"이전 실행에서 기록한 상품 도달: {product_code}")
+            watermark_hit = True
+            break
+        if product_url in seen_urls:
+            print('Duplicate product detected: ', product_url)
+            duplicate_detected = True
+            break
+        title = title.replace('\xa0', ' ')
+        print(f"Product {i + 1}/{len(products)}: {title}, {price} won, {product_url}")
+        items.append((product_url, product_code, title, price))
+        if MAX_PRODUCTS_PER_PAGE and len(items) >= MAX_PRODUCTS_PER_PAGE:
+            print(f"Reached MAX_PRODUCTS_PER_PAGE={MAX_PRODUCTS_PER_PAGE}, stop crawling this page.")
+            break
+
+    if items:
+        print(f"상세 수집 {len(items)}개를 워커 {min(worker_count, len(items))}개로 나눠 진행합니다.")
+    results = run_detail_workers(
+        items,
+        lambda session, item: session.run(crawl_detail_item, item),
+        lambda: BACKEND.worker(setup=prepare_context),
+        worker_count=worker_count,
+    )
+    for (product_url, *_), product_df in zip(items, results):
+        if product_df is None:
+            continue
+        seen_urls.add(product_url)
+        df = pd.concat([df, product_df], ignore_index=True)
+    return df, duplicate_detected, watermark_hit
+
+
+def unique_cards(cards):
+    """Card details in listing order, one per product URL (cards without a product URL are dropped)."""
+    unique = []
+    seen = set()
+    dropped = 0
+    for details in cards:
+        product_url = details[2]
+        if not product_url or product_url == "N/A" or product_url in seen:
+            dropped += 1
+            continue
+        seen.add(product_url)
+        unique.append(details)
+    if dropped:
+        print(f"중복/URL 없는 상품 카드 {dropped}개를 제외했습니다(남은 카드 {len(unique)}개).")
+    return unique
+
+
+def listing_cards(page):
+    """Batched listing read: every product card's fields in a single evaluate."""
+    root, cards = CARD_SPEC.run_many(page, LISTING_CARD_SELECTORS, selector_stats())
+    if root:
+        print(f"Selector '{root}' matched {len(cards)} elements.")
+    return [card_details(card) for card in cards]
+
+
+def extract_product_details(product):
+    if isinstance(product, tuple):
+        # batched 모드: listing_cards()가 이미 읽어 둔 카드 값
+        return product
+    return card_details(CARD_SPEC.run(product, selector_stats()))
+
+
+def card_details(card):
+    """(title, price, product_url, product_code) from a CARD_SPEC result."""
+    card_text = card["text"] or ""
+    title = card["title"] or (card_text.splitlines()[0].strip() if card_text else "N/A")
+    price = extract_price_from_text(card["price"] or card_text)
+
+    raw_url = card["url"]
+    if raw_url and raw_url.startswith("/"):
+        product_url = base_url + raw_url
+    else:
+        product_url = raw_url
+
+    product_code = product_url.split('/')[-1] if product_url else "N/A"
+    return title, price, product_url or "N/A", product_code
+
+
+def shipping_fee_from_text(element_text):
+    if "무료배송" in element_text:
+        print("배송비: 무료배송")
+        return "0"
+    digits = re.findall(r"[\d,]+", element_text)
+    if digits:
+        value = digits[0].replace(",", "")
+        print(f"배송비: {value}")
+        return value
+    return None
+
+
+def original_shipping_fee(page, extracted=None):
+    log.debug("Current page URL: %s", page.url)
+
+    if extracted is not None and extracted["shipping_fee"]:
+        value = shipping_fee_from_text(extracted["shipping_fee"])
+        if value:
+            return value
+
+    def probe(selector):
+        element = page.query_selector(selector)
+        if not element:
+            return None
+        return shipping_fee_from_text(element.inner_text().strip())
+
+    value, _ = selector_stats().resolve("detail.shipping_fee", SHIPPING_SELECTORS, probe)
+    if value:
+        return value
+
+    body_text = ""
+    try:
+        body_text = page.inner_text("body")
+    except Exception:
+        pass
+
+    if "무료배송" in body_text:
+        print("배송비: 무료배송(본문 탐지)")
+        return "0"
+
+    for pattern in [r"배송비\s*[:：]?\s*([\d,]+)\s*원", r"반품배송비\s*[:：]?\s*([\d,]+)\s*원"]:
+        match = re.search(pattern, body_text)
+        if match:
+            value = match.group(1).replace(",", "")
+            print(f"배송비(본문 탐지): {value}")
+            return value
+
+    print("Shipping fee element not found, 저장 후 N/A 반환")
+    save_debug_snapshot(page, "shipping_fee")
+    return "N/A"
+
+
+def option_crawl(page):
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    option_data = {}
+
+    option_triggers = page.query_selector_all('[data-shp-area$="optselect"]')
+    if not option_triggers:
+        option_triggers = page.query_selector_all(
+            'a[role="button"][aria-haspopup="listbox"], button[aria-haspopup="listbox"]'
+        )
+        if option_triggers:
+            print("Fallback option selector 사용 (listbox 버튼 기반)")
+
+    option_index = 0
+    while True:
+        current_triggers = page.query_selector_all('[data-shp-area$="optselect"]')
+        if not current_triggers:
+            current_triggers = option_triggers
+
+        if option_index >= len(current_triggers):
+            break
+
+        trigger = current_triggers[option_index]
+        data_area = (trigger.get_attribute("data-shp-area") or "")
+        if data_area and "optselect" not in data_area:
+            option_index += 1
+            continue
+
+        option_index += 1
+        category = trigger.get_attribute("aria-label") or trigger.inner_text().strip()
+        if not category or category in {"선택", ""}:
+            category = f"옵션{option_index}"
+
+        try:
+            trigger.click()
+        except PlaywrightTimeoutError:
+            print(f"{category} 클릭 실패")
+            continue
+
+        try:
+            dropdown = page.wait_for_selector("ul[role=\"listbox\"]", timeout=15000)
+        except PlaywrightTimeoutError:
+            print(f"{category} 옵션 리스트 로드 실패")
+            continue
+
+        items = dropdown.query_selector_all("[role='option'], a, li")
+        current_options = []
+        current_prices = []
+
+        for item in items:
+            option_text = item.inner_text().strip()
+            if not option_text:
+                continue
+            price_match = re.search(r'\(([+\-]?[\d,]+)원\)', option_text)
+            if price_match:
+                price_value = int(price_match.group(1).replace(',', ''))
+                name = re.sub(r'\(([+\-]?[\d,]+)원\)', '', option_text).strip()
+            else:
+                price_value = 0
+                name = option_text
+
+            current_options.append(name)
+            current_prices.append(price_value)
+
+        if not current_options:
+            print(f"{category} 옵션 정보를 찾지 못했습니다.")
+            continue
+
+        option_data[category] = {
+            '하위옵션제목': current_options,
+            '하위옵션가격': current_prices,
+        }
+
+        selectable = []
+        for item in items:
+            try:
+                disabled = item.evaluate("node => node.getAttribute('aria-disabled') === 'true'")
+            except Exception:
+                disabled = False
+            if not disabled:
+                selectable.append(item)
+
+        if selectable:
+            random.choice(selectable).click()
+            time.sleep(0.5)
+
+    return option_data
+
+
+def image_crawl(page, extracted=None):
+    if extracted is not None:
+        image_srcs = (extracted["main_images"] or []) + (extracted["thumbnails"] or extracted["all_images"] or [])
+    else:
+        main_candidates = find_elements(page, IMAGE_MAIN_SELECTORS, chain="image.main")
+        thumbnail_elements = find_elements(page, IMAGE_THUMBNAIL_SELECTORS, chain="image.thumbnails")
+        if not thumbnail_elements:
+            thumbnail_elements = page.query_selector_all("img[src*='shop-phinf']")
+        image_srcs = [element.get_attribute("src") for element in (main_candidates or []) + (thumbnail_elements or [])]
+
+    if not image_srcs:
+        try:
+            fallback = page.wait_for_selector(
+                'xpath=//*[@id="content"]//img[contains(@src,"shop-phinf")]',
+                timeout=5000,
+            )
+            if fallback:
+                image_srcs = [fallback.get_attribute("src")]
+        except Exception:
+            pass
+
+    if not image_srcs:
+        print("No images found on the page.")
+        return [], []
+
+    thumbnail_urls = [src.split("?")[0] for src in image_srcs if src]
+    return group_image_urls(thumbnail_urls)
+
+
+def group_image_urls(thumbnail_urls):
+    """중복 제거 후 파일명 접두 숫자가 가장 흔한 묶음(상품 이미지)과 나머지로 분리."""
+    seen = set()
+    unique_urls = []
+    for url in thumbnail_urls:
+        if url in seen:
+            continue
+        seen.add(url)
+        unique_urls.append(url)
+
+    if not unique_urls:
+        print("Image URLs could not be extracted.")
+        return [], []
+
+    def url_prefix(u):
+        filename = u.split("/")[-1]
+        digits = "".join(ch for ch in filename if ch.isdigit())
+        return digits[:3] if digits else filename[:3]
+
+    prefixes = [url_prefix(url) for url in unique_urls]
+    counts = Counter(prefixes)
+    if not counts:
+        return unique_urls, []
+
+    most_common = counts.most_common(1)[0][0]
+    common_urls = [url for url, prefix in zip(unique_urls, prefixes) if prefix == most_common]
+    different_urls = [url for url, prefix in zip(unique_urls, prefixes) if prefix != most_common]
+
+    return common_urls, different_urls
+
+
+def dump_content_html(product_code, html_text, label):
+    if not DUMP_CONTENT_HTML:
+        return
+    if not html_text:
+        return
+    try:
+        DUMP_CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = DUMP_CONTENT_DIR / f"{product_code}_{label}_{timestamp}.html"
+        filename.write_text(html_text, encoding="utf-8")
+        print(f"[CONTENT][{product_code}] Saved content output ({label}): {filename}")
+    except Exception as exc:
+        print(f"[CONTENT][{product_code}] Failed to save content output: {exc}")
+
+
+def content_crawl(page, product_code, element_selector):
+    import pandas as pd
+    time.sleep(1)
+    page.wait_for_load_state("load")
+
+    if not element_selector:
+        log_content_debug(product_code, "No element selector available.")
+        return None
+
+    element = page.query_selector(element_selector)
+    if element is None:
+        log_content_debug(product_code, f"Selector '{element_selector}' resolved to None.")
+        save_debug_snapshot(page, f"content_missing_{product_code}")
+        return None
+
+    raw_content = element.inner_html()
+    if not (raw_content or "").strip():
+        log_content_debug(product_code, "Element inner_html is empty; capturing page snapshot.")
+        save_debug_snapshot(page, f"content_empty_{product_code}")
+        return None
+    final_html = finish_content_html(product_code, raw_content)
+    if final_html is None:
+        return None
+    return pd.DataFrame({"Content": [final_html]})
+
+
+def finish_content_html(product_code, raw_content):
+    final_html, final_label = clean_content_html(raw_content, product_code)
+    if final_label == "fallback_failed":
+        save_debug_html(product_code, raw_content, "fallback_failed")
+    if final_html is None:
+        return None
+
+    if WRAP_CONTENT_HTML:
+        final_html = wrap_html_document(final_html)
+
+    dump_content_html(product_code, final_html, final_label)
+    log_content_debug(product_code, "Returning cleaned HTML content.")
+    return final_html
+
+
+def return_shipping_fee(total_price):
+    fee = total_price * 0.25
+    if fee > 200000:
+        fee = 200000
+    return fee
+
+
+def title_edit(title):
+    title_split = title.split(' ')
+    title_split = list(dict.fromkeys(title_split))
+    if len(title_split) >= 2:
+        title_split[-1], title_split[-2] = title_split[-2], title_split[-1]
+    title = ' '.join(title_split)
+    return title
+
+
+def get_product_data(page, product, i, num_products, details=None, prefetcher=None):
+    title, price, product_url, product_code = details or extract_product_details(product)
+
+    title = title.replace('\xa0', ' ')
+
+    print(f"Product {i + 1}/{num_products}: {title}, {price} won, {product_url}")
+
+    with log_context(product_code=product_code):
+        TIMER.begin_product(product_code, index=i + 1, url=product_url)
+        try:
+            product_df = crawl_product_detail(page, title, price, product_url, product_code, prefetcher=prefetcher)
+        except Exception:
+            TIMER.end_product(status="error")
+            raise
+        TIMER.end_product(status="ok" if product_df is not None else "skipped")
+    return product_df
+
+
+@functools.lru_cache(maxsize=1)
+def load_category_index():
+    """네이버 카테고리 엑셀을 한 번만 읽어 (소분류→번호, 세분류→번호) dict로 보관."""
+    import pandas as pd
+    if not NAVER_CATEGORY_PATH.exists():
+        raise FileNotFoundError(f"카테고리 파일을 찾을 수 없습니다: {NAVER_CATEGORY_PATH}")
+    category_df = pd.read_excel(NAVER_CATEGORY_PATH, header=None)
+    small_category_dict = pd.Series(category_df[0].values, index=category_df[3]).to_dict()
+    tiny_category_dict = pd.Series(category_df[0].values, index=category_df[4]).to_dict()
+    return small_category_dict, tiny_category_dict
+
+
+def category_number(category):
+    """'대>중>소>세' 카테고리 문자열을 가장 하위 분류 기준 네이버 카테고리 번호로 변환."""
+    small_category_dict, tiny_category_dict = load_category_index()
+    if category is not None:
+        print(f"Category: {category}")
+        category_list = category.split(">")
+        small_category = category_list[2].strip() if len(category_list) > 2 else None
+        tiny_category = category_list[3].strip() if len(category_list) > 3 else None
+    else:
+        small_category = None
+        tiny_category = None
+
+    if tiny_category is not None:
+        smallest_category = tiny_category
+        smallest_category_type = 'tiny'
+        naver_category_number = tiny_category_dict.get(tiny_category)
+    elif small_category is not None:
+        smallest_category = small_category
+        smallest_category_type = 'small'
+        naver_category_number = small_category_dict.get(small_category)
+    else:
+        smallest_category = None
+        smallest_category_type = None
+        naver_category_number = None
+
+    print(
+        f"Smallest Category('{smallest_category_type}') : {smallest_category}, Naver category number: {naver_category_number}")
+    return naver_category_number
+
+
+def http_product_detail(title, price, product_url, product_code):
+    """HTTP_FAST_PATH: 브라우저 없이 상세 레코드 생성. 필수 필드가 빠지면 None(브라우저 경로로 폴백)."""
+    fetcher = http_fetcher()
+    with TIMER.span("http_fetch"):
+        html_text = fetcher.fetch(product_url)
+    if html_text is None:
+        fetcher.count("fallbacks")
+        return None
+    with TIMER.span("http_parse"):
+        fields = parse_product_html(html_text)
+    if title:
+        fields["title"] = title
+    if has_numeric_chars(price):
+        fields["price"] = price
+    elif not fields["price"]:
+        option_price = price_from_option_data(fields["options"])
+        fields["price"] = f"{option_price:,}" if option_price else None
+    else:
+        fields["price"] = f"{fields['price']:,}"
+        print(f"Price fallback via preloaded_state: {fields['price']}")
+    if fields["content_html"]:
+        try:
+            fields["content_html"] = finish_content_html(product_code, fields["content_html"])
+        except Exception as exc:
+            # 정리 단계에서 예상 밖의 본문 구조를 만나도 상품을 잃지 않도록 브라우저 경로로 넘긴다
+            print(f"HTTP fast path 상세 본문 정리 실패({exc}) → 브라우저로 수집: {product_url}")
+            fetcher.count("fallbacks")
+            return None
+
+    missing = missing_fields(fields)
+    if missing:
+        print(f"HTTP fast path 필드 누락 {missing} → 브라우저로 수집: {product_url}")
+        fetcher.count("fallbacks")
+        return None
+
+    common_urls, different_urls = group_image_urls(fields["image_urls"])
+    main_image = common_urls[0] if common_urls else fields["main_image"]
+    other_images = common_urls[1:]
+    print(f"Product title (http): {fields['title']}")
+    print("Main image:", main_image)
+    log.debug("Options: %s", fields["options"])
+    log.debug("URLs not starting with most common three digits: %s", different_urls)
+    shipping_fee = fields["shipping_fee"]
+    print(f"배송비: {shipping_fee if shipping_fee is not None else 'N/A'}")
+
+    fetcher.count("hits")
+    return build_product_record(
+        product_code, fields["title"], fields["price"], shipping_fee, main_image, other_images, fields["options"],
+        product_url, category_number(fields["category"]), fields["content_html"],
+    )
+
+
+def crawl_product_detail(page, title, price, product_url, product_code, browser_context=None, prefetcher=None):
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    # 녹화/재생 모드는 HAR로만 응답해야 하므로 HTTP 경로를 쓰지 않는다
+    if HTTP_FAST_PATH and not REPLAY.enabled:
+        product_df = http_product_detail(title, price, product_url, product_code)
+        if product_df is not None:
+            return product_df
+
+    if prefetcher is not None:
+        # 이미 선행 로딩 중인 탭(없으면 prefetcher가 지금 연다)
+        product_page = prefetcher.take(product_url)
+    else:
+        product_page = (browser_context or context).new_page()
+        apply_page_stealth(product_page)
+        if not REPLAY.attach(product_page, "product", product_code):
+            product_page.close()
+            return None
+    with TIMER.span("goto"):
+        if prefetcher is None:
+            product_page.goto(product_url)
+        product_page.wait_for_load_state("load")
+    with TIMER.span("networkidle"):
+        try:
+            product_page.wait_for_load_state("networkidle", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
+
+    # JSON-LD + PRELOADED_STATE를 evaluate 한 번으로 읽어 상품명/카테고리/가격 fallback에 재사용
+    with TIMER.span("page_state"):
+        page_state = ProductPageState.read(product_page)
+
+    if not title:
+        # 입력 모드는 리스트 카드가 없으므로 상세 페이지에서 상품명을 읽는다
+        title = page_state.title or product_code
+        print(f"Product title (detail): {title}")
+
+    category = page_state.category
+    if page_state.brand:
+        log.debug("Brand: %s", page_state.brand)
+    naver_category_number = category_number(category)
+
+    with TIMER.span("option_crawl"):
+        options = option_crawl(product_page)
+    log.debug("Options: %s", options)
+
+    if not has_numeric_chars(price):
+        state_price = page_state.price
+        option_price = price_from_option_data(options)
+        resolved_price = None
+        source = None
+        if state_price:
+            resolved_price = state_price
+            source = "preloaded_state"
+        elif option_price:
+            resolved_price = option_price
+            source = "option_list"
+
+        if resolved_price:
+            price = f"{resolved_price:,}"
+            print(f"Price fallback via {source}: {price}")
+        else:
+            print(f"가격 정보를 찾지 못해 상품을 건너뜁니다: {product_url}")
+            product_page.close()
+            return None
+
+    with TIMER.span("detail_extract"):
+        time.sleep(1)
+        ensure_product_detail_visible(product_page)
+        try:
+            extracted = DETAIL_SPEC.run(product_page, selector_stats())
+        except Exception as exc:
+            print(f"상세 추출 스펙 실행 실패, 셀렉터별 조회로 진행합니다: {exc}")
+            extracted = None
+
+    with TIMER.span("image_crawl"):
+        common_urls, different_urls = image_crawl(product_page, extracted)
+    log.debug("common_urls: %s", common_urls)
+
+    main_image = None
+    other_images = []
+
+    if common_urls:
+        main_image = common_urls[0].replace('?type=m510', '')
+        other_images = [url.replace('?type=m510', '') for url in common_urls[1:]]
+        log.debug("other_images: %s", other_images)
+    else:
+        print("No common images found")
+        try:
+            image_element = product_page.wait_for_selector('xpath=//*[@id="content"]/div/div[2]/div[1]/div[1]/div[1]/img', timeout=2000)
+            image_url = image_element.get_attribute("src")
+            main_image = image_url.replace('?type=m510', '')
+        except Exception:
+            print("No main image found")
+
+    print("Main image:", main_image)
+    log.debug("Other images: %s", other_images)
+    log.debug("URLs not starting with most common three digits: %s", different_urls)
+
+    with TIMER.span("find_content_element"):
+        element_selector = find_content_element(product_page, product_code, extracted)
+    with TIMER.span("content_crawl"):
+        content = content_crawl(product_page, product_code, element_selector)
+    with TIMER.span("original_shipping_fee"):
+        shipping_fee = original_shipping_fee(product_page, extracted)
+
+    product_df = build_product_record(
+        product_code, title, price, shipping_fee, main_image, other_images, options, product_url,
+        naver_category_number, content,
+    )
+    product_page.close()
+
+    return product_df
+
+
+def build_product_record(product_code, title, price, shipping_fee, main_image, other_images, options, product_url,
+                         naver_category_number, content):
+    import pandas as pd
+    def to_int(value):
+        if value in (None, "N/A"):
+            return 0
+        digits = re.sub(r"[^\d]", "", str(value))
+        return int(digits) if digits else 0
+
+    shipping_fee_int = to_int(shipping_fee)
+    price_int = to_int(price)
+    total_price = price_int + shipping_fee_int
+
+    if content is None:
+        log_content_debug(product_code, "content_crawl returned None; storing empty placeholder.")
+        content_df = pd.DataFrame({'Content': [""]})
+    elif isinstance(content, str):
+        content_df = pd.DataFrame({'Content': [content]})
+    else:
+        content_df = content
+
+    product_df = pd.DataFrame({
+        'Product': [title],
+        'Price': [price],
+        'Shipping_Fee': [shipping_fee_int],
+        'Total_Price': [total_price],
+        'Main_Image': [main_image],
+        'Other_Images': [other_images],
+        'Options': [options],
+        'Product_URL': [product_url],
+        'Naver_Category_Number': [naver_category_number]
+    })
+
+    return pd.concat([product_df, content_df], axis=1)
+
+
+def write_to_excel(df, excel_path, seen_urls):
+    from openpyxl import load_workbook
+    book = load_workbook(excel_path)
+    sheet = book['일괄등록']
+
+    b_start_row = c_start_row = e_start_row = h_start_row = ad_start_row = r_start_row = s_start_row = t_start_row = i_start_row = 3
+    ap_start_row = aq_start_row = 3
+
+    # 데이터가 없으면 템플릿만 저장하고 조용히 반환
+    if df is None or len(df) == 0:
+        print("DataFrame이 비어 있어 엑셀 기록을 생략합니다.")
+        book.save(excel_path)
+        if os.name != "nt":
+            print(f"Excel file saved to {excel_path}. (empty dataset)")
+        return
+
+    for i, item in enumerate(df['Naver_Category_Number'], start=b_start_row):
+        sheet['B' + str(i)] = item
+    for j, item in enumerate(df['Product'], start=c_start_row):
+        sheet['C' + str(j)] = item
+    for k, (product_price, shipping_fee) in enumerate(zip(df['Price'], df['Shipping_Fee']), start=e_start_row):
+        total_price = float(product_price.replace(',', '')) + shipping_fee
+        selling_price = total_price - 0.01 * total_price
+        selling_price_rounded = round(selling_price / 100.0) * 100.0
+        sheet['E' + str(k)] = selling_price_rounded
+
+    for l, _ in enumerate(df.iterrows(), start=h_start_row):
+        sheet['H' + str(l)] = "조합형"
+    for m in range(ad_start_row, ad_start_row + len(df)):
+        selling_price_rounded = sheet['E' + str(m)].value
+
+        # 바젤마켓 분기
+        if selling_price_rounded <= 20000:
+            ad_value = 2903608
+        elif 20001 <= selling_price_rounded <= 30000:
+            ad_value = 2904260
+        elif 30001 <= selling_price_rounded <= 40000:
+            ad_value = 2904261
+        elif 40001 <= selling_price_rounded <= 60000:
+            ad_value = 2904262
+        elif 60001 <= selling_price_rounded <= 80000:
+            ad_value = 2904268
+        elif 80001 <= selling_price_rounded <= 100000:
+            ad_value = 2904272
+        elif 100001 <= selling_price_rounded <= 150000:
+            ad_value = 2904276
+        elif 150001 <= selling_price_rounded <= 400000:
+            ad_value = 2904278
+        elif 400001 <= selling_price_rounded <= 600000:
+            ad_value = 2904279
+        elif 600001 <= selling_price_rounded <= 1000000:
+            ad_value = 2904281
+        elif 1000001 <= selling_price_rounded <= 9999999:
+            ad_value = 2904284
+
+        sheet['AD' + str(m)] = ad_value
+
+    for row, _ in enumerate(df.iterrows(), start=h_start_row):
+        sheet['U' + str(row)] = "상세페이지 참조"
+        sheet['V' + str(row)] = "상세페이지 참조"
+        sheet['Y' + str(row)] = "0200037"
+        sheet['Z' + str(row)] = "구매대행"
+        sheet['AZ' + str(row)] = "010-3973-3119"
+        sheet['BA' + str(row)] = "본문 안내문 참조"
+
+    for l, item in enumerate(df['Options'], start=r_start_row):
+        option_titles = []
+        option_prices = []
+        option_categories = []
+        for key in item:
+            option_categories.append(key)
+            if '하위옵션제목' in item[key]:
+                option_titles.append(', '.join(item[key]['하위옵션제목']))
+            if '하위옵션가격' in item[key]:
+                option_prices.append(', '.join(map(str, item[key]['하위옵션가격'])))
+        sheet['I' + str(l)] = '\n'.join(option_categories)
+        sheet['J' + str(l)] = '\n'.join(option_titles)
+        sheet['K' + str(l)] = '\n'.join(option_prices)
+
+    if 'Options' in df.columns:
+        for row in range(h_start_row, h_start_row + len(df)):
+            item_options = df.at[row - h_start_row, 'Options']
+            option_prices = []
+            for option in item_options.values():
+                if '하위옵션가격' in option:
+                    option_prices.extend(option['하위옵션가격'])
+
+            if option_prices:
+                num_prices = len(option_prices)
+                l_values = ', '.join(['99'] * num_prices)
+                sheet['L' + str(row)] = l_values
+            else:
+                sheet['L' + str(row)] = "99"
+    else:
+        for row in range(h_start_row, h_start_row + len(df)):
+            sheet['L' + str(row)] = "99"
+
+    for n, item in enumerate(df['Main_Image'], start=r_start_row):
+        sheet['R' + str(n)] = item
+    for o, item in enumerate(df['Other_Images'], start=s_start_row):
+        if item is not None:
+            sheet['S' + str(o)] = "\n".join(str(img) for img in item if img is not None)
+        else:
+            sheet['S' + str(o)] = ""
+
+    if 'Content' in df.columns:
+        for p, item in enumerate(df['Content'], start=t_start_row):
+            if isinstance(item, float):
+                item = str(item)
+            log.debug("Row %d, Content: %s", p, item[:100])
+            sheet['T' + str(p)] = item
+    else:
+        print("No 'Content' column found in DataFrame")
+
+    for q, url in enumerate(df['Product_URL'], start=i_start_row):
+        product_code = url.split('/')[-1]
+        try:
+            selling_code = str(int(product_code) * 2)
+        except ValueError:
+            selling_code = str(random.randint(10000000, 99999999)) + 'R'
+        sheet['A' + str(q)] = selling_code
+    for r, total_price in enumerate(df['Total_Price'], start=ap_start_row):
+        return_fee = return_shipping_fee(total_price)
+        return_fee_rounded = round(return_fee / 100.0) * 100
+        sheet['AP' + str(r)] = return_fee_rounded
+        sheet['AQ' + str(r)] = return_fee_rounded * 2
+
+    book.save(excel_path)
+
+    # 뒤쪽 빈 행 제거
+    book = load_workbook(excel_path)
+    sheet = book['일괄등록']
+    for i in range(3, sheet.max_row + 1):
+        if not sheet['A' + str(i)].value:
+            sheet.delete_rows(i, sheet.max_row - i + 1)
+            break
+    book.save(excel_path)
+
+    if os.name == "nt":
+        os.system(f'start "" "excel.exe" "{excel_path}"')
+    else:
+        print(f"Excel file saved to {excel_path}. Automatic Excel launch is skipped on non-Windows platforms.")
+
+
+def write_to_excel2(df, excel_path2):
+    import pandas as pd
+    df2 = pd.DataFrame({
+        'Product_URL': df['Product_URL'],
+        'Numbering': range(1, len(df) + 1),
+        'Product_Title': df['Product'],
+        'Product_Price': df['Price'],
+        'Shipping_Fee': df['Shipping_Fee']
+    })
+    with pd.ExcelWriter(excel_path2) as writer:
+        df2.to_excel(writer, index=False)
+
+
+browser_name = os.getenv("PLAYWRIGHT_BROWSER", "chromium").lower()
+if browser_name not in {"chromium", "firefox", "webkit"}:
+    browser_name = "chromium"
+
+headless_mode = os.getenv("PLAYWRIGHT_HEADLESS", "0").lower() in {"1", "true", "yes"}
+
+# 영구 프로필(chromium 전용): 지정하면 launch_persistent_context로 실행해 HTTP 캐시를 실행 간 재사용
+PLAYWRIGHT_USER_DATA_DIR = (os.getenv("PLAYWRIGHT_USER_DATA_DIR") or "").strip() or None
+BROWSER_PROFILE = None
+if PLAYWRIGHT_USER_DATA_DIR and browser_name == "chromium":
+    BROWSER_PROFILE = BrowserProfile(
+        PLAYWRIGHT_USER_DATA_DIR,
+        cache_max_mb=int(os.getenv("BROWSER_CACHE_MAX_MB", "512") or 512),
+        max_age_days=int(os.getenv("BROWSER_CACHE_MAX_AGE_DAYS", "7") or 0),
+        cleanup_interval_hours=float(os.getenv("BROWSER_CACHE_CLEANUP_HOURS", "24") or 24),
+    )
+
+# 브라우저 백엔드(main/데몬이 처음 브라우저를 열 때 browser_backend()가 만든다)
+BACKEND = None
+
+# 현재 크롤링에 쓰는 BrowserContext(main/run_daemon_job이 설정, 상세 페이지는 여기서 새 탭을 연다)
+context = None
+
+
+def cdp_candidate_urls():
+    """Probe order: explicit env URL, cached last-good endpoint, default (Windows host on WSL), loopback."""
+    windows_host = detect_windows_host(WSL_CDP_HOST)
+    default_host = windows_host or "127.0.0.1"
+    candidates = [normalize_cdp_url(PLAYWRIGHT_CONNECT_URL, default_host, DEFAULT_CDP_PORT)]
+    if CDP_ENDPOINT_REUSE:
+        candidates.append(cdp_endpoint_registry().cached_url())
+    candidates.append(f"http://{default_host}:{DEFAULT_CDP_PORT}")
+    candidates.append(f"http://127.0.0.1:{DEFAULT_CDP_PORT}")
+    return candidates
+
+
+def make_backend():
+    """CDP_ENDPOINTS(여러 브라우저 풀) > CRAWLER_BACKEND=cdp(엔드포인트 탐색) > 로컬 실행."""
+    # WSL/컨테이너의 로컬 Chromium은 sandbox 없이 실행
+    local = LocalBackend(browser_name, headless=headless_mode, profile=BROWSER_PROFILE, sandbox=not running_on_wsl())
+    wants_cdp = bool(CDP_ENDPOINTS) or CRAWLER_BACKEND == "cdp"
+    if not wants_cdp:
+        return local
+    if FORCE_LOCAL_PLAYWRIGHT or browser_name != "chromium":
+        reason = "FORCE_LOCAL_PLAYWRIGHT=1" if FORCE_LOCAL_PLAYWRIGHT else f"PLAYWRIGHT_BROWSER={browser_name}"
+        print(f"{reason}: CDP 연결을 생략하고 로컬 브라우저를 실행합니다.")
+        return local
+
+    max_failures = int(os.getenv("CDP_MAX_FAILURES", "3") or 3)
+    cooldown = float(os.getenv("CDP_COOLDOWN_SECONDS", "60") or 60)
+    if CDP_ENDPOINTS:
+        backend = CdpBackend(CdpPool(CDP_ENDPOINTS, max_failures=max_failures, cooldown=cooldown))
+        print(f"CDP 풀: {backend.pool.check()}/{len(backend.pool)}개 엔드포인트 응답")
+        return backend
+
+    launch = None
+    if AUTO_LAUNCH_CHROME_DEVTOOLS:
+        launch = functools.partial(launch_chrome_devtools, SCRIPT_DIR / "start_chrome_dev.bat")
+    else:
+        print("AUTO_LAUNCH_CHROME_DEVTOOLS=0 이므로 Chrome DevTools 자동 실행을 건너뜁니다.")
+    ws_fallback = None
+    windows_host = detect_windows_host(WSL_CDP_HOST)
+    if windows_host:
+        ws_fallback = functools.partial(windows_ws_endpoint, windows_host, DEFAULT_CDP_PORT)
+    url = find_cdp_endpoint(cdp_endpoint_registry(), cdp_candidate_urls(), launch=launch, ws_fallback=ws_fallback)
+    if url is None:
+        if REQUIRE_CDP_CONNECTION:
+            print("CDP 연결 확인에 실패했습니다(REQUIRE_CDP_CONNECTION=1).")
+            sys.exit(1)
+        print(
+            "CDP 연결 확인에 실패하여 로컬 Chromium 실행으로 대체합니다. "
+            "Chrome DevTools 배치 실행 상태와 포트/주소를 확인하세요."
+        )
+        return local
+    # 사용자가 띄운 Chrome의 기본 컨텍스트(로그인/쿠키)를 그대로 사용
+    return CdpBackend(
+        CdpPool([url], max_failures=max_failures, cooldown=cooldown),
+        default_context=True,
+        registry=cdp_endpoint_registry() if CDP_ENDPOINT_REUSE else None,
+    )
+
+
+def browser_backend():
+    global BACKEND
+    if BACKEND is None:
+        BACKEND = make_backend()
+    return BACKEND
+
+
+def launch_browser(p, profile=None):
+    """Returns (browser, context). With a persistent profile browser is None (closing the context ends it)."""
+    browser, browser_context = browser_backend().open(p, profile)
+    prepare_context(browser_context)
+    return browser, browser_context
+
+
+def choose_crawl_mode(browser):
+    """CDP 연결이면 왕복 지연을 재서 batched/direct 모드를 정한다(로컬 실행은 항상 direct)."""
+    global LATENCY_MODE
+    if BACKEND.name == "cdp":
+        CDP_COUNTER.rtt_ms = measure_cdp_rtt(browser)
+    LATENCY_MODE = choose_latency_mode(CDP_COUNTER.rtt_ms, CDP_LATENCY_MODE, CDP_HIGH_RTT_MS)
+    CDP_COUNTER.mode = LATENCY_MODE
+    if CDP_COUNTER.rtt_ms is not None:
+        print(f"CDP 왕복 지연 {CDP_COUNTER.rtt_ms:.1f}ms → {LATENCY_MODE} 모드로 크롤링합니다.")
+
+
+def apply_page_stealth(page):
+    helper = stealth_helper() if browser_name == "chromium" else None
+    if helper:
+        helper.apply_stealth_sync(unwrap(page))
+
+
+def prepare_context(browser_context):
+    helper = stealth_helper() if browser_name == "chromium" else None
+    if helper:
+        helper.apply_stealth_sync(browser_context)
+    REPLAY.install_context(browser_context)
+
+
+@contextlib.contextmanager
+def open_worker_context():
+    """Per-thread playwright + browser for DETAIL_WORKERS > 1 / the daemon (sync API objects are thread-bound)."""
+    with browser_backend().worker(setup=prepare_context) as session:
+        yield session.context
+
+
+def close_browser(browser, browser_context):
+    BACKEND.close(browser, unwrap(browser_context))
+
+
+df_columns = [
+    'Naver_Category_Number',
+    'Product',
+    'Price',
+    'Shipping_Fee',
+    'Total_Price',
+    'Options',
+    'Main_Image',
+    'Other_Images',
+    'Content',
+    'Product_URL',
+]
+read_excel_path = SCRIPT_DIR / 'output' / 'ExcelSaveTemplate_230109.xlsx'
+
+
+def run_daemon_job(browser_context, params, report):
+    """crawler.daemon 작업 실행: 같은 (예열된) 브라우저 컨텍스트로 리스트 크롤링 1건 수행.
+
+    params: url, start_page, last_page, pages, max_products. report(event, **fields)로 진행 상황 전달.
+    """
+    global context
+    import pandas as pd
+    context = browser_context
+    outputs = []
+
+    def on_export(paths, rows):
+        outputs.extend(str(path) for path in paths)
+        report("export", paths=[str(path) for path in paths], rows=rows)
+
+    EXPORT_HOOKS.append(on_export)
+    try:
+        crawl = iter_product_list_crawl(
+            browser_context,
+            pd.DataFrame(columns=df_columns),
+            read_excel_path,
+            set(),
+            listing_url=params.get("url") or None,
+            start_page=params.get("start_page"),
+            last_page=params.get("last_page"),
+            only_pages=params.get("pages"),
+            max_products=params.get("max_products"),
+        )
+        for page_number in crawl:
+            report("page", page=page_number)
+    finally:
+        EXPORT_HOOKS.remove(on_export)
+        selector_stats().save()
+    return outputs
+
+
+def main():
+    # 실행부: 백엔드(로컬 실행/CDP 연결)로 브라우저를 열고 모드별 크롤링 실행
+    global context
+    import pandas as pd
+    from playwright.sync_api import sync_playwright
+    if CRAWLER_DRY_RUN:
+        print("CRAWLER_DRY_RUN=1 플래그로 인해 Playwright 크롤링 본동작을 생략합니다.")
+        sys.exit(0)
+    start_logging()
+
+    if CRAWL_SHARDS > 1 and not CRAWL_SHARD_OUTPUT:
+        if INCREMENTAL_RUN or CRAWL_BATCH_MANIFEST:
+            # 워터마크까지 순차로 훑는 증분 실행/배치 매니페스트는 단일 프로세스로 처리
+            print("CRAWL_SHARDS는 INCREMENTAL_RUN/CRAWL_BATCH_MANIFEST와 함께 쓸 수 없어 단일 프로세스로 실행합니다.")
+        else:
+            try:
+                run_sharded(df_columns, read_excel_path)
+            finally:
+                LOGGING.stop()
+            sys.exit(0)
+
+    backend = browser_backend()
+    with sync_playwright() as p:
+        browser, context = launch_browser(p)
+        choose_crawl_mode(browser)
+        count_calls = CDP_STATS and backend.name == "cdp"
+        if count_calls:
+            context = CountingProxy(context, CDP_COUNTER)
+
+        df = pd.DataFrame(columns=df_columns)
+        seen_urls = set()
+
+        try:
+            if CRAWL_INPUT_FILE:
+                crawl_product_inputs(df, read_excel_path, seen_urls)
+            elif CRAWL_BATCH_MANIFEST:
+                run_batch(context, df, read_excel_path)
+            else:
+                product_list_crawl(context, df, read_excel_path, seen_urls)
+        finally:
+            TIMER.print_summary()
+            selector_stats().save()
+            if SELECTOR_ADAPTIVE:
+                print(selector_stats().summary())
+            if REPLAY.enabled:
+                print(REPLAY.summary())
+            if HTTP_FAST_PATH:
+                print(http_fetcher().summary())
+                print(http_fetcher().client.summary())
+            if backend.summary():
+                print(backend.summary())
+            if count_calls:
+                print(CDP_COUNTER.summary())
+        close_browser(browser, context)
+
+    LOGGING.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+""".env 로더: python-dotenv가 있으면 쓰고, 없으면 KEY=VALUE 줄만 읽는 최소 파서로 대체한다.
+
+이미 설정된 환경변수는 덮어쓰지 않는다. 크롤러 설정 상수는 엔진 모듈 import 시점에 읽히므로
+CLI/데몬은 엔진을 import하기 전에, 스크립트 직접 실행은 파일 맨 앞에서 호출한다.
+"""
+import os
+from pathlib import Path
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+
+def fallback_load_dotenv(dotenv_path):
+    path = Path(dotenv_path)
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return False
+    except OSError as exc:
+        print(f".env 파일을 읽는 중 오류가 발생했습니다: {exc}")
+        return False
+
+    loaded = False
+    saw_assignments = False
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        saw_assignments = True
+        key = key.strip()
+        value = value.strip().strip("\"'")
+        if not key:
+            continue
+        if key not in os.environ:
+            os.environ[key] = value
+            loaded = True
+    return loaded or saw_assignments
+
+
+def load_env_file(dotenv_path):
+    """Load KEY=VALUE pairs from dotenv_path into os.environ (existing values win)."""
+    if load_dotenv is not None:
+        return bool(load_dotenv(dotenv_path, override=False))
+    return fallback_load_dotenv(dotenv_path)
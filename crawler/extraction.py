@@ -0,0 +1,210 @@
+"""선언형 추출 스펙: 페이지 유형별 폴백 셀렉터 체인을 JS 함수 하나로 컴파일한다.
+
+셀렉터 하나당 query_selector 왕복을 하면 원격 CDP(WSL→Windows 등)에서는 RTT가 처리 시간을
+좌우한다. 스펙에 필드별 체인을 선언해 두면 evaluate 한 번으로 모든 필드 값과
+각 필드에서 적중한 셀렉터를 함께 돌려받는다.
+
+지원 셀렉터: CSS, `xpath=...`, Playwright식 `css:has-text('문자열')`(포함 검사).
+필드 모드: text | html | exists | attr:<이름> | all_attr:<이름> | self_text(루트 자신의 innerText)
+"""
+import json
+import re
+
+
+_HAS_TEXT_RE = re.compile(r"^(?P<css>.*?):has-text\((?P<quote>['\"])(?P<text>.*?)(?P=quote)\)$")
+
+
+def compile_selector(selector):
+    if selector.startswith("xpath="):
+        return {"kind": "xpath", "sel": selector[len("xpath="):]}
+    match = _HAS_TEXT_RE.match(selector)
+    if match:
+        return {"kind": "css_text", "sel": match.group("css") or "*", "text": match.group("text")}
+    return {"kind": "css", "sel": selector}
+
+
+class Field(object):
+    def __init__(self, name, selectors=(), mode="text", chain=None, pattern=None):
+        """chain: SelectorStats chain name (None = not tracked). pattern: regex the value must match."""
+        self.name = name
+        self.selectors = list(selectors)
+        self.mode = mode
+        self.chain = chain
+        self.pattern = pattern
+
+
+_RESOLVER_JS = """
+(root, args) => {
+    const spec = __SPEC__;
+    const orders = args || {};
+    const doc = root.ownerDocument || root;
+    const isDocument = root === doc;
+    const xpathAll = (expr) => {
+        // Playwright와 같게: 요소 기준 '//' 경로는 하위 요소로 한정
+        const path = !isDocument && expr.startsWith("//") ? "." + expr : expr;
+        const snapshot = doc.evaluate(path, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    };
+    const queryAll = (desc) => {
+        try {
+            if (desc.kind === "xpath") {
+                return xpathAll(desc.sel);
+            }
+            const nodes = Array.from(root.querySelectorAll(desc.sel));
+            if (desc.kind === "css_text") {
+                const needle = desc.text.toLowerCase();
+                return nodes.filter((node) => (node.textContent || "").toLowerCase().includes(needle));
+            }
+            return nodes;
+        } catch (e) {
+            return [];
+        }
+    };
+    const read = (node, mode) => {
+        if (mode === "text") {
+            return (node.innerText || "").trim();
+        }
+        if (mode === "html") {
+            return node.innerHTML;
+        }
+        if (mode === "exists") {
+            return true;
+        }
+        if (mode.startsWith("attr:")) {
+            return node.getAttribute(mode.slice(5));
+        }
+        return null;
+    };
+    const result = {values: {}, matched: {}, positions: {}};
+    for (const field of spec) {
+        result.values[field.name] = null;
+        if (field.mode === "self_text") {
+            result.values[field.name] = (root.innerText || "").trim();
+            continue;
+        }
+        const order = orders[field.name] || field.selectors.map((_, index) => index);
+        const pattern = field.pattern ? new RegExp(field.pattern) : null;
+        for (let position = 0; position < order.length; position++) {
+            const desc = field.selectors[order[position]];
+            const nodes = queryAll(desc);
+            if (!nodes.length) {
+                continue;
+            }
+            let value;
+            if (field.mode.startsWith("all_attr:")) {
+                const name = field.mode.slice(9);
+                value = nodes.map((node) => node.getAttribute(name)).filter((item) => item);
+                if (!value.length) {
+                    continue;
+                }
+            } else {
+                value = read(nodes[0], field.mode);
+                if (value === null || value === "" || (pattern && !pattern.test(String(value)))) {
+                    continue;
+                }
+            }
+            result.values[field.name] = value;
+            result.matched[field.name] = order[position];
+            result.positions[field.name] = position;
+            break;
+        }
+    }
+    return result;
+}
+"""
+
+
+class Extracted(object):
+    def __init__(self, values, matched):
+        self.values = values
+        self.matched = matched
+
+    def __getitem__(self, name):
+        return self.values.get(name)
+
+    def selector(self, name):
+        return self.matched.get(name)
+
+
+class ExtractionSpec(object):
+    """A page type's fields compiled into one resolver; run() costs a single evaluate."""
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = list(fields)
+        compiled = [
+            {
+                "name": field.name,
+                "mode": field.mode,
+                "pattern": field.pattern,
+                "selectors": [compile_selector(selector) for selector in field.selectors],
+            }
+            for field in self.fields
+        ]
+        self.js = _RESOLVER_JS.replace("__SPEC__", json.dumps(compiled, ensure_ascii=False))
+        # 여러 루트(예: 리스트의 상품 카드 전체)를 한 번의 evaluate로 처리하는 변형
+        self.many_js = _MANY_JS.replace("__RESOLVE_ONE__", self.js)
+
+    def _orders(self, stats):
+        orders = {}
+        if stats is not None:
+            for field in self.fields:
+                if field.chain and field.selectors:
+                    learned = stats.order(field.chain, field.selectors)
+                    orders[field.name] = [field.selectors.index(selector) for selector in learned]
+        return orders
+
+    def _evaluate(self, target, js, args):
+        if hasattr(target, "main_frame"):
+            # Page에는 루트 인자가 없으므로 document를 루트로 넘긴다
+            return target.evaluate(f"(args) => ({js})(document, args)", args)
+        return target.evaluate(js, args)
+
+    def _collect(self, result, stats):
+        matched = {}
+        for field in self.fields:
+            index = result["matched"].get(field.name)
+            selector = field.selectors[index] if index is not None else None
+            matched[field.name] = selector
+            if stats is None or not field.chain or not field.selectors:
+                continue
+            if selector is None:
+                stats.record_failure(field.chain)
+            else:
+                stats.record_hit(field.chain, selector, result["positions"][field.name])
+        return Extracted(result["values"], matched)
+
+    def run(self, target, stats=None):
+        """target: Page (document root) or ElementHandle (scoped). stats: optional SelectorStats."""
+        return self._collect(self._evaluate(target, self.js, self._orders(stats)), stats)
+
+    def run_many(self, target, root_selectors, stats=None):
+        """Resolve the spec under every node of the first root selector that matches.
+
+        Returns (root_selector, [Extracted, ...]); a listing page costs one evaluate instead of
+        one query per card plus one per field.
+        """
+        args = {"roots": list(root_selectors), "orders": self._orders(stats)}
+        result = self._evaluate(target, self.many_js, args)
+        return result["root"], [self._collect(item, stats) for item in result["items"]]
+
+
+_MANY_JS = """
+(root, args) => {
+    const resolveOne = __RESOLVE_ONE__;
+    for (const selector of args.roots) {
+        let nodes = [];
+        try {
+            nodes = Array.from(root.querySelectorAll(selector));
+        } catch (e) {}
+        if (nodes.length) {
+            return {root: selector, items: nodes.map((node) => resolveOne(node, args.orders))};
+        }
+    }
+    return {root: null, items: []};
+}
+"""
@@ -0,0 +1,247 @@
+"""브라우저 밖 HTTP 요청(상세 HTML, CDP /json/version 확인 등)이 함께 쓰는 클라이언트.
+
+httpx.AsyncClient 하나를 백그라운드 이벤트 루프에서 돌려 keep-alive 커넥션 풀(h2 설치 시 HTTP/2)을
+공유하고, 호스트별 동시 요청 수 상한과 타임아웃/재시도 정책을 한 곳에서 적용한다.
+크롤러 본체는 스레드 기반이라 sync 메서드(get/request/gather)로 호출한다.
+httpx가 없으면 같은 정책의 requests.Session으로 동작한다.
+"""
+import asyncio
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HttpError(Exception):
+    """Raised when a request still fails (transport error or bad status) after all retries."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def _host(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _retry_after(response, default):
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return min(float(value), 30.0)
+    except (TypeError, ValueError):
+        return default
+
+
+class HttpClient(object):
+    def __init__(self, timeout=10.0, retries=2, backoff=0.5, per_host=4, max_connections=32, http2=True,
+                 headers=None):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.per_host = max(1, per_host)
+        self.max_connections = max(self.per_host, max_connections)
+        self.http2 = bool(http2 and HTTP2_AVAILABLE)
+        self.headers = dict(headers or {})
+        self.backend = "httpx" if httpx is not None else "requests"
+        self._lock = threading.Lock()
+        self._host_limits = {}
+        self._loop = None
+        self._client = None
+        self._session = None
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    # ------------------------------------------------------------ backends
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                ready.set()
+                loop.run_forever()
+
+            threading.Thread(target=run, name="http-client-loop", daemon=True).start()
+            ready.wait()
+            self._loop = loop
+            return loop
+
+    def _async_client(self):
+        # 이벤트 루프 스레드 안에서만 호출
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                http2=self.http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+            )
+        return self._client
+
+    def _sync_session(self):
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=self.max_connections)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def _host_limit(self, host, factory):
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = factory(self.per_host)
+            return limit
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    # ------------------------------------------------------------ requests
+    async def request_async(self, method, url, retries=None, check=True, **kwargs):
+        """Coroutine API (run on the client's loop via request()/gather(), or from async callers on it)."""
+        retries = self.retries if retries is None else retries
+        semaphore = self._host_limit(_host(url), asyncio.Semaphore)
+        client = self._async_client()
+        for attempt in range(retries + 1):
+            response = None
+            error = None
+            async with semaphore:
+                self._count("requests")
+                try:
+                    response = await client.request(method, url, **kwargs)
+                except httpx.HTTPError as exc:
+                    error = exc
+            if error is None and response.status_code not in RETRY_STATUSES:
+                break
+            if attempt < retries:
+                self._count("retries")
+                await asyncio.sleep(_retry_after(response, self.backoff * (2 ** attempt)))
+        return self._finish(url, response, error, check)
+
+    def _request_sync(self, method, url, retries=None, check=True, **kwargs):
+        retries = self.retries if retries is None else retries
+        semaphore = self._host_limit(_host(url), threading.BoundedSemaphore)
+        session = self._sync_session()
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("allow_redirects", kwargs.pop("follow_redirects", True))
+        for attempt in range(retries + 1):
+            response = None
+            error = None
+            with semaphore:
+                self._count("requests")
+                try:
+                    response = session.request(method, url, **kwargs)
+                except requests.RequestException as exc:
+                    error = exc
+            if error is None and response.status_code not in RETRY_STATUSES:
+                break
+            if attempt < retries:
+                self._count("retries")
+                time.sleep(_retry_after(response, self.backoff * (2 ** attempt)))
+        return self._finish(url, response, error, check)
+
+    def _finish(self, url, response, error, check):
+        if error is not None:
+            self._count("failures")
+            raise HttpError(f"{url}: {type(error).__name__}: {error}")
+        if check and response.status_code >= 400:
+            self._count("failures")
+            raise HttpError(f"{url}: HTTP {response.status_code}", status=response.status_code)
+        return response
+
+    def request(self, method, url, **kwargs):
+        """Blocking request; returns the response or raises HttpError (kwargs: headers, timeout, retries, check)."""
+        if self.backend == "requests":
+            return self._request_sync(method, url, **kwargs)
+        future = asyncio.run_coroutine_threadsafe(
+            self.request_async(method, url, **kwargs), self._ensure_loop()
+        )
+        return future.result()
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def gather(self, urls, method="GET", **kwargs):
+        """Fetch many URLs concurrently (per-host caps still apply). Failed items are HttpError instances."""
+        urls = list(urls)
+        if self.backend == "requests":
+            with ThreadPoolExecutor(max_workers=min(self.max_connections, max(1, len(urls)))) as pool:
+                return list(pool.map(lambda url: self._try(self._request_sync, method, url, **kwargs), urls))
+
+        async def run_all():
+            return await asyncio.gather(
+                *(self.request_async(method, url, **kwargs) for url in urls), return_exceptions=True
+            )
+
+        return asyncio.run_coroutine_threadsafe(run_all(), self._ensure_loop()).result()
+
+    @staticmethod
+    def _try(func, *args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except HttpError as exc:
+            return exc
+
+    def summary(self):
+        protocol = "HTTP/2" if self.backend == "httpx" and self.http2 else "HTTP/1.1"
+        return (
+            f"HTTP 클라이언트({self.backend}, {protocol}, 호스트당 {self.per_host}): 요청 {self.stats['requests']}건, "
+            f"재시도 {self.stats['retries']}건, 실패 {self.stats['failures']}건"
+        )
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        loop = self._loop
+        if loop is None:
+            return
+        if self._client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result(timeout=5)
+            except Exception:
+                pass
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop = None
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def get_client(**config):
+    """Process-wide shared client. config applies only when the client is first created."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HttpClient(**config)
+            atexit.register(_shared.close)
+        return _shared
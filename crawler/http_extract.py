@@ -0,0 +1,248 @@
+"""브라우저 없이 상품 상세 HTML만으로 레코드 필드를 만드는 HTTP 경로.
+
+상세 페이지의 서버 렌더링 HTML에는 `window.__PRELOADED_STATE__`(상품명/가격/이미지/옵션/배송비,
+경우에 따라 상세 본문)와 JSON-LD(상품명/가격/대표 이미지/카테고리)가 들어 있다. 이것만 파싱해
+Playwright 경로와 같은 필드를 만들고, 필수 필드가 빠지면 호출 측이 브라우저 경로로 넘어간다.
+
+실제 스마트스토어 HTML(debug/product_sample*.html)은 product.A가 값이 빈 골격이고, 상태 안의
+detailContents는 같은 카테고리 다른 상품의 요약 텍스트다. 그래서 가격/이미지는 JSON-LD를 두 번째
+출처로 쓰고, 상세 본문은 실제 HTML 요소로 파싱될 때만 받는다.
+"""
+import json
+import re
+import threading
+
+from bs4 import BeautifulSoup
+
+from crawler.http_client import HttpError, get_client
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+}
+
+# 이 필드가 하나라도 비면 브라우저 경로로 폴백
+REQUIRED_FIELDS = ("title", "price", "main_image", "content_html")
+
+_STATE_MARKER = re.compile(r"window\.__PRELOADED_STATE__\s*=\s*")
+_COMMA_NUMBER_RE = re.compile(r"^\d{1,3}(,\d{3})+$")
+_JSON_LD_RE = re.compile(
+    r"<script[^>]+type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL
+)
+
+
+def extract_preloaded_state(html_text):
+    match = _STATE_MARKER.search(html_text or "")
+    if not match:
+        return None
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html_text, match.end())
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def extract_json_ld(html_text):
+    documents = []
+    for raw in _JSON_LD_RE.findall(html_text or ""):
+        try:
+            data = json.loads(raw.strip())
+        except ValueError:
+            continue
+        documents.extend(data if isinstance(data, list) else [data])
+    return [document for document in documents if isinstance(document, dict)]
+
+
+def _state_product(state):
+    product = (state.get("product") or {}).get("A")
+    return product if isinstance(product, dict) else {}
+
+
+def _positive_int(value):
+    """12000 / 12000.5 / "12000" / "12,000" / "1.2e4" -> 12000; None for anything else or <= 0."""
+    if isinstance(value, bool) or value in (None, ""):
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        # 쉼표 천 단위 표기만 쉼표를 뺀다(소수점/지수 표기는 그대로 float로 해석)
+        if _COMMA_NUMBER_RE.match(value):
+            value = value.replace(",", "")
+    try:
+        number = int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return number if number > 0 else None
+
+
+def price_from_state(state):
+    # 브라우저 경로(price_from_preloaded_state)와 같은 우선순위: productSimpleView → product.A
+    simple = ((state.get("productSimpleView") or {}).get("product")) or {}
+    product = _state_product(state)
+    for source in (simple, product):
+        for key in ("salePrice", "discountedSalePrice", "price"):
+            price = _positive_int(source.get(key))
+            if price:
+                return price
+    return None
+
+
+def json_ld_product(json_ld):
+    """First JSON-LD document describing a Product ({} if none)."""
+    for document in json_ld:
+        kind = document.get("@type")
+        if kind == "Product" or (isinstance(kind, list) and "Product" in kind):
+            return document
+    return {}
+
+
+def price_from_json_ld(json_ld):
+    offers = json_ld_product(json_ld).get("offers")
+    for offer in offers if isinstance(offers, list) else [offers]:
+        if isinstance(offer, dict):
+            price = _positive_int(offer.get("price") or offer.get("lowPrice"))
+            if price:
+                return price
+    return None
+
+
+def image_urls_from_json_ld(json_ld):
+    images = json_ld_product(json_ld).get("image")
+    urls = []
+    for image in images if isinstance(images, list) else [images]:
+        if isinstance(image, dict):
+            image = image.get("url")
+        if isinstance(image, str) and image.startswith("http"):
+            url = image.split("?")[0]
+            if url not in urls:
+                urls.append(url)
+    return urls
+
+
+def content_markup(content):
+    """content only when it parses to real element markup (plain summary text is not a detail body)."""
+    if not isinstance(content, str) or not content.strip():
+        return None
+    return content if BeautifulSoup(content, "html.parser").find(True) is not None else None
+
+
+def category_from(state, json_ld):
+    for document in json_ld:
+        if isinstance(document.get("category"), str) and document["category"].strip():
+            return document["category"]
+    category = _state_product(state).get("category") or {}
+    return category.get("wholeCategoryName") or None
+
+
+def image_urls_from_state(state):
+    images = _state_product(state).get("productImages") or []
+    images = sorted(
+        (image for image in images if isinstance(image, dict) and image.get("url")),
+        key=lambda image: (image.get("imageType") != "REPRESENTATIVE", image.get("order") or 0),
+    )
+    return [image["url"].split("?")[0] for image in images]
+
+
+def options_from_state(state):
+    """Same shape as option_crawl(): {group: {'하위옵션제목': [...], '하위옵션가격': [...]}}."""
+    product = _state_product(state)
+    groups = [option.get("groupName") for option in product.get("options") or [] if isinstance(option, dict)]
+    combinations = [combo for combo in product.get("optionCombinations") or [] if isinstance(combo, dict)]
+    option_data = {}
+    for position, group in enumerate(groups):
+        group = group or f"옵션{position + 1}"
+        names = []
+        prices = []
+        for combo in combinations:
+            if "groupName" in combo:
+                # 단독형: 조합마다 그룹명이 붙어 있다
+                if combo["groupName"] != group:
+                    continue
+                name = combo.get("optionName1")
+                price = int(combo.get("price") or 0)
+            else:
+                # 조합형: optionNameN이 N번째 드롭다운, 추가금은 마지막 드롭다운에만 표시된다
+                name = combo.get(f"optionName{position + 1}")
+                price = int(combo.get("price") or 0) if position == len(groups) - 1 else 0
+            if not name or name in names:
+                continue
+            names.append(name)
+            prices.append(price)
+        if names:
+            option_data[group] = {"하위옵션제목": names, "하위옵션가격": prices}
+    return option_data
+
+
+def shipping_fee_from_state(state):
+    delivery = _state_product(state).get("productDeliveryInfo") or {}
+    if not delivery:
+        return None
+    if delivery.get("deliveryFeeType") == "FREE":
+        return 0
+    fee = delivery.get("baseFee")
+    return int(fee) if isinstance(fee, (int, float)) else None
+
+
+def parse_product_html(html_text):
+    """Parse the server-rendered detail page into record fields (None where not available)."""
+    state = extract_preloaded_state(html_text) or {}
+    json_ld = extract_json_ld(html_text)
+    product = _state_product(state)
+    title = product.get("name")
+    if not title:
+        title = next((document.get("name") for document in json_ld if document.get("name")), None)
+    images = image_urls_from_state(state) or image_urls_from_json_ld(json_ld)
+    content = (product.get("detailContents") or {}).get("detailContentText")
+    return {
+        "title": title.replace("\xa0", " ").strip() if title else None,
+        "price": price_from_state(state) or price_from_json_ld(json_ld),
+        "category": category_from(state, json_ld),
+        "main_image": images[0] if images else None,
+        "image_urls": images,
+        "options": options_from_state(state),
+        "shipping_fee": shipping_fee_from_state(state),
+        "content_html": content_markup(content),
+    }
+
+
+def missing_fields(fields, required=REQUIRED_FIELDS):
+    return [name for name in required if not fields.get(name)]
+
+
+class HttpProductFetcher(object):
+    """Fetches detail pages through the shared HTTP client; counts fast-path hits and fallbacks."""
+
+    def __init__(self, client=None, timeout=10, headers=None):
+        self.client = client or get_client()
+        self.timeout = timeout
+        self.headers = headers or DEFAULT_HEADERS
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "fallbacks": 0, "errors": 0}
+
+    def count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def fetch(self, url):
+        try:
+            response = self.client.get(url, headers=self.headers, timeout=self.timeout)
+        except HttpError as exc:
+            print(f"HTTP 상세 요청 실패: {exc}")
+            self.count("errors")
+            return None
+        if response.status_code != 200:
+            print(f"HTTP 상세 응답 {response.status_code}: {url}")
+            self.count("errors")
+            return None
+        return response.text
+
+    def summary(self):
+        total = self.stats["hits"] + self.stats["fallbacks"]
+        return (
+            f"HTTP fast path: {self.stats['hits']}/{total}건 브라우저 없이 처리, "
+            f"폴백 {self.stats['fallbacks']}건 (요청 오류 {self.stats['errors']}건)"
+        )
@@ -0,0 +1,79 @@
+"""상품 URL/코드 목록 입력(리스트 크롤링 없이 상세 수집만 수행).
+
+지원 형식:
+- .txt / .csv: 한 줄에 URL 또는 상품 코드 하나(# 주석, 빈 줄 무시, csv는 첫 열 또는 Product_URL 열)
+- .xlsx: write_to_excel2가 만든 *_second.xlsx 등 Product_URL 열이 있는 시트
+"""
+import csv
+import re
+from pathlib import Path
+
+
+_CODE_RE = re.compile(r"^\d{5,}$")
+_PRODUCT_URL_RE = re.compile(r"/products/(\d+)")
+
+
+def normalize_product_input(value, product_base_url):
+    """Return (product_url, product_code) for a URL or a bare code, or None when unusable."""
+    text = str(value or "").strip()
+    if not text or text.upper() == "N/A":
+        return None
+    if _CODE_RE.match(text):
+        return f"{product_base_url.rstrip('/')}/{text}", text
+    match = _PRODUCT_URL_RE.search(text)
+    if not match:
+        return None
+    # 추적용 쿼리스트링은 제거해 같은 상품이 중복 수집되지 않도록 함
+    return text.split("?")[0].split("#")[0], match.group(1)
+
+
+def _read_excel_values(path):
+    import pandas as pd
+
+    values = []
+    for sheet in pd.read_excel(path, sheet_name=None, dtype=str).values():
+        if "Product_URL" in sheet.columns:
+            values.extend(sheet["Product_URL"].dropna().tolist())
+    return values
+
+
+def _read_text_values(path):
+    values = []
+    with open(path, encoding="utf-8-sig", newline="") as handle:
+        if path.suffix.lower() == ".csv":
+            rows = list(csv.reader(handle))
+            column = 0
+            if rows and "Product_URL" in rows[0]:
+                column = rows[0].index("Product_URL")
+                rows = rows[1:]
+            values.extend(row[column] for row in rows if len(row) > column)
+        else:
+            for line in handle:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    values.append(line)
+    return values
+
+
+def load_product_inputs(path, product_base_url):
+    """Read product URLs/codes from path; duplicates (same product code) are dropped, order kept."""
+    path = Path(path)
+    if path.suffix.lower() in {".xlsx", ".xlsm", ".xls"}:
+        raw_values = _read_excel_values(path)
+    else:
+        raw_values = _read_text_values(path)
+
+    items = []
+    seen_codes = set()
+    skipped = 0
+    for value in raw_values:
+        normalized = normalize_product_input(value, product_base_url)
+        if normalized is None:
+            skipped += 1
+            continue
+        if normalized[1] in seen_codes:
+            continue
+        seen_codes.add(normalized[1])
+        items.append(normalized)
+    print(f"입력 파일 {path.name}: 항목 {len(raw_values)}개 -> 상품 {len(items)}개 (인식 실패 {skipped}개)")
+    return items
@@ -0,0 +1,19 @@
+"""저장소 루트 실행 스크립트용 런처: .env와 스크립트별 기본값을 적용한 뒤 crawler.engine.main()을 실행.
+
+엔진 설정 상수는 import 시점에 환경변수에서 읽히므로, 기본값은 엔진을 import하기 전에
+os.environ에 채운다. 우선순위는 실제 환경변수 > .env > 스크립트 기본값.
+"""
+import os
+from pathlib import Path
+
+from crawler.envfile import load_env_file
+
+
+def run(script_path, **defaults):
+    load_env_file(Path(script_path).resolve().with_name(".env"))
+    for key, value in defaults.items():
+        os.environ.setdefault(key, str(value))
+
+    from crawler import engine
+
+    engine.main()
@@ -0,0 +1,124 @@
+"""리스트 page size 자동 선택과 기존(size=20) 페이지 번호 매핑.
+
+페이지 범위(global_start_page 등), CRAWL_ONLY_PAGES, 10페이지 그룹, 출력 파일명은
+모두 기존 size=20 기준 번호를 유지하고, 실제 이동은 더 큰 page size의 페이지로 환산한다.
+예) size=60이면 기존 61~70페이지 = 실제 21~24페이지(24페이지는 앞 20개만).
+"""
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+from crawler.urls import update_query_params
+
+
+LEGACY_PAGE_SIZE = 20
+DEFAULT_SIZE_CANDIDATES = (80, 60, 40)
+
+# 리스트에 적용된 출력 개수(data-shp-filter_con)와 상품 링크 수를 한 번에 읽는다
+_LISTING_SIZE_JS = """
+() => {
+  let reported = null;
+  // 첫 data-shp-filter_con은 필터 라벨(무료배송 등)일 수 있어 페이지네이션 컨테이너로 한정
+  const container = document.querySelector("[data-shp-area='list.pgn'][data-shp-filter_con]");
+  if (container) {
+    try {
+      const raw = (container.getAttribute('data-shp-filter_con') || '').replace(/&quot;/g, '"');
+      for (const item of JSON.parse(raw)) {
+        if (item && typeof item.key === 'string' && (item.key.includes('개수') || item.key === 'size')) {
+          const m = String(item.value).match(/\\d+/);
+          if (m) { reported = parseInt(m[0], 10); break; }
+        }
+      }
+    } catch (e) {}
+  }
+  const hrefs = new Set();
+  document.querySelectorAll("a[href*='/products/']").forEach((a) => {
+    const href = (a.getAttribute('href') || '').split('?')[0];
+    if (href) { hrefs.add(href); }
+  });
+  return {reported: reported, products: hrefs.size};
+}
+"""
+
+
+def url_page_size(url, default=LEGACY_PAGE_SIZE):
+    query = dict(parse_qsl(urlsplit(url).query, keep_blank_values=True))
+    try:
+        return int(query.get("size") or default)
+    except ValueError:
+        return default
+
+
+def parse_size_setting(raw, default=DEFAULT_SIZE_CANDIDATES):
+    """LISTING_PAGE_SIZE: 'auto' -> candidates, '60' -> (60,), '80,40' -> (80, 40)."""
+    raw = (raw or "auto").strip().lower()
+    if raw in {"", "auto"}:
+        return tuple(default)
+    sizes = []
+    for token in raw.replace(";", ",").split(","):
+        token = token.strip()
+        if token.isdigit() and int(token) > 0:
+            sizes.append(int(token))
+    return tuple(sorted(set(sizes), reverse=True)) or tuple(default)
+
+
+def read_listing_size(page):
+    try:
+        return page.evaluate(_LISTING_SIZE_JS)
+    except Exception as exc:
+        print(f"리스트 size 확인 실패: {exc}")
+        return {"reported": None, "products": 0}
+
+
+def choose_page_size(page, listing_url, candidates=DEFAULT_SIZE_CANDIDATES, legacy_size=LEGACY_PAGE_SIZE):
+    """Load listing_url with each candidate size (largest first) and keep the first one the store honours.
+
+    Returns (page_size, url). The page is left on `url` so the caller can continue from it;
+    listing_url is expected to be loaded already.
+    """
+    navigated = False
+    for size in sorted(set(candidates), reverse=True):
+        if size <= legacy_size:
+            continue
+        navigated = True
+        url = update_query_params(listing_url, size=size)
+        page.goto(url)
+        page.wait_for_load_state("networkidle")
+        info = read_listing_size(page)
+        reported, products = info.get("reported"), info.get("products") or 0
+        accepted = reported == size if reported is not None else products > legacy_size
+        print(f"리스트 size={size} 확인: 적용값={reported}, 상품 {products}개 -> {'사용' if accepted else '거부'}")
+        if accepted:
+            return size, url
+        if reported is None and products <= legacy_size:
+            # 상품 수가 기본 크기 이하인 스토어는 더 큰 size를 시도할 필요가 없음
+            break
+        time.sleep(0.5)
+    if not navigated:
+        # URL에 이미 목표 size가 들어 있어 시도할 후보가 없으면 현재 페이지를 그대로 사용
+        return legacy_size, listing_url
+    url = update_query_params(listing_url, size=legacy_size)
+    page.goto(url)
+    page.wait_for_load_state("networkidle")
+    return legacy_size, url
+
+
+def map_legacy_pages(legacy_pages, page_size, legacy_size=LEGACY_PAGE_SIZE):
+    """Map legacy page numbers onto real pages of `page_size`.
+
+    Returns [(actual_page, start, end, legacy_page)] in listing order, where start/end slice the
+    product cards of actual_page. Consecutive entries share actual_page, so the caller navigates
+    once per distinct actual page.
+    """
+    entries = []
+    for legacy_page in sorted(set(legacy_pages)):
+        first_index = (legacy_page - 1) * legacy_size
+        actual_page = first_index // page_size + 1
+        start = first_index % page_size
+        end = start + legacy_size
+        if end > page_size:
+            # size가 20의 배수가 아닐 때 기존 페이지가 두 실제 페이지에 걸치는 경우
+            entries.append((actual_page, start, page_size, legacy_page))
+            entries.append((actual_page + 1, 0, end - page_size, legacy_page))
+        else:
+            entries.append((actual_page, start, end, legacy_page))
+    return entries
@@ -0,0 +1,243 @@
+"""구조화 로깅: 레벨, 상품/페이지 컨텍스트, 큐 기반 백그라운드 파일 기록.
+
+기존 Tee는 print 조각마다 stdout과 log.txt를 모두 flush 해서 크롤링 경로에서
+동기 디스크 I/O가 발생했다. 여기서는 모든 기록을 QueueHandler로 넘기고
+QueueListener 스레드가 콘솔/파일/JSONL 핸들러에 일괄 기록한다.
+"""
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+LOGGER_NAME = "crawler"
+# 메트릭 레코드는 JSONL 싱크 전용(콘솔/log.txt에는 남기지 않음)
+METRICS_LOGGER_NAME = f"{LOGGER_NAME}.metrics"
+
+_LOG_CONTEXT = contextvars.ContextVar("crawler_log_context", default={})
+
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "ctx", "ctx_text"}
+
+
+def get_logger(name=None):
+    if not name:
+        return logging.getLogger(LOGGER_NAME)
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+@contextmanager
+def log_context(**fields):
+    """Attach fields (product_code, page, ...) to every record logged inside the block."""
+    merged = dict(_LOG_CONTEXT.get())
+    merged.update({key: value for key, value in fields.items() if value is not None})
+    token = _LOG_CONTEXT.set(merged)
+    try:
+        yield merged
+    finally:
+        _LOG_CONTEXT.reset(token)
+
+
+def current_log_context():
+    return dict(_LOG_CONTEXT.get())
+
+
+class ContextFilter(logging.Filter):
+    """Copies the active log_context() onto the record (ctx / ctx_text)."""
+
+    def filter(self, record):
+        ctx = _LOG_CONTEXT.get()
+        record.ctx = dict(ctx)
+        record.ctx_text = "".join(f"[{key}={value}]" for key, value in ctx.items())
+        if record.ctx_text:
+            record.ctx_text += " "
+        return True
+
+
+class ExcludeMetricsFilter(logging.Filter):
+    def filter(self, record):
+        return not record.name.startswith(METRICS_LOGGER_NAME)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record; extra= fields and log_context() are merged in."""
+
+    def format(self, record):
+        payload = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created))
+            + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        payload.update(getattr(record, "ctx", None) or {})
+        for key, value in record.__dict__.items():
+            if key in _RESERVED_ATTRS or key.startswith("_"):
+                continue
+            payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that flushes every N records or T seconds instead of per record."""
+
+    def __init__(self, filename, max_bytes=0, backup_count=0, flush_every=200, flush_interval=1.0,
+                 encoding="utf-8"):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        self.flush_every = max(1, int(flush_every))
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if (
+                self._pending >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def rollover_existing(self):
+        """Start the run with an empty file while keeping the previous one as a backup."""
+        path = Path(self.baseFilename)
+        try:
+            if self.backupCount > 0 and path.exists() and path.stat().st_size > 0:
+                self.doRollover()
+        except OSError:
+            pass
+
+
+class LoggerStream(object):
+    """File-like object that turns print() output into log records, line by line."""
+
+    def __init__(self, logger, level=logging.INFO):
+        self.logger = logger
+        self.level = level
+        self._buffer = ""
+
+    def write(self, text):
+        if not text:
+            return 0
+        self._buffer += text
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            self.logger.log(self.level, line)
+        return len(text)
+
+    def flush(self):
+        # 완성되지 않은 줄은 다음 write에서 이어 붙인다(강제 디스크 flush 없음)
+        pass
+
+    def close(self):
+        if self._buffer:
+            self.logger.log(self.level, self._buffer)
+            self._buffer = ""
+
+    def isatty(self):
+        return False
+
+
+class LoggingRuntime(object):
+    """Handle returned by setup_logging(); stop() drains the queue and restores stdout."""
+
+    def __init__(self, listener, stream, original_stdout, handlers):
+        self.listener = listener
+        self.stream = stream
+        self.original_stdout = original_stdout
+        self.handlers = handlers
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.close()
+            if sys.stdout is self.stream:
+                sys.stdout = self.original_stdout
+            self.stream = None
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        for handler in self.handlers:
+            try:
+                handler.flush()
+                handler.close()
+            except Exception:
+                pass
+        root = logging.getLogger(LOGGER_NAME)
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+
+
+def setup_logging(log_path, level="INFO", jsonl_path=None, max_bytes=10 * 1024 * 1024, backup_count=5,
+                  capture_stdout=True, console=True):
+    """Configure the 'crawler' logger with a background queue listener.
+
+    log_path receives human readable lines, jsonl_path (optional) one JSON object per record.
+    When capture_stdout is set, print() output is routed through the logger as INFO records.
+    """
+    level_value = logging.getLevelName(str(level).upper()) if not isinstance(level, int) else level
+    if not isinstance(level_value, int):
+        level_value = logging.INFO
+
+    original_stdout = sys.stdout
+    handlers = []
+
+    if console:
+        console_handler = logging.StreamHandler(original_stdout)
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        console_handler.addFilter(ExcludeMetricsFilter())
+        handlers.append(console_handler)
+
+    if log_path:
+        file_handler = BatchingRotatingFileHandler(log_path, max_bytes=max_bytes, backup_count=backup_count)
+        file_handler.rollover_existing()
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)-7s %(ctx_text)s%(message)s", "%Y-%m-%d %H:%M:%S")
+        )
+        file_handler.addFilter(ExcludeMetricsFilter())
+        handlers.append(file_handler)
+
+    if jsonl_path:
+        json_handler = BatchingRotatingFileHandler(jsonl_path, max_bytes=max_bytes, backup_count=backup_count)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # 컨텍스트는 기록 시점(호출 스레드)에 붙여야 하므로 QueueHandler 쪽에 필터를 둔다
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger(LOGGER_NAME)
+    root.setLevel(level_value)
+    root.propagate = False
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    stream = None
+    if capture_stdout:
+        stream = LoggerStream(get_logger("stdout"))
+        sys.stdout = stream
+    return LoggingRuntime(listener, stream, original_stdout, handlers)
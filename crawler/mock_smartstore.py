@@ -0,0 +1,550 @@
+"""로컬 스마트스토어 대체 서버(처리량/동시성 측정용).
+
+실제 마크업 구조를 흉내 낸다:
+- 리스트: data-shp-area='list.pgn' role=menubar 페이지네이션(data-shp-filter_con의 pgn,
+  a[role=menuitem][aria-current], '이전/다음' a[role=button]), 클릭 시 URL 변경 없이 목록 교체
+- 상세: __PRELOADED_STATE__, JSON-LD category 스크립트, optselect 옵션 listbox, #INTRODUCE 상세
+- 시드: debug/listing_sample.html(상품명/가격/이미지), html1.txt·html2.txt(상세 HTML)
+- 지연(latency/jitter)과 실패(503) 주입
+
+실행 예:
+    python -m crawler.mock_smartstore --port 8765 --products 5000 --latency-ms 80 --fail-rate 0.01
+    CRAWL_LISTING_URL="http://127.0.0.1:8765/joypapa_/category/ALL?st=RECENT&dt=BIG_IMAGE&size=20" \\
+        python -m crawler crawl
+"""
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_SHOP = "joypapa_"
+DEFAULT_PAGE_SIZES = (20, 40, 60, 80)
+PAGE_GROUP_SIZE = 10
+FIRST_PRODUCT_CODE = 9956000000
+
+MOCK_CATEGORIES = [
+    "생활/건강>공구>절삭공구>각도/고속절단기",
+    "디지털/가전>영상가전>영상가전액세서리>스탠드",
+    "생활/건강>수집품>모형/프라모델/피규어>모형",
+    "생활/건강>화방용품>조소/판화용품>조소용품",
+    "출산/육아>구강청결용품>기타구강청결용품",
+]
+
+# 1x1 투명 GIF (이미지 요청이 외부로 나가지 않도록 로컬에서 응답)
+_PIXEL_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+def load_seed_products(listing_path=None):
+    """Extract (name, price) pairs from a saved SmartStore listing page."""
+    path = Path(listing_path) if listing_path else REPO_DIR / "debug" / "listing_sample.html"
+    seeds = []
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return seeds
+    seen = set()
+    for match in re.finditer(r'data-shp-area="list\.pd"[^>]*?data-shp-contents-dtl="([^"]+)"', text):
+        try:
+            detail = json.loads(html.unescape(match.group(1)))
+        except ValueError:
+            continue
+        fields = {item.get("key"): item.get("value") for item in detail if isinstance(item, dict)}
+        name = (fields.get("chnl_prod_nm") or "").strip()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        try:
+            price = int(fields.get("price") or 0)
+        except ValueError:
+            price = 0
+        seeds.append((name, price or 10000))
+    return seeds
+
+
+def load_seed_contents(paths=None):
+    """Raw #INTRODUCE HTML snippets used as detail content."""
+    candidates = paths or [REPO_DIR / "html1.txt", REPO_DIR / "html2.txt"]
+    contents = []
+    for candidate in candidates:
+        try:
+            contents.append(Path(candidate).read_text(encoding="utf-8"))
+        except OSError:
+            continue
+    if not contents:
+        contents.append('<div class="se-main-container"><p>상세 설명</p></div>')
+    return contents
+
+
+class MockCatalog(object):
+    """Deterministic product catalog; index 0 is the newest product (st=RECENT)."""
+
+    def __init__(self, product_count=2000, seed=1, listing_path=None, content_paths=None):
+        self.product_count = product_count
+        self.seeds = load_seed_products(listing_path) or [("모의 상품", 15000)]
+        self.contents = load_seed_contents(content_paths)
+        self.seed = seed
+
+    def code_at(self, index):
+        return str(FIRST_PRODUCT_CODE + self.product_count - index)
+
+    def index_of(self, code):
+        try:
+            index = FIRST_PRODUCT_CODE + self.product_count - int(code)
+        except ValueError:
+            return None
+        if 0 <= index < self.product_count:
+            return index
+        return None
+
+    def product(self, index):
+        rng = random.Random(self.seed * 1000003 + index)
+        name, base_price = self.seeds[index % len(self.seeds)]
+        code = self.code_at(index)
+        price = max(1000, int(base_price * rng.uniform(0.8, 1.2)) // 100 * 100)
+        date = f"2025{(index % 12) + 1:02d}{(index % 28) + 1:02d}"
+        images = [
+            f"/shop-phinf/{date}_{index % 300}/{1700000000000 + index}{n}_JPEG/{code}{n}.jpg"
+            for n in range(rng.randint(2, 5))
+        ]
+        options = []
+        for n in range(rng.randint(0, 2)):
+            options.append({
+                "groupName": f"옵션{n + 1}",
+                "values": [
+                    (f"{chr(65 + k)}형", 0 if k == 0 else rng.choice([0, 1000, 2500, 4200]))
+                    for k in range(rng.randint(2, 6))
+                ],
+            })
+        return {
+            "index": index,
+            "code": code,
+            "name": f"{name} {index + 1}",
+            "price": price,
+            "category": MOCK_CATEGORIES[index % len(MOCK_CATEGORIES)],
+            "brand": "모의브랜드",
+            "shipping_fee": rng.choice([0, 2500, 3000, 3500]),
+            "images": images,
+            "options": options,
+            "content": self.contents[index % len(self.contents)],
+        }
+
+
+def _filter_con(page_size, page_number):
+    data = [
+        {"key": "상품 목록 출력 개수", "value": str(page_size)},
+        {"key": "상품 목록 뷰타입", "value": "큰이미지형"},
+        {"key": "pgn", "value": str(page_number)},
+    ]
+    return html.escape(json.dumps(data, ensure_ascii=False), quote=True)
+
+
+def render_listing_fragment(catalog, shop, page_number, page_size):
+    total_pages = max(1, -(-catalog.product_count // page_size))
+    page_number = min(max(1, page_number), total_pages)
+    start = (page_number - 1) * page_size
+    cards = []
+    for index in range(start, min(start + page_size, catalog.product_count)):
+        item = catalog.product(index)
+        name = html.escape(item["name"])
+        cards.append(
+            f'<li class="flu7YgFW2k"><div data-shp-area="list.pd" data-shp-contents-id="{item["code"]}">'
+            f'<a href="/{shop}/products/{item["code"]}" role="link" class="linkAnchor">'
+            f'<img src="{item["images"][0]}?type=f750_750" alt="{name}"></a>'
+            f'<strong aria-hidden="false">{name}</strong>'
+            f'<span class="price">{item["price"]:,}<span>원</span></span></div></li>'
+        )
+
+    group_start = ((page_number - 1) // PAGE_GROUP_SIZE) * PAGE_GROUP_SIZE + 1
+    group_end = min(group_start + PAGE_GROUP_SIZE - 1, total_pages)
+    filter_con = _filter_con(page_size, page_number)
+    common = (
+        f'data-shp-filter_con="{filter_con}" data-shp-area="list.pgn" data-shp-area-type="slot" '
+        f'data-shp-area-id="pgn" data-shp-contents-type="pgn"'
+    )
+    prev_target = group_start - 1
+    next_target = group_end + 1
+    links = [
+        f'<a href="#" role="button" aria-hidden="{"true" if prev_target < 1 else "false"}" '
+        f'data-mock-page="{max(prev_target, 1)}" {common} data-shp-contents-id="{max(prev_target, 1)}">이전</a>'
+    ]
+    for number in range(group_start, group_end + 1):
+        links.append(
+            f'<a href="#" role="menuitem" aria-current="{"true" if number == page_number else "false"}" '
+            f'data-mock-page="{number}" {common} data-shp-contents-id="{number}">{number}</a>'
+        )
+    links.append(
+        f'<a href="#" role="button" aria-hidden="{"true" if next_target > total_pages else "false"}" '
+        f'data-mock-page="{min(next_target, total_pages)}" {common} '
+        f'data-shp-contents-id="{min(next_target, total_pages)}">다음</a>'
+    )
+    pagination = (
+        f'<div class="LiT9lKOVbw" role="menubar" {common} data-shp-contents-id="{page_number}">'
+        + "".join(links)
+        + "</div>"
+    )
+    return {"list": "".join(cards), "pagination": pagination, "page": page_number, "size": page_size}
+
+
+_LISTING_SCRIPT = """
+<script>
+document.addEventListener('click', function (event) {
+  var link = event.target.closest('[data-mock-page]');
+  if (!link) { return; }
+  event.preventDefault();
+  if (link.getAttribute('aria-hidden') === 'true') { return; }
+  var url = new URL(window.location.href);
+  url.searchParams.set('page', link.getAttribute('data-mock-page'));
+  url.searchParams.set('fragment', '1');
+  fetch(url.toString()).then(function (res) { return res.json(); }).then(function (data) {
+    document.getElementById('mock-list').innerHTML = data.list;
+    document.getElementById('mock-pagination').innerHTML = data.pagination;
+  });
+});
+</script>
+"""
+
+
+def render_listing_page(catalog, shop, page_number, page_size):
+    fragment = render_listing_fragment(catalog, shop, page_number, page_size)
+    return (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\"><title>Mock SmartStore</title></head>"
+        f"<body><div id=\"content\"><ul id=\"mock-list\">{fragment['list']}</ul>"
+        f"<div id=\"mock-pagination\">{fragment['pagination']}</div></div>{_LISTING_SCRIPT}</body></html>"
+    )
+
+
+_DETAIL_SCRIPT = """
+<script>
+document.querySelectorAll('[data-shp-area$="optselect"][aria-haspopup="listbox"]').forEach(function (trigger) {
+  trigger.addEventListener('click', function (event) {
+    event.preventDefault();
+    document.querySelectorAll('ul[role="listbox"]').forEach(function (ul) { ul.style.display = 'none'; });
+    var list = document.getElementById(trigger.getAttribute('aria-controls'));
+    list.style.display = 'block';
+    trigger.setAttribute('aria-expanded', 'true');
+  });
+});
+document.querySelectorAll('ul[role="listbox"] [role="option"]').forEach(function (option) {
+  option.addEventListener('click', function (event) {
+    event.preventDefault();
+    option.closest('ul').style.display = 'none';
+  });
+});
+</script>
+"""
+
+
+def preloaded_state(item):
+    images = [
+        {"url": "https://shop-phinf.pstatic.net" + url.replace("/shop-phinf", "", 1),
+         "imageType": "REPRESENTATIVE" if n == 0 else "OPTIONAL", "order": n + 1}
+        for n, url in enumerate(item["images"])
+    ]
+    return {
+        "product": {
+            "A": {
+                "id": item["code"],
+                "productNo": item["code"],
+                "name": item["name"],
+                "salePrice": item["price"],
+                "discountedSalePrice": item["price"],
+                "category": {
+                    "wholeCategoryName": item["category"],
+                    "categoryName": item["category"].split(">")[-1],
+                },
+                "naverShoppingSearchInfo": {"brandName": item["brand"]},
+                "productImages": images,
+                "options": [
+                    {"groupName": option["groupName"], "optionType": "SIMPLE"} for option in item["options"]
+                ],
+                "optionCombinations": [
+                    {"optionName1": name, "price": price, "groupName": option["groupName"]}
+                    for option in item["options"]
+                    for name, price in option["values"]
+                ],
+                "productDeliveryInfo": {
+                    "baseFee": item["shipping_fee"],
+                    "deliveryFeeType": "FREE" if item["shipping_fee"] == 0 else "PAID",
+                },
+                "detailContents": {"detailContentText": item["content"]},
+            }
+        },
+        "productSimpleView": {
+            "product": {
+                "salePrice": item["price"],
+                "discountedSalePrice": item["price"],
+                "price": item["price"],
+            }
+        },
+    }
+
+
+def render_detail_page(item):
+    name = html.escape(item["name"])
+    ld_json = json.dumps({
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": item["name"],
+        "brand": {"@type": "Brand", "name": item["brand"]},
+        "category": item["category"],
+        "offers": {"@type": "Offer", "price": item["price"], "priceCurrency": "KRW"},
+    }, ensure_ascii=False)
+    state = json.dumps(preloaded_state(item), ensure_ascii=False).replace("</", "<\\/")
+    thumbs = "".join(
+        f'<li><img alt="추가이미지{n}" src="{url}?type=f40"></li>' for n, url in enumerate(item["images"][1:], 1)
+    )
+    option_blocks = []
+    for n, option in enumerate(item["options"]):
+        values = "".join(
+            f'<li role="presentation"><a href="#" role="option" data-shp-area="pcs.optselect">'
+            f'{html.escape(value)}{f" (+{price:,}원)" if price else ""}</a></li>'
+            for value, price in option["values"]
+        )
+        option_blocks.append(
+            f'<a href="#" role="button" aria-expanded="false" aria-haspopup="listbox" aria-controls="opt-{n}" '
+            f'aria-label="{html.escape(option["groupName"])}" data-shp-area="pcs.optselect">선택</a>'
+            f'<ul role="listbox" id="opt-{n}" style="display:none">{values}</ul>'
+        )
+    shipping = "무료배송" if item["shipping_fee"] == 0 else f'배송비 {item["shipping_fee"]:,}원'
+    return (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+        f"<title>{name}</title>"
+        f'<script type="application/ld+json">{ld_json}</script>'
+        f"<script>window.__PRELOADED_STATE__={state}</script>"
+        "</head><body><div id=\"content\"><div><div>"
+        f'<img alt="대표이미지" src="{item["images"][0]}?type=m510">'
+        f'<ul class="thumbnail_list">{thumbs}</ul>'
+        f"<h3>{name}</h3><strong><span>{item['price']:,}</span>원</strong>"
+        f'<span class="delivery_fee">{shipping}</span>'
+        f"{''.join(option_blocks)}"
+        "</div></div>"
+        f'<div id="INTRODUCE" data-name="INTRODUCE" role="tabpanel"><div><div class="LXGzUhHJC2 EtTm8LLHdw">'
+        f"<div><div><div><div><div><div><div>{item['content']}</div></div></div></div></div></div></div>"
+        "</div></div></div>"
+        f"</div>{_DETAIL_SCRIPT}</body></html>"
+    )
+
+
+class MockStats(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {}
+
+    def incr(self, key):
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.counts)
+
+
+class MockConfig(object):
+    def __init__(self, shop=DEFAULT_SHOP, page_sizes=DEFAULT_PAGE_SIZES, latency_ms=0, jitter_ms=0,
+                 fail_rate=0.0, slow_rate=0.0, slow_ms=0, seed=1):
+        self.shop = shop
+        self.page_sizes = tuple(page_sizes)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.fail_rate = fail_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def roll(self):
+        with self.rng_lock:
+            return self.rng.random(), self.rng.random(), self.rng.uniform(-1, 1)
+
+
+class MockSmartStoreHandler(BaseHTTPRequestHandler):
+    server_version = "MockSmartStore/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        if getattr(self.server, "verbose", False):
+            super().log_message(fmt, *args)
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", extra_headers=None):
+        data = body if isinstance(body, bytes) else body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def _inject(self, kind):
+        """Apply configured latency/failure. Returns True when a failure response was sent."""
+        config = self.server.config
+        fail_roll, slow_roll, jitter_roll = config.roll()
+        delay = config.latency_ms + config.jitter_ms * jitter_roll
+        if slow_roll < config.slow_rate:
+            delay += config.slow_ms
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if kind in {"listing", "detail", "fragment"} and fail_roll < config.fail_rate:
+            self.server.stats.incr(f"{kind}_failed")
+            self._send(503, "<html><body>일시적인 오류 (mock)</body></html>")
+            return True
+        return False
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        segments = [segment for segment in parts.path.split("/") if segment]
+        stats = self.server.stats
+        catalog = self.server.catalog
+        config = self.server.config
+
+        if segments[:1] == ["__mock__"]:
+            stats.incr("stats")
+            payload = {"stats": stats.snapshot(), "products": catalog.product_count}
+            self._send(200, json.dumps(payload, ensure_ascii=False), "application/json; charset=utf-8")
+            return
+
+        if segments[:1] == ["shop-phinf"]:
+            stats.incr("image")
+            self._send(200, _PIXEL_GIF, "image/gif")
+            return
+
+        if len(segments) >= 3 and segments[1] == "category":
+            is_fragment = query.get("fragment") == "1"
+            kind = "fragment" if is_fragment else "listing"
+            stats.incr(kind)
+            if self._inject(kind):
+                return
+            try:
+                requested_size = int(query.get("size") or 20)
+            except ValueError:
+                requested_size = 20
+            # 허용되지 않는 size는 실제 스토어처럼 기본값(20)으로 응답
+            page_size = requested_size if requested_size in config.page_sizes else 20
+            try:
+                page_number = int(query.get("page") or 1)
+            except ValueError:
+                page_number = 1
+            if is_fragment:
+                fragment = render_listing_fragment(catalog, segments[0], page_number, page_size)
+                self._send(200, json.dumps(fragment, ensure_ascii=False), "application/json; charset=utf-8")
+            else:
+                self._send(200, render_listing_page(catalog, segments[0], page_number, page_size))
+            return
+
+        if len(segments) >= 3 and segments[1] == "products":
+            stats.incr("detail")
+            index = catalog.index_of(segments[2])
+            if index is None:
+                self._send(404, "<html><body>상품이 존재하지 않습니다.</body></html>")
+                return
+            if self._inject("detail"):
+                return
+            self._send(200, render_detail_page(catalog.product(index)))
+            return
+
+        stats.incr("not_found")
+        self._send(404, "<html><body>not found</body></html>")
+
+
+class MockSmartStore(object):
+    """Threaded mock server; usable from benchmarks via start()/stop() or as a context manager."""
+
+    def __init__(self, host="127.0.0.1", port=0, product_count=2000, config=None, verbose=False):
+        self.catalog = MockCatalog(product_count=product_count)
+        self.config = config or MockConfig()
+        self.stats = MockStats()
+        self.httpd = ThreadingHTTPServer((host, port), MockSmartStoreHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.catalog = self.catalog
+        self.httpd.config = self.config
+        self.httpd.stats = self.stats
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def origin(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listing_url(self, category="ALL", size=20, **params):
+        query = {"st": "RECENT", "dt": "BIG_IMAGE", "size": size}
+        query.update(params)
+        return f"{self.origin}/{self.config.shop}/category/{category}?{urlencode(query)}"
+
+    def product_url(self, index):
+        return f"{self.origin}/{self.config.shop}/products/{self.catalog.code_at(index)}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-smartstore", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local mock SmartStore server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--shop", default=DEFAULT_SHOP)
+    parser.add_argument("--products", type=int, default=2000, help="total products in the catalog")
+    parser.add_argument("--page-sizes", default=",".join(str(size) for size in DEFAULT_PAGE_SIZES),
+                        help="accepted listing size values (others fall back to 20)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of page requests answered with 503")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="fraction of requests delayed by --slow-ms")
+    parser.add_argument("--slow-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        shop=args.shop,
+        page_sizes=[int(size) for size in re.split(r"[\s,;]+", args.page_sizes) if size],
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        fail_rate=args.fail_rate,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        seed=args.seed,
+    )
+    server = MockSmartStore(args.host, args.port, product_count=args.products, config=config, verbose=args.verbose)
+    print(f"Mock SmartStore listening on {server.origin}")
+    print(f"Listing URL: {server.listing_url()}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
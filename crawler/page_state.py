@@ -0,0 +1,102 @@
+"""상세 페이지의 JSON-LD와 __PRELOADED_STATE__ 일부를 evaluate 한 번으로 읽는다.
+
+script 태그마다 inner_text()를 호출하면(태그 수십 개 × CDP 왕복) 카테고리 하나 찾는 데도
+왕복이 많이 든다. 페이지 안에서 파싱까지 끝낸 객체만 받아 상품별로 한 번만 읽고,
+카테고리/가격/상품명/브랜드는 이 결과에서 꺼낸다. 필드 해석은 HTTP 경로(http_extract)와 같다.
+"""
+from crawler.http_extract import category_from, price_from_state
+
+
+PAGE_STATE_JS = """
+() => {
+    const jsonLd = [];
+    for (const script of document.querySelectorAll("script")) {
+        const type = (script.type || "").toLowerCase();
+        const text = (script.textContent || "").trim();
+        // 기존 동작과 동일: ld+json 외에도 JSON 본문 + "category"를 가진 스크립트 포함
+        if (type !== "application/ld+json" && !(text.startsWith("{") && text.includes("category"))) {
+            continue;
+        }
+        try {
+            const data = JSON.parse(text);
+            for (const item of (Array.isArray(data) ? data : [data])) {
+                if (item && typeof item === "object") {
+                    jsonLd.push(item);
+                }
+            }
+        } catch (e) {}
+    }
+    const pick = (source, keys) => {
+        const out = {};
+        if (!source || typeof source !== "object") {
+            return out;
+        }
+        for (const key of keys) {
+            if (source[key] !== undefined) {
+                out[key] = source[key];
+            }
+        }
+        return out;
+    };
+    const state = window.__PRELOADED_STATE__ || {};
+    const simple = state.productSimpleView && state.productSimpleView.product;
+    const full = state.product && state.product.A;
+    const og = document.querySelector("meta[property='og:title']");
+    return {
+        jsonLd: jsonLd,
+        state: {
+            productSimpleView: {product: pick(simple, ["name", "salePrice", "discountedSalePrice", "price"])},
+            product: {A: pick(full, [
+                "name", "salePrice", "discountedSalePrice", "price", "category", "naverShoppingSearchInfo"
+            ])},
+        },
+        ogTitle: og ? (og.getAttribute("content") || "").trim() : null,
+    };
+}
+"""
+
+
+class ProductPageState(object):
+    """Parsed JSON-LD + PRELOADED_STATE slices of one product page (read once per product)."""
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.json_ld = data.get("jsonLd") or []
+        self.state = data.get("state") or {}
+        self.og_title = data.get("ogTitle") or None
+
+    @classmethod
+    def read(cls, page):
+        try:
+            return cls(page.evaluate(PAGE_STATE_JS))
+        except Exception as exc:
+            print(f"Failed to read page state: {exc}")
+            return cls()
+
+    @property
+    def category(self):
+        return category_from(self.state, self.json_ld)
+
+    @property
+    def price(self):
+        return price_from_state(self.state)
+
+    @property
+    def title(self):
+        simple = (self.state.get("productSimpleView") or {}).get("product") or {}
+        full = (self.state.get("product") or {}).get("A") or {}
+        for name in (simple.get("name"), full.get("name"), self.og_title):
+            if isinstance(name, str) and name.strip():
+                return name.strip().replace("\xa0", " ")
+        return None
+
+    @property
+    def brand(self):
+        for document in self.json_ld:
+            brand = document.get("brand")
+            if isinstance(brand, dict):
+                brand = brand.get("name")
+            if isinstance(brand, str) and brand.strip():
+                return brand.strip()
+        full = (self.state.get("product") or {}).get("A") or {}
+        return (full.get("naverShoppingSearchInfo") or {}).get("brandName") or None
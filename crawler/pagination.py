@@ -0,0 +1,736 @@
+"""리스트 페이지네이션 이동(번호 링크/이전·다음 버튼/URL 점프).
+
+product_list_crawl 내부 클로저였던 이동 로직을 ListingPaginator로 옮겨
+크롤러와 벤치마크(benchmarks/bench_pagination.py)가 같은 코드를 사용한다.
+클릭/네비게이션/시도 횟수를 세어 전략별 비용을 비교할 수 있다.
+
+전략:
+- plan(기본): 컨테이너의 data-shp-filter_con(pgn)과 보이는 번호 그룹을 한 번 읽어
+  최소 이동 순서(그룹 이동 + 번호 클릭)를 계산해 실행하고, 단계마다 리스트 변경을 검증
+- auto: 기존 시행착오 루프(최대 30회), plan 실패 시 폴백으로도 사용
+- next_only: '다음'만 반복 클릭
+
+페이지네이션 상태(현재 번호, 보이는 번호, 이전/다음 가능 여부, 첫 상품 href)는
+PAGINATION_PROBE_JS 한 번의 evaluate로 읽고, 클릭 대상은 data-nvr-pgn-id로 태깅해
+locator 한 번으로 클릭한다. 프로브가 컨테이너를 못 찾을 때만 기존 노드 순회 탐색을 쓴다.
+"""
+import json
+import re
+import time
+from functools import wraps
+from urllib.parse import parse_qsl, urlsplit
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from crawler.urls import update_query_params
+
+
+PAGINATION_STRATEGIES = ("plan", "auto", "next_only")
+
+# plan 실행 중 검증 실패 시 상태를 다시 읽어 재계획하는 최대 횟수
+MAX_REPLANS = 3
+
+PAGINATION_BUTTON_LABELS = {
+    "next": ["다음", "다음 페이지", "다음페이지", ">"],
+    "prev": ["이전", "이전 페이지", "이전페이지", "<"],
+}
+
+
+PGN_ID_ATTR = "data-nvr-pgn-id"
+
+# 컨테이너 탐색 → 현재 페이지/번호 링크/이전·다음 버튼을 한 번에 수집(요소는 data-nvr-pgn-id로 태깅)
+PAGINATION_PROBE_JS = """
+() => {
+  const ATTR = '%(attr)s';
+  const selectors = [
+    "div[data-shp-area='list.pgn'][role='menubar']",
+    "div[data-shp-contents-type='pgn'][role='menubar']",
+    "div[data-shp-area-id='pgn'][role='menubar']",
+    "nav[aria-label*='페이지']",
+    "nav[aria-label*='pagination']",
+    "nav[role='navigation']",
+    "div[class*='Pagination']",
+    "div[class*='paginate']",
+    "div[class*='paging']",
+  ];
+  const firstLink = document.querySelector("a[href*='/products/']");
+  const firstHref = firstLink ? firstLink.getAttribute('href') : null;
+  let container = null;
+  for (const sel of selectors) {
+    container = document.querySelector(sel);
+    if (container) { break; }
+  }
+  if (!container) { return {found: false, firstHref: firstHref}; }
+  window.__nvrPgnSeq = window.__nvrPgnSeq || 0;
+  const tag = (node) => {
+    if (!node.hasAttribute(ATTR)) { node.setAttribute(ATTR, String(++window.__nvrPgnSeq)); }
+    return node.getAttribute(ATTR);
+  };
+  const text = (node) => (node.innerText || node.textContent || '').trim();
+
+  let current = null;
+  try {
+    const raw = (container.getAttribute('data-shp-filter_con') || '').replace(/&quot;/g, '"');
+    if (raw) {
+      for (const item of JSON.parse(raw)) {
+        if (item && ['pgn', 'page', 'pageNum'].includes(item.key)) {
+          const m = String(item.value).match(/\\d+/);
+          if (m) { current = parseInt(m[0], 10); break; }
+        }
+      }
+    }
+  } catch (e) {}
+
+  const pages = {};
+  let nodes = Array.from(container.querySelectorAll("a[role='menuitem']"));
+  if (!nodes.length) { nodes = Array.from(container.querySelectorAll('a, button, span, li')); }
+  for (const node of nodes) {
+    const t = text(node);
+    if (!/^\\d+$/.test(t)) { continue; }
+    const n = parseInt(t, 10);
+    if (!(n in pages)) { pages[n] = tag(node); }
+    if (current === null && ['true', 'page'].includes(node.getAttribute('aria-current'))) { current = n; }
+  }
+
+  const controls = {next: null, prev: null};
+  for (const node of container.querySelectorAll("a[role='button'], button[role='button'], button")) {
+    if (node.getAttribute('aria-hidden') === 'true' || node.disabled) { continue; }
+    const t = text(node);
+    const label = t + ' ' + (node.getAttribute('aria-label') || '');
+    if (!controls.next && (label.includes('다음') || ['›', '>', '»'].includes(t))) { controls.next = tag(node); }
+    else if (!controls.prev && (label.includes('이전') || ['‹', '<', '«'].includes(t))) { controls.prev = tag(node); }
+  }
+  return {found: true, current: current, pages: pages, next: controls.next, prev: controls.prev, firstHref: firstHref};
+}
+""" % {"attr": PGN_ID_ATTR}
+
+
+def plan_page_route(current, visible_pages, target):
+    """Minimal step list from `current` (with `visible_pages` shown) to `target`.
+
+    Steps are ("next",), ("prev",) group hops followed by at most one ("page", n) click.
+    Group hops land on an unknown page of the neighbouring group, so only the first hop
+    count is exact; the caller re-plans from the state read after the hops.
+    """
+    if current == target:
+        return []
+    visible = sorted(set(visible_pages or []))
+    if target in visible:
+        return [("page", target)]
+    if not visible:
+        return [("next",)] if target > current else [("prev",)]
+    group_size = max(len(visible), 1)
+    if target > visible[-1]:
+        hops = max(1, -(-(target - visible[-1]) // group_size))
+        return [("next",)] * hops
+    hops = max(1, -(-(visible[0] - target) // group_size))
+    return [("prev",)] * hops
+
+
+def _timed(stage):
+    """Method decorator: record the call under `stage` on self.timer (StageTimer) when set."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.timer is None:
+                return func(self, *args, **kwargs)
+            with self.timer.span(stage):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ListingPaginator(object):
+    """Moves a listing page to a target page number and counts the work it took."""
+
+    def __init__(self, page, original_url, strategy="plan", page_jump_by_query=False, timer=None,
+                 debug_shot=None):
+        strategy = (strategy or "plan").lower().strip()
+        if strategy not in PAGINATION_STRATEGIES:
+            print(f"알 수 없는 PAGINATION_STRATEGY={strategy}, plan으로 처리합니다.")
+            strategy = "plan"
+        self.page = page
+        self.original_url = original_url
+        self.strategy = strategy
+        self.page_jump_by_query = page_jump_by_query
+        self.timer = timer
+        self._debug_shot = debug_shot
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.clicks = 0
+        self.navigations = 0
+        self.attempts = 0
+        self.probes = 0
+
+    def counters(self):
+        return {
+            "clicks": self.clicks,
+            "navigations": self.navigations,
+            "attempts": self.attempts,
+            "probes": self.probes,
+        }
+
+    def debug_shot(self, label):
+        if self._debug_shot is not None:
+            self._debug_shot(self.page, label)
+
+    def _click(self, target, **kwargs):
+        self.clicks += 1
+        target.click(**kwargs)
+
+    def _goto(self, url):
+        self.navigations += 1
+        self.page.goto(url)
+
+    def probe(self):
+        """Whole pagination state in one evaluate; None when the script fails."""
+        self.probes += 1
+        try:
+            state = self.page.evaluate(PAGINATION_PROBE_JS)
+        except Exception as exc:
+            print(f"페이지네이션 프로브 실패: {exc}")
+            return None
+        if state.get("found"):
+            state["pages"] = {int(number): pgn_id for number, pgn_id in (state.get("pages") or {}).items()}
+        return state
+
+    def locator_for(self, pgn_id):
+        return self.page.locator(f"[{PGN_ID_ATTR}='{pgn_id}']")
+
+    @_timed("pagination.scroll")
+    def scroll_to_pagination(self):
+        try:
+            self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        except PlaywrightTimeoutError:
+            pass
+        time.sleep(0.8)
+        # 하단 스크롤 후 간단 스크린샷
+        self.debug_shot("scrolled_bottom")
+
+    def wait_pagination_ready(self, timeout_ms=8000):
+        # 페이지네이션 컨테이너 또는 숫자/버튼이 나타날 때까지 대기
+        end = time.time() + (timeout_ms / 1000.0)
+        while time.time() < end:
+            state = self.probe()
+            if state and state.get("found") and (state["pages"] or state.get("next") or state.get("prev")):
+                return True
+            time.sleep(0.3)
+        return False
+
+    def get_first_list_href(self):
+        try:
+            return self.page.evaluate(
+                "() => { const el = document.querySelector(\"a[href*='/products/']\"); "
+                "return el ? el.getAttribute('href') : null; }"
+            )
+        except Exception:
+            return None
+
+    def find_pagination_container(self):
+        candidates = [
+            "div[data-shp-area='list.pgn'][role='menubar']",
+            "div[data-shp-contents-type='pgn'][role='menubar']",
+            "div[data-shp-area-id='pgn'][role='menubar']",
+            # 폴백들
+            "nav[aria-label*='페이지']",
+            "nav[aria-label*='pagination']",
+            "nav[role='navigation']",
+            "div[class*='Pagination']",
+            "div[class*='paginate']",
+            "div[class*='paging']",
+        ]
+        for sel in candidates:
+            try:
+                elem = self.page.query_selector(sel)
+            except Exception:
+                elem = None
+            if elem:
+                return elem
+        return None
+
+    def get_pgn_from_container(self):
+        """컨테이너의 data-shp-filter_con 속성에서 pgn 값을 파싱(네이버 구조 특화)."""
+        try:
+            container = self.find_pagination_container()
+            if not container:
+                return None
+            raw = container.get_attribute("data-shp-filter_con")
+            if not raw:
+                return None
+            # HTML 인코딩된 문자열 처리
+            raw = raw.replace('&quot;', '"')
+            data = json.loads(raw)
+            if isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and item.get('key') in {'pgn', 'page', 'pageNum'}:
+                        val = item.get('value')
+                        try:
+                            return int(re.findall(r"\d+", str(val))[0])
+                        except Exception:
+                            pass
+        except Exception:
+            return None
+        return None
+
+    @_timed("pagination.find_link")
+    def find_page_link_in_container(self, target_page):
+        state = self.probe()
+        if state and state.get("found"):
+            pgn_id = state["pages"].get(int(target_page))
+            return self.locator_for(pgn_id) if pgn_id else None
+        container = self.find_pagination_container()
+        if container is None:
+            return None
+        # 접근성 역할 기반으로 우선 탐색
+        try:
+            cand = container.get_by_role("link", name=str(target_page))
+            if cand and cand.count() > 0:
+                return cand.first
+        except Exception:
+            pass
+        try:
+            cand = container.get_by_role("button", name=str(target_page))
+            if cand and cand.count() > 0:
+                return cand.first
+        except Exception:
+            pass
+        # 숫자 텍스트 필터 탐색
+        for sel in ["a", "button", "span", "li"]:
+            for node in container.query_selector_all(sel):
+                try:
+                    t = (node.inner_text() or "").strip()
+                except Exception:
+                    continue
+                if t.isdigit() and int(t) == target_page:
+                    return node
+        return None
+
+    @_timed("pagination.group_hop")
+    def ensure_group_has_page(self, target_page, max_group_hops=20):
+        """타겟 숫자 링크가 현재 보이는 그룹에 나타나도록 '다음' 그룹 이동을 반복."""
+        hops = 0
+        while hops < max_group_hops:
+            self.scroll_to_pagination()
+            link = self.find_page_link_in_container(target_page)
+            if link:
+                return True
+            # 다음 그룹 이동 시도
+            before_sig = self.get_first_list_href()
+            print(f"타겟 {target_page}가 보이지 않아 '다음' 그룹 이동 시도")
+            if not self.click_pagination_control("next"):
+                break
+            # 리스트 변화 대기 (첫 상품 href 변경 기준)
+            for _ in range(10):
+                time.sleep(0.5)
+                after_sig = self.get_first_list_href()
+                if before_sig and after_sig and before_sig != after_sig:
+                    break
+            hops += 1
+        return False
+
+    @_timed("pagination.detect_page")
+    def get_current_page_number(self):
+        # 0) 프로브 한 번으로 pgn/aria-current 확인
+        state = self.probe()
+        if state and isinstance(state.get("current"), int):
+            return state["current"]
+        # 1) 컨테이너의 pgn 값 파싱 시도
+        pgn_val = self.get_pgn_from_container()
+        if isinstance(pgn_val, int):
+            return pgn_val
+        selectors = [
+            'a[aria-current="true"]',
+            'button[aria-current="true"]',
+            '[aria-current="page"]'
+        ]
+        # 컨테이너에서 role=menuitem + aria-current 우선 확인
+        try:
+            container = self.find_pagination_container()
+            if container:
+                node = container.query_selector("a[role='menuitem'][aria-current='true']")
+                if node:
+                    txt = (node.inner_text() or '').strip()
+                    m = re.search(r'\d+', txt)
+                    if m:
+                        return int(m.group(0))
+        except Exception:
+            pass
+        for selector in selectors:
+            locator = self.page.locator(selector)
+            try:
+                locator.first.wait_for(state="attached", timeout=5000)
+            except PlaywrightTimeoutError:
+                continue
+
+            try:
+                text = locator.first.inner_text().strip()
+            except PlaywrightTimeoutError:
+                continue
+
+            match = re.search(r'\d+', text)
+            if match:
+                return int(match.group())
+        # 쿼리스트링에서 page 파라미터 추출 시도
+        try:
+            parts = urlsplit(self.page.url)
+            query = dict(parse_qsl(parts.query, keep_blank_values=True))
+            for key in ["page", "pageIndex", "pagingIndex", "pageNum", "p"]:
+                if key in query:
+                    try:
+                        return int(re.findall(r"\d+", query[key])[0])
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+        print(f"현재 페이지 번호 탐색 실패 - URL: {self.page.url}")
+        try:
+            print("aria-current 후보:", self.page.locator('[aria-current]').all_inner_texts())
+        except Exception:
+            pass
+        return None
+
+    @_timed("pagination.find_link")
+    def find_page_link(self, target_page):
+        # 1) 기존 네비게이션 링크(a[role=menuitem])에서 검색
+        for link in self.page.query_selector_all('a[role="menuitem"]'):
+            try:
+                text = link.inner_text().strip()
+            except PlaywrightTimeoutError:
+                continue
+            match = re.search(r'^\d+$', text)
+            if match and int(text) == target_page:
+                return link
+
+        # 2) 접근성 역할 기반 탐색
+        try:
+            candidate = self.page.get_by_role("link", name=str(target_page))
+            if candidate and candidate.count() > 0:
+                return candidate.first
+        except Exception:
+            pass
+        try:
+            candidate = self.page.get_by_role("button", name=str(target_page))
+            if candidate and candidate.count() > 0:
+                return candidate.first
+        except Exception:
+            pass
+
+        # 3) 포괄적 탐색(a, button)에서 텍스트가 숫자만이고 타겟과 일치하는 요소 선택
+        for sel in ["a", "button"]:
+            for link in self.page.query_selector_all(sel):
+                try:
+                    text = link.inner_text().strip()
+                except Exception:
+                    continue
+                if not text:
+                    continue
+                if re.fullmatch(r"\d+", text) and int(text) == target_page:
+                    return link
+
+        return None
+
+    @_timed("pagination.click_control")
+    def click_pagination_control(self, direction):
+        state = self.probe()
+        if state and state.get("found") and state.get(direction):
+            try:
+                self._click(self.locator_for(state[direction]), timeout=1500)
+                self.page.wait_for_load_state("networkidle")
+                time.sleep(1)
+                return True
+            except Exception:
+                pass
+        labels = PAGINATION_BUTTON_LABELS[direction]
+        for label in labels:
+            try:
+                self._click(self.page.get_by_role("button", name=label), timeout=1500)
+                self.page.wait_for_load_state("networkidle")
+                time.sleep(1)
+                return True
+            except PlaywrightTimeoutError:
+                continue
+            except Exception:
+                continue
+
+        # 컨테이너 내부에서 '다음/이전' 우선 탐색
+        container = self.find_pagination_container()
+        if container:
+            try:
+                # role=button + aria-hidden=false 후보들 검사
+                for node in container.query_selector_all("a[role='button'],button[role='button']"):
+                    try:
+                        hidden = node.get_attribute('aria-hidden')
+                    except Exception:
+                        hidden = None
+                    if hidden == 'true':
+                        continue
+                    try:
+                        t = (node.inner_text() or '').strip()
+                    except Exception:
+                        t = ''
+                    if direction == 'next' and ("다음" in t or t in {"›", ">", "»"}):
+                        self._click(node)
+                        self.page.wait_for_load_state("networkidle")
+                        time.sleep(1)
+                        return True
+                    if direction == 'prev' and ("이전" in t or t in {"‹", "<", "«"}):
+                        self._click(node)
+                        self.page.wait_for_load_state("networkidle")
+                        time.sleep(1)
+                        return True
+                # 텍스트 기반 후보
+                text_sel = (
+                    "a:has-text('다음'),button:has-text('다음')" if direction == 'next' else "a:has-text('이전'),button:has-text('이전')"
+                )
+                cand = container.query_selector(text_sel)
+                if cand:
+                    try:
+                        cand.scroll_into_view_if_needed()
+                    except Exception:
+                        pass
+                    self._click(cand)
+                    self.page.wait_for_load_state("networkidle")
+                    time.sleep(1)
+                    return True
+                # 구조 기반 폴백: role=button 앵커 배열의 양 끝을 사용
+                rb = container.query_selector_all("a[role='button'],button[role='button']")
+                if rb:
+                    try:
+                        node = rb[-1] if direction == 'next' else rb[0]
+                        try:
+                            node.scroll_into_view_if_needed()
+                        except Exception:
+                            pass
+                        self._click(node)
+                        self.page.wait_for_load_state("networkidle")
+                        time.sleep(1)
+                        return True
+                    except Exception:
+                        pass
+                # data-shp-contents-id 보유 요소 우선 클릭(네이버 특화)
+                rb2 = container.query_selector_all("a[role='button'][data-shp-contents-id],button[role='button'][data-shp-contents-id]")
+                if rb2:
+                    try:
+                        node = rb2[-1] if direction == 'next' else rb2[0]
+                        try:
+                            node.scroll_into_view_if_needed()
+                        except Exception:
+                            pass
+                        self._click(node)
+                        self.page.wait_for_load_state("networkidle")
+                        time.sleep(1)
+                        return True
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+
+        selector = (
+            'a[role="button"][aria-hidden="false"]:last-child'
+            if direction == "next"
+            else 'a[role="button"][aria-hidden="false"]:first-child'
+        )
+        button = self.page.query_selector(selector)
+        if button:
+            self._click(button)
+            self.page.wait_for_load_state("networkidle")
+            time.sleep(1)
+            return True
+
+        return False
+
+    def read_pagination_state(self):
+        """Current page, visible page ids and next/prev ids from one probe."""
+        state = self.probe()
+        if not state or not state.get("found") or state.get("current") is None or not state["pages"]:
+            return None
+        return state
+
+    def wait_list_change(self, before_sig, timeout_s=10.0):
+        """Poll the first product href until it differs from before_sig."""
+        end = time.time() + timeout_s
+        while time.time() < end:
+            after_sig = self.get_first_list_href()
+            if after_sig and after_sig != before_sig:
+                return True
+            time.sleep(0.15)
+        return False
+
+    def _run_step(self, state, step):
+        pgn_id = state["pages"].get(step[1]) if step[0] == "page" else state[step[0]]
+        if pgn_id is None:
+            print(f"plan: {step} 대상 요소 없음")
+            return False
+        before_sig = state.get("firstHref")
+        self._click(self.locator_for(pgn_id))
+        if not self.wait_list_change(before_sig):
+            print(f"plan: {step} 이후 리스트 변경 미감지")
+            return False
+        return True
+
+    @_timed("pagination.plan")
+    def go_to_page_planned(self, target_page):
+        """Planner: read state once per hop, click the minimal route, verify via list signature."""
+        target = int(target_page)
+        self.scroll_to_pagination()
+        if not self.wait_pagination_ready(8000):
+            return False
+        replans = 0
+        state = self.read_pagination_state()
+        if state is not None:
+            route = plan_page_route(state["current"], state["pages"].keys(), target)
+            hops = sum(1 for step in route if step[0] != "page")
+            print(f"plan: 현재 {state['current']} → 목표 {target} (그룹 이동 {hops}회 예상)")
+        while state is not None:
+            self.attempts += 1
+            if state["current"] == target:
+                print(f"plan: 페이지 {target} 도달 (클릭 {self.clicks}회)")
+                return True
+            route = plan_page_route(state["current"], state["pages"].keys(), target)
+            step = route[0]
+            if not self._run_step(state, step):
+                replans += 1
+                if replans > MAX_REPLANS:
+                    break
+            previous = state["current"]
+            state = self.read_pagination_state()
+            if state is None:
+                break
+            if step[0] == "page" and state["current"] != step[1]:
+                print(f"plan: 페이지 {step[1]} 클릭 후 현재 {state['current']}")
+                replans += 1
+            elif step[0] == "next" and state["current"] <= previous:
+                replans += 1
+            elif step[0] == "prev" and state["current"] >= previous:
+                replans += 1
+            if replans > MAX_REPLANS:
+                break
+        print(f"plan: 페이지 {target} 계획 이동 실패, 기존 방식으로 재시도")
+        return False
+
+    @_timed("pagination.go_to_page")
+    def go_to_page_number(self, target_page):
+        attempt = 0
+        max_attempts = 30
+        if self.strategy == 'plan' and self.go_to_page_planned(target_page):
+            return True
+        # next_only 전략: 숫자 링크 사용 없이 '다음'만 반복 클릭
+        if self.strategy == 'next_only':
+            self.scroll_to_pagination()
+            self.wait_pagination_ready(8000)
+            cur = self.get_current_page_number() or 1
+            target = int(target_page)
+            print(f"next_only: 현재 {cur} → 목표 {target}")
+            # 안전 범위 내에서 목표까지 전진
+            for _ in range(min(200, max(0, target - cur) + 20)):
+                if cur >= target:
+                    break
+                self.attempts += 1
+                before_sig = self.get_first_list_href()
+                if not self.click_pagination_control('next'):
+                    print("next 버튼 클릭 실패")
+                    return False
+                for __ in range(12):
+                    time.sleep(0.5)
+                    after_sig = self.get_first_list_href()
+                    if before_sig and after_sig and before_sig != after_sig:
+                        break
+                # aria-current가 없을 수 있으므로 보수적으로 증가
+                new_cur = self.get_current_page_number()
+                cur = new_cur if new_cur is not None else (cur + 1)
+            if cur == target:
+                print(f"next_only: 페이지 {target} 도달")
+                return True
+            print("next_only: 페이지 번호 미판별, 리스트 변화 기준 성공 처리")
+            return True
+        while attempt < max_attempts:
+            attempt += 1
+            self.attempts += 1
+            self.scroll_to_pagination()
+            current_page_num = self.get_current_page_number()
+            self.debug_shot(f"attempt{attempt}_target{target_page}_after_detect")
+
+            if current_page_num == target_page:
+                print(f"페이지 {target_page}에 이미 위치해 있습니다.")
+                return True
+
+            # 먼저 현재 보이는 그룹 내에서 타겟 숫자 링크를 찾음
+            page_link = self.find_page_link_in_container(target_page) or self.find_page_link(target_page)
+            if page_link:
+                try:
+                    page_link.scroll_into_view_if_needed()
+                except PlaywrightTimeoutError:
+                    pass
+                time.sleep(0.3)
+                self.debug_shot(f"attempt{attempt}_target{target_page}_before_link_click")
+                before_sig = self.get_first_list_href()
+                self._click(page_link)
+                self.page.wait_for_load_state("networkidle")
+                time.sleep(1)
+                self.debug_shot(f"attempt{attempt}_target{target_page}_after_link_click")
+                if self.get_current_page_number() == target_page:
+                    print(f"페이지 {target_page}로 이동 완료, 현재 URL: {self.page.url}")
+                    return True
+                # 페이지 번호 판단이 불가한 경우, 리스트 시그니처 변경으로 이동 검증
+                after_sig = self.get_first_list_href()
+                if before_sig and after_sig and before_sig != after_sig:
+                    print(f"리스트 변경 감지로 페이지 {target_page} 이동 성공으로 간주")
+                    return True
+                continue
+
+            if current_page_num is None:
+                print("현재 페이지 번호를 확인할 수 없어 다시 시도합니다.")
+                # URL 파라미터 기반 점프를 우선 1회 시도
+                if self.page_jump_by_query and attempt in {1, 5, 10, 20}:
+                    try:
+                        for key in ["page", "pageIndex", "pagingIndex", "pageNum", "p"]:
+                            jump_url = update_query_params(self.original_url, **{key: target_page})
+                            print(f"URL 점프 시도(번호 미탐지): {jump_url}")
+                            self._goto(jump_url)
+                            self.page.wait_for_load_state("networkidle")
+                            time.sleep(1)
+                            num = self.get_current_page_number()
+                            if num == target_page:
+                                print(f"URL 점프로 페이지 {target_page} 이동 확인")
+                                return True
+                    except Exception as exc:
+                        print(f"URL 점프 실패: {exc}")
+                # 숫자 링크가 보이는 그룹이 아닐 수 있으니 그룹 이동 시도
+                if self.ensure_group_has_page(target_page):
+                    continue
+                self.page.wait_for_timeout(1000)
+                continue
+
+            direction = "next" if target_page > current_page_num else "prev"
+            print(f"페이지 {target_page} 이동을 위해 {direction} 버튼 클릭 시도 (현재 {current_page_num}).")
+            before_sig = self.get_first_list_href()
+            if not self.click_pagination_control(direction):
+                print(f"{direction} 버튼을 찾을 수 없습니다.")
+                # 버튼 탐색 실패 시 URL 파라미터 기반 점프 시도
+                if self.page_jump_by_query:
+                    try:
+                        for key in ["page", "pageIndex", "pagingIndex", "pageNum", "p"]:
+                            jump_url = update_query_params(self.original_url, **{key: target_page})
+                            print(f"URL 점프 시도: {jump_url}")
+                            self.debug_shot(f"attempt{attempt}_target{target_page}_before_url_jump")
+                            self._goto(jump_url)
+                            self.page.wait_for_load_state("networkidle")
+                            time.sleep(1)
+                            self.debug_shot(f"attempt{attempt}_target{target_page}_after_url_jump")
+                            num = self.get_current_page_number()
+                            if num == target_page:
+                                print(f"URL 점프로 페이지 {target_page} 이동 확인")
+                                return True
+                    except Exception as exc:
+                        print(f"URL 점프 실패: {exc}")
+                return False
+            # 리스트 변경으로 이동 검증
+            for _ in range(10):
+                time.sleep(0.5)
+                after_sig = self.get_first_list_href()
+                if before_sig and after_sig and before_sig != after_sig:
+                    break
+
+        print(f"페이지 {target_page} 이동 시도가 {max_attempts}회 초과로 실패했습니다.")
+        return False
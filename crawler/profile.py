@@ -0,0 +1,97 @@
+"""Chromium 영구 프로필(user-data-dir)과 디스크 캐시 관리.
+
+새 컨텍스트마다 빈 프로필로 시작하면 스마트스토어 JS 번들/CSS/폰트를 매번 다시 받는다.
+영구 프로필을 쓰면 HTTP 캐시가 실행 간에 재사용되고, 여기서 캐시 크기 상한과
+주기적 정리(오래된 캐시 파일 삭제)를 맡는다. 정리는 브라우저가 뜨기 전에만 수행한다.
+"""
+import json
+import time
+from pathlib import Path
+
+
+CACHE_DIR_NAME = "DiskCache"
+CLEANUP_MARKER = "crawler_profile.json"
+
+
+def _cache_files(root):
+    files = []
+    for path in Path(root).rglob("*"):
+        try:
+            if path.is_file():
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            continue
+    return files
+
+
+class BrowserProfile(object):
+    def __init__(self, user_data_dir, cache_max_mb=512, max_age_days=7, cleanup_interval_hours=24):
+        self.user_data_dir = Path(user_data_dir)
+        self.cache_dir = self.user_data_dir / CACHE_DIR_NAME
+        self.cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 86400 if max_age_days else None
+        self.cleanup_interval = cleanup_interval_hours * 3600
+
+    def for_worker(self, name):
+        """Separate profile for another browser process (Chromium locks a user-data-dir per process)."""
+        return BrowserProfile(
+            self.user_data_dir / "workers" / name,
+            cache_max_mb=self.cache_max_bytes / (1024 * 1024),
+            max_age_days=(self.max_age_seconds or 0) / 86400,
+            cleanup_interval_hours=self.cleanup_interval / 3600,
+        )
+
+    def chromium_args(self):
+        # Chromium 자체 상한도 같이 지정(실행 중 캐시가 무한히 커지지 않도록)
+        return [f"--disk-cache-dir={self.cache_dir}", f"--disk-cache-size={self.cache_max_bytes}"]
+
+    def cache_size(self):
+        if not self.cache_dir.exists():
+            return 0
+        return sum(size for _, size, _ in _cache_files(self.cache_dir))
+
+    def _read_marker(self):
+        try:
+            return json.loads((self.user_data_dir / CLEANUP_MARKER).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_marker(self, data):
+        try:
+            (self.user_data_dir / CLEANUP_MARKER).write_text(json.dumps(data), encoding="utf-8")
+        except OSError:
+            pass
+
+    def prepare(self):
+        """Create the profile and trim the disk cache before launch. Returns bytes removed."""
+        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        marker = self._read_marker()
+        now = time.time()
+        files = _cache_files(self.cache_dir)
+        total = sum(size for _, size, _ in files)
+        periodic = now - float(marker.get("last_cleanup") or 0) >= self.cleanup_interval
+        if total <= self.cache_max_bytes and not periodic:
+            return 0
+
+        removed = 0
+        files.sort(key=lambda item: item[0])
+        # 상한 초과 시 80%까지 오래된 순으로 삭제, 주기 정리 때는 max_age 지난 파일도 삭제
+        target = self.cache_max_bytes * 0.8 if total > self.cache_max_bytes else total
+        for mtime, size, path in files:
+            expired = periodic and self.max_age_seconds and now - mtime > self.max_age_seconds
+            if total - removed <= target and not expired:
+                continue
+            try:
+                path.unlink()
+                removed += size
+            except OSError:
+                continue
+        self._write_marker({"last_cleanup": now, "removed_bytes": removed, "cache_bytes": total - removed})
+        if removed:
+            print(
+                f"브라우저 캐시 정리: {removed / 1048576:.1f}MB 삭제, "
+                f"현재 {(total - removed) / 1048576:.1f}MB / 상한 {self.cache_max_bytes / 1048576:.0f}MB"
+            )
+        return removed
@@ -0,0 +1,79 @@
+"""오프라인 녹화/재생: 상품 상세·리스트 페이지 네트워크를 HAR로 저장하고 디스크에서 재생.
+
+- record: 각 페이지에 route_from_har(update=True)를 걸어 실제 응답을 HAR(zip)로 저장
+  (HAR 파일은 BrowserContext.close() 시점에 기록된다)
+- replay: 같은 HAR에서만 응답을 제공하고, HAR에 없는 요청과 페이지 외 요청은 모두 중단
+  (네트워크 없이 결정적으로 get_product_data / product_list_crawl 실행)
+"""
+import random
+import re
+from pathlib import Path
+
+
+REPLAY_MODES = ("off", "record", "replay")
+
+
+def _safe_key(key):
+    return re.sub(r"[^0-9A-Za-z_.-]+", "_", str(key)).strip("_") or "unknown"
+
+
+class ReplayStore(object):
+    def __init__(self, root, mode="off", seed=None):
+        mode = (mode or "off").lower().strip()
+        if mode not in REPLAY_MODES:
+            print(f"알 수 없는 CRAWL_REPLAY_MODE={mode}, off로 처리합니다.")
+            mode = "off"
+        self.root = Path(root)
+        self.mode = mode
+        self.seed = seed
+        self.attached = []
+        self.missing = []
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    def har_path(self, kind, key):
+        return self.root / kind / f"{_safe_key(key)}.har.zip"
+
+    def install_context(self, context):
+        """Context-wide setup: seed randomness and, in replay mode, block every unmatched request."""
+        if not self.enabled:
+            return
+        if self.seed is not None:
+            # option_crawl의 random.choice 등 임의 선택을 녹화/재생 간 동일하게 유지
+            random.seed(self.seed)
+        if self.mode == "replay":
+            # 페이지 단위 route_from_har가 우선 적용되고, 여기까지 내려온 요청은 네트워크로 나가지 않음
+            context.route("**/*", lambda route: route.abort())
+        print(f"Replay mode={self.mode}, dir={self.root}")
+
+    def attach(self, page, kind, key):
+        """Attach the HAR for (kind, key) to page. Returns False when replay data is missing."""
+        if not self.enabled:
+            return True
+        path = self.har_path(kind, key)
+        if self.mode == "record":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            page.route_from_har(
+                str(path),
+                update=True,
+                update_content="attach",
+                update_mode="minimal",
+            )
+            self.attached.append(path)
+            return True
+        if not path.exists():
+            print(f"Replay HAR 없음({kind}/{key}): {path}")
+            self.missing.append(path)
+            return False
+        page.route_from_har(str(path), not_found="abort")
+        self.attached.append(path)
+        return True
+
+    def summary(self):
+        if not self.enabled:
+            return ""
+        return (
+            f"Replay {self.mode}: HAR {len(self.attached)}개 사용, 누락 {len(self.missing)}개 ({self.root})"
+        )
@@ -0,0 +1,144 @@
+"""폴백 셀렉터 체인의 적중 통계와 학습된 시도 순서.
+
+체인(예: 상세 컨텐츠 셀렉터 10개)을 매번 고정 순서로 시도하면 앞쪽 셀렉터가 빗나갈 때마다
+CDP 왕복(때로는 타임아웃)이 든다. 여기서는 체인별로 최근에 맞은 셀렉터를 맨 앞으로 옮기고
+(빗나간 셀렉터만 건너뛰므로 우선순위는 최대한 유지), 일정 횟수마다 원래 순서로 한 번씩
+다시 시도해 상위 셀렉터가 다시 맞기 시작하면 복귀시킨다. 학습된 순서는 JSON으로 저장해
+다음 실행에서 이어 쓴다.
+
+체인 끝의 포괄 셀렉터(예: '#INTRODUCE' 전체 래퍼)는 구체적인 셀렉터가 모두 빗나갈 때만 써야
+하므로 catch_all로 지정하면 적중해도 앞으로 옮기지 않고 선언된 자리에서만 시도한다.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class SelectorStats(object):
+    def __init__(self, path=None, timer=None, explore_every=50, enabled=True, catch_all=None):
+        """catch_all: {chain: selectors} that are never promoted (they keep their declared position)."""
+        self.path = Path(path) if path else None
+        self.timer = timer
+        self.explore_every = explore_every
+        self.enabled = enabled
+        self.catch_all = {chain: frozenset(selectors) for chain, selectors in (catch_all or {}).items()}
+        self._lock = threading.Lock()
+        self.chains = {}
+        self._load()
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"셀렉터 통계 파일을 읽지 못해 새로 시작합니다: {exc}")
+            return
+        self.chains = data.get("chains", {}) if isinstance(data, dict) else {}
+
+    def _chain(self, chain):
+        entry = self.chains.get(chain)
+        if entry is None:
+            entry = self.chains[chain] = {
+                "order": [], "resolves": 0, "first_try": 0, "failures": 0, "selectors": {}
+            }
+        return entry
+
+    def _selector(self, entry, selector):
+        stats = entry["selectors"].get(selector)
+        if stats is None:
+            stats = entry["selectors"][selector] = {"hits": 0, "misses": 0, "miss_seconds": 0.0}
+        return stats
+
+    def order(self, chain, selectors):
+        """Learned try-order: most recently successful selectors first, the rest in declared order."""
+        selectors = list(selectors)
+        if not self.enabled:
+            return selectors
+        catch_all = self.catch_all.get(chain, frozenset())
+        with self._lock:
+            entry = self._chain(chain)
+            entry["resolves"] += 1
+            if self.explore_every and entry["resolves"] % self.explore_every == 0:
+                return selectors
+            # 이전 실행에서 저장된 순서에 포괄 셀렉터가 남아 있어도 앞으로 오지 않게 거른다
+            learned = [selector for selector in entry["order"] if selector in selectors and selector not in catch_all]
+        return learned + [selector for selector in selectors if selector not in learned]
+
+    def record_hit(self, chain, selector, position):
+        with self._lock:
+            entry = self._chain(chain)
+            self._selector(entry, selector)["hits"] += 1
+            if position == 0:
+                entry["first_try"] += 1
+            if selector in self.catch_all.get(chain, ()):
+                return
+            if selector in entry["order"]:
+                entry["order"].remove(selector)
+            entry["order"].insert(0, selector)
+
+    def record_failure(self, chain):
+        with self._lock:
+            self._chain(chain)["failures"] += 1
+
+    def record_miss(self, chain, selector, seconds):
+        with self._lock:
+            stats = self._selector(self._chain(chain), selector)
+            stats["misses"] += 1
+            stats["miss_seconds"] += seconds
+        if self.timer is not None:
+            # 체인별 miss 비용이 단계 타이밍(요약/상품별 JSONL)에 그대로 드러나도록 기록
+            self.timer.record(f"selector_miss.{chain}", seconds)
+
+    def resolve(self, chain, selectors, probe):
+        """Try probe(selector) in learned order; returns (result, selector) for the first truthy result.
+
+        chain=None keeps the declared order and records nothing.
+        """
+        tracked = self.enabled and chain is not None
+        ordered = self.order(chain, selectors) if tracked else list(selectors)
+        for position, selector in enumerate(ordered):
+            start = time.perf_counter()
+            result = probe(selector)
+            if result:
+                if tracked:
+                    self.record_hit(chain, selector, position)
+                return result, selector
+            if tracked:
+                self.record_miss(chain, selector, time.perf_counter() - start)
+        if tracked:
+            self.record_failure(chain)
+        return None, None
+
+    def save(self):
+        if self.path is None or not self.enabled:
+            return
+        with self._lock:
+            payload = json.dumps({"chains": self.chains, "saved": time.time()}, ensure_ascii=False, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"셀렉터 통계 저장 실패: {exc}")
+
+    def summary(self):
+        lines = ["셀렉터 체인 통계 (체인: 첫 시도 적중률, miss 누적 시간, 현재 1순위)"]
+        with self._lock:
+            for chain in sorted(self.chains):
+                entry = self.chains[chain]
+                selectors = entry["selectors"]
+                hits = sum(stats["hits"] for stats in selectors.values())
+                if not hits and not entry["failures"]:
+                    continue
+                miss_seconds = sum(stats["miss_seconds"] for stats in selectors.values())
+                first_rate = entry["first_try"] / float(hits + entry["failures"])
+                leader = entry["order"][0] if entry["order"] else "-"
+                lines.append(
+                    f"  {chain}: {first_rate:.0%} ({hits}건 적중/{entry['failures']}건 실패), "
+                    f"miss {miss_seconds:.2f}s, 1순위 {leader[:60]}"
+                )
+        return "\n".join(lines)
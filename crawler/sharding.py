@@ -0,0 +1,129 @@
+"""멀티 프로세스 샤딩: 페이지 범위(또는 상품 URL 목록)를 N개 워커 프로세스로 나눠 실행.
+
+코디네이터가 같은 엔진을 샤드별 환경변수(CRAWL_ONLY_PAGES 또는 CRAWL_INPUT_FILE,
+CRAWL_SHARD_OUTPUT 등)로 N번 실행하고, 각 워커가 남긴 레코드 버퍼(pickle)를 합쳐
+상품 코드 기준으로 중복 제거한 뒤 하나의 엑셀로 기록한다.
+"""
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from crawler.state import product_code_from_url
+
+
+def split_contiguous(items, shard_count):
+    """Split items into at most shard_count contiguous, nearly equal chunks (no empty chunks)."""
+    items = list(items)
+    shard_count = max(1, min(shard_count, len(items)))
+    size, extra = divmod(len(items), shard_count)
+    chunks = []
+    start = 0
+    for index in range(shard_count):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+
+class Shard(object):
+    def __init__(self, index, env, output_path, log_path):
+        self.index = index
+        self.env = env
+        self.output_path = Path(output_path)
+        self.log_path = Path(log_path)
+        # 로거 시작 전 오류(import 실패, 잘못된 설정)와 traceback까지 남는 콘솔 출력
+        self.console_path = self.log_path.with_name(f"shard_{index}_console.txt")
+        self._console = None
+        self.process = None
+        self.returncode = None
+        self.started = None
+        self.elapsed = None
+
+
+def build_shards(shard_dir, shard_envs):
+    """shard_envs: list of dicts with the per-shard overrides (pages or input file)."""
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    shards = []
+    for index, overrides in enumerate(shard_envs):
+        output_path = shard_dir / f"shard_{index}.pkl"
+        log_path = shard_dir / f"shard_{index}_log.txt"
+        env = {
+            "CRAWL_SHARD_INDEX": str(index),
+            "CRAWL_SHARD_OUTPUT": str(output_path),
+            "CRAWL_SHARDS": "1",
+            "LOG_FILE": str(log_path),
+            "TIMING_JSONL_PATH": str(shard_dir / f"shard_{index}_timings.jsonl"),
+        }
+        env.update({key: str(value) for key, value in overrides.items()})
+        shards.append(Shard(index, env, output_path, log_path))
+    return shards
+
+
+def run_shards(command, shards, poll_interval=1.0, cwd=None):
+    """Launch one process per shard (own interpreter, own browser) and wait for all of them.
+
+    command: worker argv, e.g. [sys.executable, "-m", "crawler.engine"].
+    """
+    for shard in shards:
+        env = dict(os.environ)
+        env.update(shard.env)
+        if shard.output_path.exists():
+            shard.output_path.unlink()
+        shard.started = time.perf_counter()
+        # 워커 콘솔 출력(stdout+stderr)은 샤드별 파일로, 진행 상황만 코디네이터가 출력
+        shard._console = shard.console_path.open("w", encoding="utf-8")
+        shard.process = subprocess.Popen(
+            list(command),
+            cwd=cwd,
+            env=env,
+            stdout=shard._console,
+            stderr=subprocess.STDOUT,
+        )
+        print(f"샤드 {shard.index} 시작 (pid={shard.process.pid}, log={shard.log_path})")
+
+    pending = list(shards)
+    while pending:
+        for shard in list(pending):
+            code = shard.process.poll()
+            if code is None:
+                continue
+            shard.returncode = code
+            shard.elapsed = time.perf_counter() - shard.started
+            shard._console.close()
+            pending.remove(shard)
+            status = "완료" if code == 0 else f"실패(exit={code}, 콘솔 출력: {shard.console_path})"
+            print(f"샤드 {shard.index} {status}: {shard.elapsed:.1f}s")
+        if pending:
+            time.sleep(poll_interval)
+    return shards
+
+
+def write_shard_records(df, output_path):
+    """Worker side: persist the record buffer atomically for the coordinator."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, output_path)
+
+
+def merge_shard_records(shards, columns):
+    """Concatenate shard buffers in shard order and drop duplicate product codes (first wins)."""
+    import pandas as pd
+
+    frames = []
+    for shard in shards:
+        if not shard.output_path.exists():
+            print(f"샤드 {shard.index} 레코드 없음: {shard.output_path}")
+            continue
+        frames.append(pd.read_pickle(shard.output_path))
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    merged = pd.concat(frames, ignore_index=True)
+    codes = merged["Product_URL"].map(product_code_from_url)
+    duplicated = codes.duplicated(keep="first") & codes.notna()
+    if duplicated.any():
+        print(f"샤드 병합: 중복 상품 {int(duplicated.sum())}개 제거")
+    return merged[~duplicated].reset_index(drop=True)
@@ -0,0 +1,82 @@
+"""스마트스토어 페이지 유형별 셀렉터 체인과 컴파일된 추출 스펙(크롤러 스크립트 공용)."""
+from crawler.extraction import ExtractionSpec, Field
+
+
+LISTING_CARD_SELECTORS = [
+    "[data-testid='PRODUCT_CARD']",
+    "li:has(a[href*='/products/'])",
+    "div:has(a[href*='/products/'])",
+    "li[class*='flu7YgFW2k']",
+]
+CARD_TITLE_SELECTORS = [
+    "strong[aria-hidden='false']",
+    "[data-testid='PRODUCT_CARD_TITLE']",
+    "a[href*='/products/'] strong",
+    "span[class*='ProductCard__Title']",
+    "strong._26YxgX-Nu5",
+]
+CARD_PRICE_SELECTORS = [
+    "[data-testid='PRODUCT_CARD_PRICE']",
+    "span:has-text('원')",
+    "strong span:has-text('원')",
+    "span._2DywKu0J_8",
+]
+CARD_URL_SELECTORS = [
+    "a[href*='/products/'][role='link']",
+    "a[href*='/products/']",
+    "a._2id8yXpK_k",
+]
+
+CONTENT_SELECTORS = [
+    '#INTRODUCE > div > div.LXGzUhHJC2.EtTm8LLHdw.Uea3oKmnaJ > div > div > div > div > div > div > div',
+    '#INTRODUCE > div > div.LXGzUhHJC2.EtTm8LLHdw > div > div > div > div > div > div > div',
+    '#INTRODUCE .detail_viewer',
+    '#INTRODUCE [data-component-id]',
+    '#INTRODUCE .se-main-container',
+    '#INTRODUCE',
+    '[data-name="INTRODUCE"][role="tabpanel"]',
+    'xpath=//*[@id="INTRODUCE"]//div[contains(@data-component-id,"INTRODUCE")]//div[contains(@class,"se_component")]//div[last()]',
+    'xpath=//*[@id="INTRODUCE"]//div[contains(@class,"se-main-container")]',
+    'xpath=//*[@id="INTRODUCE"]/div/div[4]',
+]
+SHIPPING_SELECTORS = [
+    "xpath=//*[contains(@class,'delivery') and contains(text(),'원')]",
+    "xpath=//span[contains(text(),'배송비')]/following-sibling::*[1]",
+    "xpath=//*[contains(text(),'배송비') and contains(text(),'원')]",
+    "xpath=//*[contains(text(),'반품배송비') and contains(text(),'원')]",
+]
+IMAGE_MAIN_SELECTORS = [
+    "img[alt='대표이미지']",
+    "img[alt*='대표'][src*='shop-phinf']",
+    "div[id='content'] img[src*='shop-phinf']",
+]
+IMAGE_THUMBNAIL_SELECTORS = [
+    "img[alt^='추가이미지']",
+    "button[aria-label^='썸네일'] img",
+    "ul[class*='thumbnail'] img",
+]
+
+# 구체적인 셀렉터가 모두 빗나갈 때만 쓰는 포괄 셀렉터(체인별). 적중해도 학습 순서에서 앞으로 옮기지 않는다(SelectorStats catch_all)
+CATCH_ALL_SELECTORS = {
+    "listing.product_cards": ["div:has(a[href*='/products/'])"],
+    "detail.content": ['#INTRODUCE', '[data-name="INTRODUCE"][role="tabpanel"]'],
+    "image.main": ["div[id='content'] img[src*='shop-phinf']"],
+}
+
+# 상품 카드 1개당 evaluate 한 번으로 상품명/가격/URL(+카드 텍스트 fallback)을 읽는다.
+# run_many(page, LISTING_CARD_SELECTORS)로 리스트 페이지 전체 카드를 한 번에 읽을 수도 있다.
+CARD_SPEC = ExtractionSpec("card", [
+    Field("title", CARD_TITLE_SELECTORS, chain="card.title"),
+    Field("price", CARD_PRICE_SELECTORS, chain="card.price"),
+    Field("url", CARD_URL_SELECTORS, mode="attr:href", chain="card.url"),
+    Field("text", mode="self_text"),
+])
+
+# 상세 페이지의 이미지/상세 컨텐츠/배송비 체인을 evaluate 한 번으로 해석
+DETAIL_SPEC = ExtractionSpec("detail", [
+    Field("main_images", IMAGE_MAIN_SELECTORS, mode="all_attr:src", chain="image.main"),
+    Field("thumbnails", IMAGE_THUMBNAIL_SELECTORS, mode="all_attr:src", chain="image.thumbnails"),
+    Field("all_images", ["img[src*='shop-phinf']"], mode="all_attr:src"),
+    Field("content", CONTENT_SELECTORS, mode="exists", chain="detail.content"),
+    Field("shipping_fee", SHIPPING_SELECTORS, chain="detail.shipping_fee", pattern=r"무료배송|\d"),
+])
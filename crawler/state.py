@@ -0,0 +1,91 @@
+"""스토어별 수집 상태(워터마크) 저장소.
+
+st=RECENT 정렬에서는 새 상품이 항상 앞에 오므로, 마지막으로 엑셀에 기록한 가장 최신 상품
+코드(newest_code)와 기록된 상품 코드 목록만 있으면 증분 실행이 1페이지부터 훑다가
+이미 수집한 상품을 만나는 즉시 멈출 수 있다.
+
+파일 형식(JSON):
+    {"shops": {"joypapa__ALL": {"newest_code": "...", "exported_codes": [...],
+                                "runs": 3, "updated": "..."}}}
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+
+# 상점별로 유지할 최대 코드 수(최신 순으로 보존)
+DEFAULT_MAX_CODES = 20000
+
+
+def product_code_from_url(url):
+    if not url or url == "N/A":
+        return None
+    return str(url).split("?")[0].rstrip("/").split("/")[-1] or None
+
+
+class CrawlState(object):
+    def __init__(self, path, max_codes=DEFAULT_MAX_CODES):
+        self.path = Path(path)
+        self.max_codes = max_codes
+        self.data = {"shops": {}}
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            loaded = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"수집 상태 파일을 읽지 못했습니다({self.path}): {exc}")
+            return
+        if isinstance(loaded, dict) and isinstance(loaded.get("shops"), dict):
+            self.data = loaded
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def shop(self, shop_key):
+        return self.data["shops"].setdefault(
+            shop_key,
+            {"newest_code": None, "exported_codes": [], "runs": 0, "updated": None},
+        )
+
+    def known_codes(self, shop_key):
+        """Snapshot of codes that end an incremental walk (taken once at run start)."""
+        entry = self.data["shops"].get(shop_key) or {}
+        codes = set(entry.get("exported_codes") or [])
+        if entry.get("newest_code"):
+            codes.add(entry["newest_code"])
+        return frozenset(codes)
+
+    def record_export(self, shop_key, codes, newest_code=None):
+        """Remember exported codes (listing order, newest first) and optionally move the watermark."""
+        entry = self.shop(shop_key)
+        merged = []
+        seen = set()
+        for code in list(codes) + list(entry.get("exported_codes") or []):
+            if code and code not in seen:
+                seen.add(code)
+                merged.append(code)
+        entry["exported_codes"] = merged[: self.max_codes]
+        if newest_code:
+            entry["newest_code"] = newest_code
+        entry["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def finish_run(self, shop_key):
+        entry = self.shop(shop_key)
+        entry["runs"] = int(entry.get("runs") or 0) + 1
+        self.save()
+
+    def describe(self, shop_key):
+        entry = self.data["shops"].get(shop_key)
+        if not entry:
+            return f"{shop_key}: 저장된 워터마크 없음"
+        return (
+            f"{shop_key}: newest={entry.get('newest_code')}, "
+            f"기록된 상품 {len(entry.get('exported_codes') or [])}개"
+        )
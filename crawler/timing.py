@@ -0,0 +1,173 @@
+"""단계별 소요 시간 계측(span/timer)과 실행 요약 리포트.
+
+사용 예:
+    TIMER = StageTimer(jsonl_path)
+    TIMER.begin_product(product_code)
+    with TIMER.span("goto"):
+        page.goto(url)
+    TIMER.end_product()
+    TIMER.print_summary()
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+from crawler.logs import get_logger
+
+
+metrics_log = get_logger("metrics")
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile (pct in 0..100) of an unsorted sequence."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * (pct / 100.0)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    fraction = rank - low
+    return ordered[low] + (ordered[high] - ordered[low]) * fraction
+
+
+class StageTimer(object):
+    """Collects per-stage durations and writes one JSONL line per product."""
+
+    def __init__(self, jsonl_path=None, enabled=True):
+        self.enabled = enabled
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.stage_samples = defaultdict(list)
+        self.products_done = 0
+        self.products_failed = 0
+        self.run_started = time.perf_counter()
+        self._lock = threading.Lock()
+        # 상품 단위 컨텍스트는 스레드별로 유지(상세 워커가 여러 스레드일 수 있음)
+        self._local = threading.local()
+
+    def _current(self):
+        return getattr(self._local, "product", None)
+
+    @contextmanager
+    def span(self, stage):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def timed(self, stage):
+        """Decorator form of span()."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, stage, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.stage_samples[stage].append(seconds)
+        current = self._current()
+        if current is not None:
+            stages = current["stages"]
+            # 같은 단계가 상품 내에서 여러 번 실행되면 합산
+            stages[stage] = stages.get(stage, 0.0) + seconds
+
+    def begin_product(self, product_code, **fields):
+        if not self.enabled:
+            return
+        record = {"product_code": product_code, "stages": {}, "_start": time.perf_counter()}
+        record.update(fields)
+        self._local.product = record
+
+    def end_product(self, status="ok", **fields):
+        if not self.enabled:
+            return None
+        current = self._current()
+        if current is None:
+            return None
+        self._local.product = None
+        total = time.perf_counter() - current.pop("_start")
+        current.update(fields)
+        current["status"] = status
+        current["total"] = round(total, 4)
+        current["stages"] = {key: round(value, 4) for key, value in current["stages"].items()}
+        current["ts"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with self._lock:
+            self.stage_samples["product_total"].append(total)
+            if status == "ok":
+                self.products_done += 1
+            else:
+                self.products_failed += 1
+            self._write_jsonl(current)
+        # 구조화 로그(JSONL 싱크)에도 같은 레코드를 남겨 메트릭 도구가 한 곳에서 읽을 수 있게 함
+        metrics_log.info("product_timing", extra={"metrics": current})
+        return current
+
+    def _write_jsonl(self, record):
+        if self.jsonl_path is None:
+            return
+        try:
+            self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.jsonl_path.open("a", encoding="utf-8") as fp:
+                fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as exc:
+            print(f"타이밍 JSONL 기록 실패({self.jsonl_path}): {exc}")
+
+    def summary_rows(self):
+        with self._lock:
+            items = [(stage, list(samples)) for stage, samples in self.stage_samples.items()]
+        rows = []
+        for stage, samples in sorted(items, key=lambda item: -sum(item[1])):
+            rows.append({
+                "stage": stage,
+                "count": len(samples),
+                "total": sum(samples),
+                "p50": percentile(samples, 50),
+                "p95": percentile(samples, 95),
+                "max": max(samples),
+            })
+        return rows
+
+    def products_per_minute(self):
+        elapsed = time.perf_counter() - self.run_started
+        if elapsed <= 0:
+            return 0.0
+        return self.products_done / (elapsed / 60.0)
+
+    def format_summary(self):
+        rows = self.summary_rows()
+        elapsed = time.perf_counter() - self.run_started
+        lines = [
+            "=== 단계별 소요 시간 요약 ===",
+            f"{'stage':<32}{'count':>7}{'total(s)':>10}{'p50(s)':>9}{'p95(s)':>9}{'max(s)':>9}",
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['stage']:<32}{row['count']:>7}{row['total']:>10.2f}"
+                f"{row['p50']:>9.3f}{row['p95']:>9.3f}{row['max']:>9.3f}"
+            )
+        lines.append(
+            f"상품 {self.products_done}개 완료, {self.products_failed}개 실패 / "
+            f"경과 {elapsed:.1f}s / {self.products_per_minute():.2f} products/min"
+        )
+        if self.jsonl_path is not None:
+            lines.append(f"상품별 타이밍 JSONL: {self.jsonl_path}")
+        return "\n".join(lines)
+
+    def print_summary(self):
+        if not self.enabled:
+            return
+        print(self.format_summary())
@@ -0,0 +1,11 @@
+"""리스트/상품 URL 조작 헬퍼."""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def update_query_params(url, **params):
+    """Return url with params merged into the query string (None values are ignored)."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update({key: value for key, value in params.items() if value is not None})
+    new_query = urlencode(query, doseq=True)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, new_query, parts.fragment))
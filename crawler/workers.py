@@ -0,0 +1,70 @@
+"""상세 페이지 병렬 수집용 워커 풀.
+
+Playwright sync API 객체는 만든 스레드에서만 쓸 수 있으므로, 워커 스레드마다
+open_worker()로 자체 playwright/브라우저/컨텍스트를 열고 큐에서 항목을 가져와 처리한다.
+"""
+import queue
+import threading
+
+from crawler.logs import get_logger
+
+
+log = get_logger("workers")
+
+_STOP = object()
+
+
+def run_detail_workers(items, handle, open_worker, worker_count=1, current=None):
+    """Run handle(resource, item) for every item and return results in input order.
+
+    open_worker() must be a context manager yielding the per-thread resource (e.g. a
+    BrowserContext). When worker_count is 1 and `current` is given, items are processed
+    inline on the caller's resource without starting threads. Failed items yield None.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    if not items:
+        return results
+
+    if worker_count <= 1 and current is not None:
+        for index, item in enumerate(items):
+            results[index] = _safe_handle(handle, current, item)
+        return results
+
+    work = queue.Queue()
+    for index, item in enumerate(items):
+        work.put((index, item))
+    worker_count = max(1, min(worker_count, len(items)))
+    for _ in range(worker_count):
+        work.put(_STOP)
+
+    def worker(worker_id):
+        try:
+            with open_worker() as resource:
+                while True:
+                    task = work.get()
+                    if task is _STOP:
+                        break
+                    index, item = task
+                    results[index] = _safe_handle(handle, resource, item)
+        except Exception as exc:
+            print(f"상세 워커 {worker_id} 시작/종료 실패: {exc}")
+            # 남은 항목은 다른 워커가 처리하도록 큐를 그대로 둔다
+
+    threads = [
+        threading.Thread(target=worker, args=(worker_id,), name=f"detail-worker-{worker_id}", daemon=True)
+        for worker_id in range(worker_count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def _safe_handle(handle, resource, item):
+    try:
+        return handle(resource, item)
+    except Exception:
+        log.exception("상세 수집 실패(%s)", item)
+        return None
@@ -0,0 +1,225 @@
+"""WSL에서 Windows 쪽 Chrome(원격 디버깅)에 붙기 위한 도우미.
+
+WSL2의 127.0.0.1은 Windows가 아니므로 기본 게이트웨이/resolv.conf에서 Windows 호스트 IP를 찾고,
+cmd.exe로 start_chrome_dev.bat을 실행하거나 Windows 쪽 curl로 /json/version을 읽어 ws 주소를 얻는다.
+"""
+import json
+import os
+import platform
+import socket
+import struct
+import subprocess
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+
+DEFAULT_CDP_PORT = 9222
+
+
+def running_on_wsl():
+    if "WSL_DISTRO_NAME" in os.environ:
+        return True
+    try:
+        return "microsoft" in platform.uname().release.lower()
+    except Exception:
+        return False
+
+
+def _private_ipv4(ip):
+    try:
+        parts = [int(p) for p in ip.split(".")]
+        if len(parts) != 4:
+            return False
+        a, b, *_ = parts
+        return (
+            a == 10
+            or (a == 172 and 16 <= b <= 31)
+            or (a == 192 and b == 168)
+        )
+    except Exception:
+        return False
+
+
+def _wsl_default_gateway():
+    """Detect default gateway IP inside WSL by parsing /proc/net/route."""
+    try:
+        with open("/proc/net/route", "r", encoding="utf-8") as fp:
+            lines = fp.read().splitlines()
+        for line in lines[1:]:
+            cols = line.split()  # Iface  Destination  Gateway ...
+            if len(cols) >= 3 and cols[1] == "00000000":
+                try:
+                    gw_int = int(cols[2], 16)
+                    return socket.inet_ntoa(struct.pack("<L", gw_int))
+                except Exception:
+                    continue
+    except OSError:
+        pass
+    return None
+
+
+def detect_windows_host(override=None):
+    """Return Windows host IP from WSL with multiple strategies.
+
+    Priority order:
+    1) override (WSL_CDP_HOST/PLAYWRIGHT_CDP_HOST)
+    2) /proc/net/route default gateway (if private range)
+    3) resolv.conf nameserver (if private range)
+    """
+    if not running_on_wsl():
+        return None
+    if override and override.strip():
+        return override.strip()
+
+    gw = _wsl_default_gateway()
+    if gw and _private_ipv4(gw):
+        return gw
+
+    try:
+        for line in Path("/etc/resolv.conf").read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("nameserver"):
+                parts = line.split()
+                if len(parts) >= 2 and parts[1] not in {"127.0.0.1", "::1"} and _private_ipv4(parts[1]):
+                    return parts[1]
+    except OSError:
+        pass
+    return None
+
+
+def locate_cmd_invocation():
+    if os.name == "nt":
+        return ["cmd", "/c"]
+    if running_on_wsl():
+        candidates = [
+            "/mnt/c/Windows/System32/cmd.exe",
+            "/mnt/c/Windows/system32/cmd.exe",
+            "/mnt/c/windows/System32/cmd.exe",
+            "/mnt/c/windows/system32/cmd.exe",
+        ]
+        for candidate in candidates:
+            if Path(candidate).exists():
+                return [candidate, "/c"]
+    return None
+
+
+def to_windows_path(path):
+    path = Path(path).resolve()
+    as_str = str(path)
+    if os.name == "nt":
+        return as_str
+    if running_on_wsl():
+        if as_str.startswith("/mnt/") and len(as_str) > 6:
+            drive_letter = as_str[5].upper()
+            remainder = as_str[7:].replace("/", "\\")
+            return f"{drive_letter}:\\" + remainder
+    return as_str
+
+
+def normalize_cdp_url(raw_url, default_host="127.0.0.1", default_port=DEFAULT_CDP_PORT):
+    """'host', 'host:port', 'ws://host:port/devtools/…' → 'http(s)://host:port' (None for empty input)."""
+    if not raw_url:
+        return None
+    candidate = raw_url.strip()
+    if not candidate:
+        return None
+    if "://" not in candidate:
+        candidate = f"http://{candidate}"
+    parts = urlsplit(candidate)
+    scheme = parts.scheme.lower()
+    hostname = parts.hostname or default_host
+    if hostname in {"0.0.0.0", "*"}:
+        hostname = default_host
+    port = parts.port or default_port
+    netloc = f"{hostname}:{port}" if port else hostname
+    normalized_scheme = "https" if scheme in {"https", "wss"} else "http"
+    return urlunsplit((normalized_scheme, netloc, "", "", ""))
+
+
+def launch_chrome_devtools(batch_path):
+    """Run start_chrome_dev.bat through cmd.exe (Windows or WSL interop). Errors are reported, not raised."""
+    batch_path = Path(batch_path)
+    if not batch_path.exists():
+        print(f"{batch_path} 파일을 찾을 수 없어 Chrome DevTools 자동 실행을 생략합니다.")
+        return
+    cmd_parts = locate_cmd_invocation()
+    if cmd_parts is None:
+        print("cmd.exe 를 찾지 못해 Chrome DevTools 자동 실행을 생략합니다. Windows 환경에서 직접 배치파일을 실행해 주세요.")
+        return
+
+    batch_argument = to_windows_path(batch_path) if running_on_wsl() else str(batch_path)
+    try:
+        subprocess.run(
+            [*cmd_parts, batch_argument],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except FileNotFoundError as exc:
+        print(f"Chrome DevTools 배치 실행 실패 (cmd.exe 미발견): {exc}")
+    except PermissionError as exc:
+        print(
+            "Chrome DevTools 배치 실행 권한 오류가 발생했습니다. "
+            "WSL interop 설정 또는 /mnt/c 드라이브 실행 권한을 확인하고 직접 배치파일을 실행해 주세요.\n"
+            f"상세: {exc}"
+        )
+    except subprocess.CalledProcessError as exc:
+        print(
+            "Chrome DevTools 배치 실행이 실패했습니다.\n"
+            f"returncode: {exc.returncode}\n"
+            f"stdout: {exc.stdout}\n"
+            f"stderr: {exc.stderr}"
+        )
+    except subprocess.TimeoutExpired as exc:
+        print(
+            "Chrome DevTools 배치 실행이 30초 안에 종료되지 않아 크롤러가 대기를 중단합니다. "
+            "Chrome 창이 이미 떠 있다면 그대로 진행합니다.\n"
+            f"stdout: {exc.stdout or ''}\n"
+            f"stderr: {exc.stderr or ''}"
+        )
+    except OSError as exc:
+        print(f"Chrome DevTools 배치 실행 중 알 수 없는 OS 오류가 발생했습니다: {exc}")
+
+
+def _extract_first_json_object(text):
+    """Return first JSON object substring found in text, or None.
+
+    Useful to parse Windows cmd.exe output that may prepend UNC warnings to JSON.
+    """
+    if not text:
+        return None
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end != -1 and end > start:
+        return text[start : end + 1]
+    return None
+
+
+def windows_ws_endpoint(host, port=DEFAULT_CDP_PORT):
+    """Last resort from WSL: read /json/version with Windows curl (Chrome bound to Windows loopback only)
+    and point its webSocketDebuggerUrl at host. Returns ws://host:port/devtools/browser/… or None."""
+    cmd_parts = locate_cmd_invocation()
+    if cmd_parts is None or not host:
+        return None
+    try:
+        out = subprocess.run(
+            [*cmd_parts, f"curl -sS http://127.0.0.1:{port}/json/version"],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=8,
+        )
+        json_str = _extract_first_json_object(out.stdout)
+        if not json_str:
+            return None
+        ws = json.loads(json_str).get("webSocketDebuggerUrl")
+    except Exception:
+        return None
+    if not isinstance(ws, str) or not ws:
+        return None
+    ws_parts = urlsplit(ws)
+    # localhost를 실제 호스트로 치환
+    return urlunsplit(("ws", f"{host}:{port}", ws_parts.path, ws_parts.query, ws_parts.fragment))
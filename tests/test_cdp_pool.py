@@ -0,0 +1,50 @@
+"""CDP 엔드포인트 풀: 주소 파싱, 배정, 실패 누적과 cooldown."""
+import pytest
+
+from crawler.cdp_pool import CdpPool, NoHealthyEndpoint, parse_endpoints
+
+
+def test_parse_endpoints():
+    assert parse_endpoints("9222, 9223 host:9224 ws://h:1/devtools/x 9222") == [
+        "http://127.0.0.1:9222",
+        "http://127.0.0.1:9223",
+        "http://host:9224",
+        "ws://h:1/devtools/x",
+    ]
+    assert parse_endpoints(None) == []
+
+
+def test_empty_pool_is_rejected():
+    with pytest.raises(ValueError):
+        CdpPool([])
+
+
+def test_acquire_prefers_fewest_active_then_fewest_attached():
+    pool = CdpPool(["a", "b"])
+    assert [pool.acquire().url for _ in range(3)] == ["a", "b", "a"]
+    pool.release(pool.endpoints[0])
+    # 둘 다 active 1이면 지금까지 덜 붙은 b
+    assert pool.acquire().url == "b"
+    pool.release(pool.endpoints[0])
+    assert pool.acquire().url == "a"
+
+
+def test_failures_bench_an_endpoint_after_max_failures():
+    pool = CdpPool(["a", "b"], max_failures=2, cooldown=60.0)
+    endpoint = pool.endpoints[0]
+    pool.record(endpoint, ok=False, error="boom")
+    assert endpoint.available()
+    pool.record(endpoint, ok=True)
+    pool.record(endpoint, ok=False, error="boom")
+    assert endpoint.available()
+    pool.record(endpoint, ok=False, error="boom")
+    assert not endpoint.available()
+    assert pool.acquire().url == "b"
+
+
+def test_fatal_failure_benches_immediately_and_reports_wait():
+    pool = CdpPool(["a"], cooldown=30.0)
+    pool.record(pool.endpoints[0], ok=False, error="Target closed", fatal=True)
+    with pytest.raises(NoHealthyEndpoint):
+        pool.acquire()
+    assert 29.0 < pool.next_available_in() <= 30.0
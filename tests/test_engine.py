@@ -0,0 +1,43 @@
+"""엔진 모듈: import 부수효과와 리스트 카드 정리."""
+import subprocess
+import sys
+from pathlib import Path
+
+from crawler import engine
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_CHECK = """
+import io, contextlib, sys, threading
+buf = io.StringIO()
+with contextlib.redirect_stdout(buf):
+    import crawler.engine as engine
+heavy = [name for name in ("playwright", "pandas", "openpyxl", "playwright_stealth") if name in sys.modules]
+objects = [engine.CRAWL_STATE, engine.SELECTOR_STATS, engine.CDP_ENDPOINT_REGISTRY, engine.HTTP_FETCHER]
+print(repr((buf.getvalue(), heavy, threading.active_count(), objects)))
+"""
+
+
+def test_import_has_no_side_effects():
+    # 다른 테스트가 pandas 등을 이미 불러왔을 수 있으므로 새 인터프리터에서 확인
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK], cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == repr(("", [], 1, [None, None, None, None]))
+
+
+def test_unique_cards_keeps_first_card_per_url():
+    cards = [
+        ("a", "1,000", "https://s/products/1", "1"),
+        ("a (wrapper)", "1,000", "https://s/products/1", "1"),
+        ("no url", "", "N/A", None),
+        ("b", "2,000", "https://s/products/2", "2"),
+    ]
+    assert [card[0] for card in engine.unique_cards(cards)] == ["a", "b"]
+
+
+def test_normalize_price_value():
+    assert engine.normalize_price_value("12,000원") == 12000
+    assert engine.normalize_price_value(0) is None
+    assert engine.normalize_price_value("N/A") is None
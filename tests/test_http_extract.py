@@ -0,0 +1,75 @@
+"""HTTP fast path 파서: 실제 스마트스토어 HTML(debug/product_sample*.html)과 mock 서버 HTML."""
+from pathlib import Path
+
+from crawler.http_extract import (
+    _positive_int,
+    content_markup,
+    missing_fields,
+    parse_product_html,
+    price_from_json_ld,
+)
+from crawler.mock_smartstore import MockCatalog, render_detail_page
+
+
+DEBUG_DIR = Path(__file__).resolve().parent.parent / "debug"
+
+
+def read_sample(name):
+    return (DEBUG_DIR / name).read_text(encoding="utf-8")
+
+
+def test_real_sample_with_json_ld_uses_it_for_price_and_image():
+    fields = parse_product_html(read_sample("product_sample2.html"))
+    assert fields["title"].startswith("휴대용 다도 다기")
+    assert fields["price"] == 30000
+    assert fields["category"] == "생활/건강>주방용품>잔/컵>다기/주기"
+    assert fields["main_image"] == (
+        "https://shop-phinf.pstatic.net/20241022_258/1729563071016punFU_JPEG/17862629028692856_1358957827.jpg"
+    )
+    # 본문은 서버 HTML에 없으므로 브라우저 경로로 넘어가야 한다
+    assert fields["content_html"] is None
+    assert missing_fields(fields) == ["content_html"]
+
+
+def test_real_sample_without_product_data_falls_back():
+    fields = parse_product_html(read_sample("product_sample.html"))
+    assert fields["price"] is None
+    assert fields["main_image"] is None
+    assert "content_html" in missing_fields(fields)
+
+
+def test_mock_detail_page_has_every_required_field():
+    item = MockCatalog(product_count=3).product(0)
+    fields = parse_product_html(render_detail_page(item))
+    assert missing_fields(fields) == []
+    assert fields["content_html"].lstrip().startswith("<div")
+
+
+def test_content_markup_rejects_plain_summary_text():
+    assert content_markup("옵션 목록 [A] [B] [C] [D] [E]") is None
+    assert content_markup("  ") is None
+    assert content_markup(None) is None
+    assert content_markup("<div><img src='a.jpg'></div>") == "<div><img src='a.jpg'></div>"
+
+
+def test_positive_int_keeps_decimal_and_exponent_values():
+    assert _positive_int(12000) == 12000
+    assert _positive_int(12000.5) == 12000
+    assert _positive_int("12000.5") == 12000
+    assert _positive_int("1.2e4") == 12000
+    assert _positive_int("12,000") == 12000
+    assert _positive_int(" 30000 ") == 30000
+
+
+def test_positive_int_rejects_non_prices():
+    for value in (None, "", "abc", "1,2", 0, -5, True, float("nan"), float("inf")):
+        assert _positive_int(value) is None
+
+
+def test_price_from_json_ld_accepts_offer_lists():
+    json_ld = [
+        {"@type": "BreadcrumbList"},
+        {"@type": "Product", "offers": [{"@type": "Offer", "price": "12,900"}]},
+    ]
+    assert price_from_json_ld(json_ld) == 12900
+    assert price_from_json_ld([{"@type": "Product"}]) is None
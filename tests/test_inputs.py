@@ -0,0 +1,19 @@
+"""상품 URL/코드 입력 정규화."""
+from crawler.inputs import normalize_product_input
+
+
+BASE = "https://smartstore.naver.com/shop/products"
+
+
+def test_bare_code_becomes_product_url():
+    assert normalize_product_input(" 11033027869 ", BASE + "/") == (f"{BASE}/11033027869", "11033027869")
+
+
+def test_url_drops_tracking_query_and_fragment():
+    url = f"{BASE}/11033027869?NaPm=ct%3D1#INTRODUCE"
+    assert normalize_product_input(url, BASE) == (f"{BASE}/11033027869", "11033027869")
+
+
+def test_unusable_values():
+    for value in (None, "", "N/A", "n/a", "https://smartstore.naver.com/shop", "상품"):
+        assert normalize_product_input(value, BASE) is None
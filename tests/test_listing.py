@@ -0,0 +1,83 @@
+"""리스트 page size 선택과 기존(size=20) 페이지 번호 매핑."""
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from crawler.listing import choose_page_size, map_legacy_pages, parse_size_setting, url_page_size
+
+
+DEBUG_DIR = Path(__file__).resolve().parent.parent / "debug"
+
+
+class FakeListingPage(object):
+    """goto()/evaluate() stand-in: the store honours sizes in `accepted` and reports them."""
+
+    def __init__(self, accepted):
+        self.accepted = accepted
+        self.visited = []
+
+    def goto(self, url):
+        self.visited.append(url)
+
+    def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    def evaluate(self, script):
+        size = url_page_size(self.visited[-1])
+        reported = size if size in self.accepted else 20
+        return {"reported": reported, "products": reported}
+
+
+def test_map_legacy_pages_on_size_60():
+    # 기존 61~64페이지 = 실제 21페이지(0~60) + 22페이지 앞 20개
+    assert map_legacy_pages([61, 62, 63, 64], 60) == [
+        (21, 0, 20, 61),
+        (21, 20, 40, 62),
+        (21, 40, 60, 63),
+        (22, 0, 20, 64),
+    ]
+
+
+def test_map_legacy_pages_splits_across_pages_when_size_is_not_a_multiple():
+    assert map_legacy_pages([2], 30) == [(1, 20, 30, 2), (2, 0, 10, 2)]
+
+
+def test_map_legacy_pages_sorts_and_dedupes():
+    assert [entry[3] for entry in map_legacy_pages([3, 1, 3], 20)] == [1, 3]
+
+
+def test_parse_size_setting():
+    assert parse_size_setting("auto") == (80, 60, 40)
+    assert parse_size_setting("") == (80, 60, 40)
+    assert parse_size_setting("60") == (60,)
+    assert parse_size_setting("40, 80;x") == (80, 40)
+    assert parse_size_setting("x") == (80, 60, 40)
+
+
+def test_url_page_size():
+    assert url_page_size("https://s/cat/ALL?st=RECENT&size=80") == 80
+    assert url_page_size("https://s/cat/ALL?st=RECENT") == 20
+    assert url_page_size("https://s/cat/ALL?size=abc") == 20
+
+
+def test_choose_page_size_keeps_the_largest_accepted_size():
+    page = FakeListingPage(accepted={60})
+    size, url = choose_page_size(page, "https://s/cat/ALL?size=20", (80, 60, 40))
+    assert size == 60
+    assert url_page_size(url) == 60
+    assert page.visited[-1] == url
+
+
+def test_choose_page_size_does_not_reload_a_url_that_already_has_the_size():
+    page = FakeListingPage(accepted={80})
+    size, url = choose_page_size(page, "https://s/cat/ALL?size=80", (80, 60, 40), legacy_size=80)
+    assert (size, url) == (80, "https://s/cat/ALL?size=80")
+    assert page.visited == []
+
+
+def test_page_size_container_on_real_listing():
+    # _LISTING_SIZE_JS와 같은 셀렉터: 첫 data-shp-filter_con은 무료배송 필터 라벨이다
+    soup = BeautifulSoup((DEBUG_DIR / "listing_sample.html").read_text(encoding="utf-8"), "html.parser")
+    assert "freedlv" in soup.select_one("[data-shp-filter_con]")["data-shp-filter_con"]
+    container = soup.select_one("[data-shp-area='list.pgn'][data-shp-filter_con]")
+    assert '"value":"80"' in container["data-shp-filter_con"].replace("&quot;", '"')
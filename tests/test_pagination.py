@@ -0,0 +1,20 @@
+"""페이지네이션 최소 경로 계획."""
+from crawler.pagination import plan_page_route
+
+
+def test_same_page_needs_no_steps():
+    assert plan_page_route(3, [1, 2, 3], 3) == []
+
+
+def test_visible_target_is_one_click():
+    assert plan_page_route(1, list(range(1, 11)), 7) == [("page", 7)]
+
+
+def test_far_target_hops_whole_groups():
+    assert plan_page_route(1, list(range(1, 11)), 35) == [("next",)] * 3
+    assert plan_page_route(41, list(range(41, 51)), 12) == [("prev",)] * 3
+
+
+def test_unknown_group_moves_one_step_towards_target():
+    assert plan_page_route(5, [], 9) == [("next",)]
+    assert plan_page_route(5, [], 2) == [("prev",)]
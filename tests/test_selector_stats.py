@@ -0,0 +1,53 @@
+"""셀렉터 체인 학습 순서."""
+import json
+
+from crawler.selector_stats import SelectorStats
+from crawler.specs import CATCH_ALL_SELECTORS, CONTENT_SELECTORS
+
+
+CHAIN = ["a", "b", "c", "catch-all"]
+
+
+def resolve(stats, hit):
+    return stats.resolve("chain", CHAIN, lambda selector: selector == hit)
+
+
+def test_recent_hit_is_tried_first():
+    stats = SelectorStats(explore_every=0)
+    assert resolve(stats, "c") == (True, "c")
+    assert stats.order("chain", CHAIN) == ["c", "a", "b", "catch-all"]
+
+
+def test_catch_all_is_never_promoted():
+    stats = SelectorStats(explore_every=0, catch_all={"chain": ["catch-all"]})
+    resolve(stats, "catch-all")
+    assert stats.order("chain", CHAIN) == CHAIN
+    resolve(stats, "b")
+    assert stats.order("chain", CHAIN) == ["b", "a", "c", "catch-all"]
+
+
+def test_explore_pass_uses_declared_order():
+    stats = SelectorStats(explore_every=2)
+    resolve(stats, "c")
+    # 두 번째 resolve가 탐색 회차: 학습 순서 대신 선언 순서
+    assert stats.order("chain", CHAIN) == CHAIN
+    assert stats.order("chain", CHAIN)[0] == "c"
+
+
+def test_saved_catch_all_order_is_ignored(tmp_path):
+    path = tmp_path / "selector_stats.json"
+    path.write_text(json.dumps({"chains": {"detail.content": {
+        "order": ["#INTRODUCE"], "resolves": 3, "first_try": 0, "failures": 0, "selectors": {},
+    }}}), encoding="utf-8")
+    stats = SelectorStats(path, explore_every=0, catch_all=CATCH_ALL_SELECTORS)
+    assert stats.order("detail.content", CONTENT_SELECTORS) == CONTENT_SELECTORS
+
+
+def test_misses_and_failures_are_counted_and_saved(tmp_path):
+    path = tmp_path / "stats.json"
+    stats = SelectorStats(path, explore_every=0)
+    assert resolve(stats, "missing") == (None, None)
+    stats.save()
+    entry = json.loads(path.read_text(encoding="utf-8"))["chains"]["chain"]
+    assert entry["failures"] == 1
+    assert entry["selectors"]["a"]["misses"] == 1
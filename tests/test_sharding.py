@@ -0,0 +1,37 @@
+"""샤드 분할/환경변수/레코드 병합."""
+import pandas as pd
+
+from crawler.sharding import build_shards, merge_shard_records, split_contiguous, write_shard_records
+
+
+def test_split_contiguous_balances_and_keeps_order():
+    assert split_contiguous(range(1, 11), 3) == [[1, 2, 3, 4], [5, 6, 7], [8, 9, 10]]
+
+
+def test_split_contiguous_never_returns_empty_chunks():
+    assert split_contiguous([1, 2], 5) == [[1], [2]]
+    assert split_contiguous([], 3) == []
+
+
+def test_build_shards_sets_per_shard_paths(tmp_path):
+    shards = build_shards(tmp_path, [{"CRAWL_ONLY_PAGES": "1,2"}, {"CRAWL_ONLY_PAGES": "3"}])
+    assert [shard.index for shard in shards] == [0, 1]
+    assert shards[1].env["CRAWL_SHARD_OUTPUT"] == str(tmp_path / "shard_1.pkl")
+    assert shards[1].env["CRAWL_ONLY_PAGES"] == "3"
+    assert shards[0].console_path == tmp_path / "shard_0_console.txt"
+
+
+def test_merge_shard_records_drops_duplicate_codes_first_wins(tmp_path):
+    shards = build_shards(tmp_path, [{}, {}, {}])
+    base = "https://smartstore.naver.com/shop/products/"
+    write_shard_records(pd.DataFrame({"Product_URL": [base + "1", base + "2"], "n": [1, 2]}), shards[0].output_path)
+    write_shard_records(pd.DataFrame({"Product_URL": [base + "2?x=1", base + "3"], "n": [3, 4]}), shards[1].output_path)
+    # shards[2]는 레코드 없이 끝난 샤드
+    merged = merge_shard_records(shards, ["Product_URL", "n"])
+    assert merged["n"].tolist() == [1, 2, 4]
+
+
+def test_merge_shard_records_without_output_returns_empty_frame(tmp_path):
+    merged = merge_shard_records(build_shards(tmp_path, [{}]), ["Product_URL", "n"])
+    assert merged.empty
+    assert list(merged.columns) == ["Product_URL", "n"]
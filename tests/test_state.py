@@ -0,0 +1,24 @@
+"""증분 실행 수집 상태(워터마크)."""
+from crawler.state import CrawlState, product_code_from_url
+
+
+def test_product_code_from_url():
+    assert product_code_from_url("https://s/shop/products/123?x=1") == "123"
+    assert product_code_from_url("https://s/shop/products/123/") == "123"
+    assert product_code_from_url("N/A") is None
+
+
+def test_record_export_keeps_newest_first_and_persists(tmp_path):
+    path = tmp_path / "crawl_state.json"
+    state = CrawlState(path, max_codes=3)
+    state.record_export("shop", ["3", "2"], newest_code="3")
+    state.record_export("shop", ["5", "4", "3"], newest_code="5")
+    state.finish_run("shop")
+
+    reloaded = CrawlState(path)
+    entry = reloaded.shop("shop")
+    assert entry["exported_codes"] == ["5", "4", "3"]
+    assert entry["newest_code"] == "5"
+    assert entry["runs"] == 1
+    assert reloaded.known_codes("shop") == frozenset({"5", "4", "3"})
+    assert reloaded.known_codes("other") == frozenset()
@@ -0,0 +1,33 @@
+"""단계 타이밍 백분위/상품별 기록."""
+import json
+
+from crawler.timing import StageTimer, percentile
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([7], 95) == 7
+    assert percentile([4, 1, 3, 2], 50) == 2.5
+    assert percentile([1, 2, 3, 4, 5], 100) == 5
+    assert abs(percentile(range(1, 101), 95) - 95.05) < 1e-9
+
+
+def test_product_records_go_to_jsonl(tmp_path):
+    path = tmp_path / "timings.jsonl"
+    timer = StageTimer(path)
+    timer.begin_product("123")
+    timer.record("goto", 0.5)
+    timer.record("goto", 0.25)
+    timer.end_product()
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert record["product_code"] == "123"
+    assert record["stages"] == {"goto": 0.75}
+    assert timer.products_done == 1
+
+
+def test_disabled_timer_records_nothing(tmp_path):
+    timer = StageTimer(tmp_path / "timings.jsonl", enabled=False)
+    timer.begin_product("123")
+    timer.record("goto", 1.0)
+    assert timer.end_product() is None
+    assert not (tmp_path / "timings.jsonl").exists()
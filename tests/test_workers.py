@@ -0,0 +1,28 @@
+"""상세 워커 풀: 입력 순서 유지와 실패 항목 처리."""
+import contextlib
+import threading
+
+from crawler.workers import run_detail_workers
+
+
+def test_results_keep_input_order_across_threads():
+    opened = []
+
+    @contextlib.contextmanager
+    def open_worker():
+        opened.append(threading.current_thread().name)
+        yield "resource"
+
+    results = run_detail_workers(range(20), lambda resource, item: item * 2, open_worker, worker_count=4)
+    assert results == [item * 2 for item in range(20)]
+    assert len(opened) == 4
+
+
+def test_failed_items_become_none_and_inline_mode_uses_current():
+    def handle(resource, item):
+        if item == 1:
+            raise RuntimeError("boom")
+        return (resource, item)
+
+    results = run_detail_workers([0, 1, 2], handle, None, worker_count=1, current="main")
+    assert results == [("main", 0), None, ("main", 2)]